@@ -1,6 +1,9 @@
 /**
  * Quality Control Pipeline
  * Orchestrates validation and auto-fixing of campaigns
+ *
+ * With the Python extraction service running (`npm run extract:serve`), --autofix fills missing
+ * fields from confident rule-based extraction before falling back to AI (see services/autoFixer.ts).
  */
 
 import { createClient } from '@supabase/supabase-js';
@@ -97,6 +100,7 @@ async function runQualityPipeline(options: PipelineOptions = {}) {
         console.log('\nFix methods used:');
         Object.entries(byMethod).forEach(([method, count]) => {
             const icon = method === 'badge_reassign' ? '🏷️' :
+                method === 'rule_fill' ? '🧩' :
                 method === 'ai_reparse' ? '🤖' :
                     method === 'ai_correction' ? '✨' : '⏭️';
             console.log(`  ${icon} ${method}: ${count}`);
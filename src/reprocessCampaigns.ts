@@ -1,6 +1,11 @@
 /**
  * AI Re-Parser for Campaigns
  * Re-parses campaigns that have no AI data or missing critical fields
+ *
+ * When the Python extraction service is running (`npm run extract:serve`), rule-based fields are
+ * fetched for the whole batch up front: confident ones (`short`/`skip`) are passed to Gemini as
+ * metadata, and with --trust-extraction `skip` campaigns are updated without fetching or AI at all.
+ * Without the service the behaviour is unchanged.
  */
 
 import { supabase } from './utils/supabase';
@@ -8,10 +13,12 @@ import { parseWithGemini } from './services/geminiParser';
 import { assignBadge } from './services/badgeAssigner';
 import { lookupIDs } from './utils/idMapper';
 import { syncEarningAndDiscount } from './utils/dataFixer';
+import { generateSectorSlug } from './utils/slugify';
+import { extractForCampaigns } from './utils/extractionService';
 
 const sleep = (ms: number) => new Promise(resolve => setTimeout(resolve, ms));
 
-async function reprocessCampaigns(limit?: number) {
+async function reprocessCampaigns(limit?: number, trustExtraction = false) {
     console.log('\n🔄 AI Re-Parser for Campaigns\n');
     console.log('='.repeat(80));
 
@@ -43,24 +50,42 @@ async function reprocessCampaigns(limit?: number) {
 
     let success = 0;
     let failed = 0;
+    let ruleOnly = 0;
+
+    // One batched call for all campaigns; empty when the extraction service is not running
+    const rules = await extractForCampaigns(toProcess);
 
     for (const campaign of toProcess) {
         try {
             console.log(`\n🤖 Processing: ${campaign.title}`);
             console.log(`   URL: ${campaign.url}`);
 
-            // Fetch campaign HTML
-            const response = await fetch(campaign.url);
-            if (!response.ok) {
-                throw new Error(`HTTP ${response.status}`);
+            const rule = rules.get(String(campaign.id));
+            const skipAi = trustExtraction && rule?.extraction?.ai === 'skip';
+            let aiData: any;
+            if (skipAi) {
+                const fields = rule!.fields!;
+                console.log(`   ⚡ AI skipped (rule-based, confidence ${rule!.extraction!.confidence})`);
+                aiData = {
+                    ...fields,
+                    eligible_customers: fields.eligible_customers?.length ? fields.eligible_customers : [campaign.card_name],
+                    sector_slug: generateSectorSlug(fields.category)
+                };
+            } else {
+                // Fetch campaign HTML
+                const response = await fetch(campaign.url);
+                if (!response.ok) {
+                    throw new Error(`HTTP ${response.status}`);
+                }
+
+                const html = await response.text();
+
+                // Parse with AI (confident rule-based fields go along as metadata)
+                console.log('   🔍 Parsing with Gemini AI...');
+                const metadata = rule && rule.extraction?.ai !== 'full' ? { title: campaign.title, ...rule.fields } : undefined;
+                aiData = await parseWithGemini(html, campaign.url, campaign.bank, campaign.card_name, metadata);
             }
 
-            const html = await response.text();
-
-            // Parse with AI
-            console.log('   🔍 Parsing with Gemini AI...');
-            const aiData = await parseWithGemini(html, campaign.url, campaign.bank, campaign.card_name);
-
             // Assign badge based on AI data
             const badge = assignBadge(aiData);
 
@@ -79,7 +104,7 @@ async function reprocessCampaigns(limit?: number) {
                 ...ids,
                 badge_text: badge.text,
                 badge_color: badge.color,
-                ai_enhanced: true,
+                ai_enhanced: !skipAi,
                 publish_status: 'clean', // Set to clean after successful reprocess
                 publish_updated_at: new Date().toISOString()
             };
@@ -102,10 +127,11 @@ async function reprocessCampaigns(limit?: number) {
                 console.log(`      Badge: ${badge.text}`);
                 console.log(`      Valid Until: ${aiData.valid_until || 'N/A'}`);
                 success++;
+                if (skipAi) ruleOnly++;
             }
 
-            // Rate limiting
-            await sleep(3000); // 3 seconds between requests
+            // Rate limiting (only AI calls are limited)
+            if (!skipAi) await sleep(3000); // 3 seconds between requests
 
         } catch (error: any) {
             console.error(`   ❌ Error: ${error.message}`);
@@ -115,12 +141,13 @@ async function reprocessCampaigns(limit?: number) {
     }
 
     console.log('\n' + '='.repeat(80));
-    console.log(`\n📊 Results: ${success} success, ${failed} failed\n`);
+    console.log(`\n📊 Results: ${success} success (${ruleOnly} without AI), ${failed} failed\n`);
 }
 
 // Get limit from command line args
 const args = process.argv.slice(2);
 const testMode = args.includes('--test');
 const limit = testMode ? 3 : undefined;
+const trustExtraction = args.includes('--trust-extraction');
 
-reprocessCampaigns(limit).catch(console.error);
+reprocessCampaigns(limit, trustExtraction).catch(console.error);
@@ -0,0 +1,148 @@
+"""Scraper çıktılarından sürümlü benchmark korpusu üretir.
+
+Kaynak bir scraper çıktısı (JSON; detay HTML'i `raw_html` / `detail_html` alanından) veya kayıtlı
+detay sayfalarının dizinidir (`site_harness.py --snapshots` ile aynı `<banka>/<yol>.html` düzeni).
+Kayıtlı sayfada URL `<link rel="canonical">` / `og:url`'den, başlık `<h1>` / `og:title`'dan, koşul
+satırları indirgenmiş metinden (`common/reducer.py`) alınır; HTML belgede olduğu gibi saklanır.
+
+Kullanım:
+    python3 src/scrapers/benchmarks/build_corpus.py --version v2 \\
+        maximum=maximum_campaigns_full.json paraf=snapshots/paraf \\
+        halkbank=paraf_kampanyalar_raw.json vakifbank=vakifbank_kampanyalar_raw.json
+
+Her banka için `corpus/<sürüm>/<banka>.jsonl` ve dosya özetlerini içeren `MANIFEST.json` yazılır.
+Mevcut bir sürüm üzerine yazılmaz; korpus değişikliği her zaman yeni sürümdür.
+"""
+import os
+import sys
+import re
+import json
+import hashlib
+import argparse
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from common.frontier import canonicalize_url
+
+CORPUS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "corpus")
+DEFAULT_PER_BANK = 40
+# Kayıtlı sayfanın URL'si yoksa dizindeki yolu bu köke eklenir
+SITE_ROOTS = {"maximum": "https://www.maximum.com.tr", "paraf": "https://www.paraf.com.tr",
+              "halkbank": "https://www.paraf.com.tr", "vakifbank": "https://www.vakifkart.com.tr"}
+
+# Sayfadaki kampanya tarih aralığı (Maximum'un tarih alanı yoksa metinden alınır)
+DATE_RE = re.compile(
+    r'\d{1,2}(?:\s+[A-Za-zÇĞİÖŞÜçğıöşü]+(?:\s+\d{4})?)?\s*[-–]\s*\d{1,2}\s+[A-Za-zÇĞİÖŞÜçğıöşü]+\s+\d{4}'
+    r'|\d{1,2}\.\d{1,2}\.\d{4}\s*-\s*\d{1,2}\.\d{1,2}\.\d{4}')
+
+
+def _html_to_text(html):
+    from bs4 import BeautifulSoup
+    soup = BeautifulSoup(html, 'html.parser')
+    for tag in soup(["script", "style", "noscript"]): tag.decompose()
+    return soup.get_text("\n")
+
+
+def _clean(text):
+    return re.sub(r'\s+', ' ', text or "").strip()
+
+
+def page_item(path, html, bank):
+    """Kayıtlı detay sayfası -> scraper kaydı biçiminde sözlük."""
+    from bs4 import BeautifulSoup
+    from common.reducer import html_lines
+    soup = BeautifulSoup(html, 'html.parser')
+    canonical = soup.select_one("link[rel=canonical]") or soup.select_one("meta[property='og:url']")
+    url = canonical and (canonical.get("href") or canonical.get("content"))
+    title_el = soup.find("h1") or soup.select_one("meta[property='og:title']")
+    title = title_el.get("content") if title_el and title_el.name == "meta" else (title_el.get_text() if title_el else "")
+    lines = [line for line in html_lines(soup.body or soup) if len(line) > 15 and line != _clean(title)]
+    if not url and bank in SITE_ROOTS: url = f"{SITE_ROOTS[bank]}/{path.replace(os.sep, '/')}"
+    return {"url": url, "title": title, "conditions": lines, "detail_html": html}
+
+
+def load_items(path, bank):
+    """Scraper çıktısı (JSON listesi) veya kayıtlı sayfa dizini -> kayıtlar."""
+    if not os.path.isdir(path):
+        with open(path, 'r', encoding='utf-8') as f: return json.load(f)
+    items = []
+    for root, _, files in sorted(os.walk(path)):
+        for name in sorted(files):
+            if not name.endswith((".html", ".htm")): continue
+            with open(os.path.join(root, name), 'r', encoding='utf-8', errors='replace') as f:
+                items.append(page_item(os.path.relpath(os.path.join(root, name), path), f.read(), bank))
+    return items
+
+
+def to_doc(item, bank):
+    """Scraper kaydını korpus belgesine çevirir; işe yaramayan kayıtlar için None."""
+    url = item.get("url")
+    if not url: return None
+    html = item.get("detail_html") or item.get("raw_html") or ""
+    conditions = [c for c in item.get("conditions") or [] if c]
+    raw_text = _html_to_text(html) if html else "\n".join(conditions)
+    text = " ".join(conditions) if conditions else _clean(raw_text)
+    if len(text) < 40: return None
+    date_text = item.get("date_text")
+    if not date_text:
+        m = DATE_RE.search(text)
+        date_text = m.group(0) if m else None
+    canonical = canonicalize_url(url, bank if bank != "halkbank" else "paraf")
+    return {
+        "id": f"{bank}-{hashlib.sha1(canonical.encode('utf-8')).hexdigest()[:8]}",
+        "bank": bank, "url": canonical, "title": _clean(item.get("title")),
+        "date_text": date_text, "raw_text": raw_text, "text": text, "html": html,
+    }
+
+
+def sample(docs, per_bank):
+    """URL özetine göre sıralayıp ilk N'i alır; aynı girdi her zaman aynı örneği verir."""
+    unique = {d["id"]: d for d in docs}
+    return [unique[k] for k in sorted(unique)][:per_bank]
+
+
+def write_version(version, banks, sources, corpus_dir=CORPUS_DIR, provenance="scraper_output"):
+    out_dir = os.path.join(corpus_dir, version)
+    if os.path.exists(out_dir):
+        raise SystemExit(f"❌ {out_dir} zaten var; korpus sürümleri değiştirilmez, yeni sürüm adı verin.")
+    os.makedirs(out_dir)
+    manifest = {"version": version, "created_at": datetime.now().strftime("%Y-%m-%d"),
+                "provenance": provenance, "sources": sources, "files": {},
+                "html_docs": sum(1 for docs in banks.values() for d in docs if d["html"])}
+    for bank, docs in sorted(banks.items()):
+        path = os.path.join(out_dir, f"{bank}.jsonl")
+        payload = "".join(json.dumps(d, ensure_ascii=False, sort_keys=True) + "\n" for d in docs)
+        with open(path, 'w', encoding='utf-8') as f: f.write(payload)
+        manifest["files"][f"{bank}.jsonl"] = {
+            "docs": len(docs), "sha256": hashlib.sha256(payload.encode('utf-8')).hexdigest()}
+    with open(os.path.join(out_dir, "MANIFEST.json"), 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+    return out_dir, manifest
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark korpusu oluştur")
+    parser.add_argument("--version", required=True, help="Korpus sürümü (örn. v2)")
+    parser.add_argument("--per-bank", type=int, default=DEFAULT_PER_BANK)
+    parser.add_argument("sources", nargs="+", help="banka=çıktı_dosyası.json veya banka=kayıtlı_sayfa_dizini")
+    args = parser.parse_args(argv)
+
+    banks, sources, kinds = {}, {}, set()
+    for spec in args.sources:
+        bank, _, path = spec.partition("=")
+        if not path: parser.error(f"Geçersiz kaynak: {spec} (banka=dosya bekleniyor)")
+        items = load_items(path, bank)
+        kinds.add("captured_pages" if os.path.isdir(path) else "scraper_output")
+        docs = [d for d in (to_doc(item, bank) for item in items) if d]
+        banks[bank] = sample(banks.get(bank, []) + docs, args.per_bank)
+        sources[bank] = sources.get(bank, []) + [os.path.basename(os.path.normpath(path))]
+        with_html = sum(1 for d in banks[bank] if d["html"])
+        print(f"   📄 {bank}: {len(items)} kayıt -> {len(banks[bank])} belge ({with_html} HTML'li)")
+
+    out_dir, manifest = write_version(args.version, banks, sources, provenance="+".join(sorted(kinds)))
+    total = sum(f["docs"] for f in manifest["files"].values())
+    print(f"✅ Korpus {args.version}: {total} belge -> {out_dir}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,294 @@
+"""Çıkarım yardımcıları için çevrimdışı mikro benchmark.
+
+Sürümlü korpus (`corpus/<sürüm>/*.jsonl`) üzerinde her fonksiyonun throughput'unu (belge/sn, ısınma
+turlarından sonraki turların medyanı), p50/p99 gecikmesini ve belge başına bellek ayırımını (tepe ayırım)
+ölçer; `baselines/extractors.json` ile karşılaştırır (hız, turlarla dönüşümlü ölçülen referans iş yüküne
+oranlanır). HTML vakaları (ayrıştırma, indirgeme) yalnızca korpusta HTML'i olan belgelerle çalışır.
+Hız eşikten fazla düşerse veya herhangi bir belgenin çıktısı değişirse 1 ile çıkar.
+
+    python3 src/scrapers/benchmarks/extractors.py                 # karşılaştır
+    python3 src/scrapers/benchmarks/extractors.py --update-baseline
+"""
+import os
+import re
+import sys
+import gc
+import json
+import time
+import hashlib
+import platform
+import argparse
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from common import maximum as mx
+from common import paraf as pf
+from common.reducer import reduce_html
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+CORPUS_DIR = os.path.join(BENCH_DIR, "corpus")
+BASELINE_FILE = os.path.join(BENCH_DIR, "baselines", "extractors.json")
+DEFAULT_CORPUS = "v1"
+DEFAULT_REPEAT = 50
+DEFAULT_WARMUP = 5        # ölçülmeyen turlar: ilk çalıştırmadaki önbellek / regex derleme maliyeti
+MIN_PASS_NS = 2_000_000   # kısa vakalarda tur belgeleri tekrarlar; µs altı çağrılar zamanlayıcı gürültüsünde kaybolmaz
+DEFAULT_ROUNDS = 3        # tüm vakalar bu kadar kez sırayla ölçülür, vaka başına medyan tur alınır
+DEFAULT_THRESHOLD = 0.25  # %25'ten fazla yavaşlama regresyon sayılır
+REFERENCE_RE = re.compile(r'(\d[\d.]*)\s*tl')
+CALIBRATION_TEXT = "1-31 Aralık 2026 tarihleri arasında Maximum Kart ile yapılan 1.000 TL ve üzeri harcamaya 100 TL " * 8
+
+MAXIMUM_BANKS = ("maximum", "vakifbank")
+PARAF_BANKS = ("paraf", "halkbank")
+
+# --- VAKALAR ---
+# (ad, belge -> çıktı, hangi bankaların belgeleri). Girdiler scraper'ların geçtiği alanlarla aynıdır:
+# temizle_metin ham satırları, diğerleri temizlenmiş koşul metnini alır.
+# Tarih vakaları yalnızca kendi sitelerinin biçimleriyle çalışır; Paraf'ın yılsız/tek tarih
+# dalları datetime.now() döndürdüğünden başka biçimler çıktı kontrolünü tarihe bağımlı yapar.
+CASES = [
+    ("maximum.temizle_metin", lambda d: mx.temizle_metin(d["raw_text"]), None),
+    ("paraf.temizle_metin", lambda d: pf.temizle_metin(d["raw_text"]), None),
+    ("maximum.format_tarih_iso",
+     lambda d: (mx.format_tarih_iso(d["date_text"], False), mx.format_tarih_iso(d["date_text"], True)),
+     MAXIMUM_BANKS),
+    ("paraf.format_tarih_iso",
+     lambda d: (pf.format_tarih_iso(d["date_text"] or d["text"], False),
+                pf.format_tarih_iso(d["date_text"] or d["text"], True)),
+     PARAF_BANKS),
+    ("maximum.get_category", lambda d: mx.get_category(d["title"], d["text"]), None),
+    ("paraf.get_category", lambda d: pf.get_category(d["text"], d["title"]), None),
+    ("extract_merchant", lambda d: mx.extract_merchant(d["title"]), None),
+    ("extract_cards_precise", lambda d: mx.extract_cards_precise(d["text"]), None),
+    ("extract_cards", lambda d: pf.extract_cards(d["title"] + " " + d["text"]), None),
+    ("extract_financials_v8", lambda d: mx.extract_financials_v8(d["text"], d["title"]), None),
+    ("extract_financials_v25", lambda d: pf.extract_financials_v25(d["text"], d["title"]), None),
+    ("html.parse", lambda d: _parse_text(d["html"]), None),
+    ("reducer.reduce_html", lambda d: reduce_html(d["html"]), None),
+]
+# Detay HTML'i gereken vakalar; korpusta HTML'li belge yoksa ölçülmez
+HTML_CASES = {"html.parse", "reducer.reduce_html"}
+# list(set(...)) döndürenler: sıra PYTHONHASHSEED'e bağlı, çıktı kontrolünden önce sıralanır
+UNORDERED = {"extract_cards"}
+
+
+def _parse_text(html):
+    from bs4 import BeautifulSoup
+    return BeautifulSoup(html, 'html.parser').get_text(" ", strip=True)
+
+
+# --- KORPUS ---
+def load_corpus(version, corpus_dir=CORPUS_DIR):
+    """Manifest'teki özetleri doğrulayarak korpusu yükler."""
+    base = os.path.join(corpus_dir, version)
+    with open(os.path.join(base, "MANIFEST.json"), 'r', encoding='utf-8') as f:
+        manifest = json.load(f)
+    docs = []
+    for name, meta in sorted(manifest["files"].items()):
+        with open(os.path.join(base, name), 'rb') as f: payload = f.read()
+        if hashlib.sha256(payload).hexdigest() != meta["sha256"]:
+            raise SystemExit(f"❌ Korpus dosyası değişmiş: {version}/{name} (yeni sürüm oluşturun)")
+        docs.extend(json.loads(line) for line in payload.decode('utf-8').splitlines() if line.strip())
+    return docs, manifest
+
+
+def _digest(value):
+    return hashlib.sha256(json.dumps(value, ensure_ascii=False, sort_keys=True).encode('utf-8')).hexdigest()[:12]
+
+
+def _percentile(sorted_values, q):
+    if not sorted_values: return 0.0
+    idx = min(len(sorted_values) - 1, max(0, int(round(q * (len(sorted_values) - 1)))))
+    return sorted_values[idx]
+
+
+# --- ÖLÇÜM ---
+def reference_pass():
+    """Sabit referans iş yükü (dize + regex). Vaka turlarıyla dönüşümlü ölçülür: makine hızı dalgalandığında
+    (paylaşımlı çekirdek, frekans değişimi) vakayla birlikte yavaşlar; hız bu orana göre karşılaştırılır."""
+    for _ in range(20):
+        text = " ".join(CALIBRATION_TEXT.lower().split())
+        REFERENCE_RE.findall(text)
+
+
+def measure(fn, docs, repeat, unordered=False, warmup=DEFAULT_WARMUP):
+    """Gecikme, throughput, bellek ayırımı ve belge bazlı çıktı özetleri."""
+    # İlk ısınma turu aynı zamanda çıktı kontrolüdür
+    outputs = {d["id"]: _digest(sorted(fn(d)) if unordered else fn(d)) for d in docs}
+    for _ in range(warmup - 1):
+        reference_pass()
+        for d in docs: fn(d)
+    started = time.perf_counter_ns()
+    for d in docs: fn(d)
+    loops = max(1, -(-MIN_PASS_NS // max(1, time.perf_counter_ns() - started)))
+
+    samples, pass_times, ref_times = [], [], []
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            ref_start = time.perf_counter_ns()
+            reference_pass()
+            ref_times.append(time.perf_counter_ns() - ref_start)
+            pass_start = time.perf_counter_ns()
+            for _ in range(loops):
+                for d in docs:
+                    t0 = time.perf_counter_ns()
+                    fn(d)
+                    samples.append(time.perf_counter_ns() - t0)
+            pass_times.append((time.perf_counter_ns() - pass_start) / loops)
+    finally:
+        if gc_was_enabled: gc.enable()
+
+    tracemalloc.start()
+    try:
+        alloc_bytes = 0
+        for d in docs:
+            tracemalloc.reset_peak()
+            base, _ = tracemalloc.get_traced_memory()
+            fn(d)
+            _, peak = tracemalloc.get_traced_memory()
+            alloc_bytes += peak - base
+    finally:
+        tracemalloc.stop()
+
+    samples.sort()
+    # Medyan tur: tek bir şanslı / şanssız tur sonucu belirlemez; referans süresi de medyandır
+    median_pass = _percentile(sorted(pass_times), 0.50)
+    return {
+        "docs": len(docs),
+        "docs_per_s": round(len(docs) / (median_pass / 1e9), 1) if median_pass else 0.0,
+        "p50_us": round(_percentile(samples, 0.50) / 1e3, 2),
+        "p99_us": round(_percentile(samples, 0.99) / 1e3, 2),
+        "alloc_kib_per_doc": round(alloc_bytes / len(docs) / 1024, 2) if docs else 0.0,
+        "digest": _digest(outputs),
+        "outputs": outputs,
+        "ref_ns": _percentile(sorted(ref_times), 0.50),
+    }
+
+
+def machine_id():
+    return f"{platform.system()}-{platform.machine()}-{platform.python_implementation()}{platform.python_version()}"
+
+
+def median_round(rounds):
+    """Vakanın turları içinden referansa göre düzeltilmiş hızı medyan olan ölçüm."""
+    ranked = sorted(rounds, key=lambda r: r["docs_per_s"] * (r["ref_ns"] or 1))
+    return ranked[len(ranked) // 2]
+
+
+def run(version=DEFAULT_CORPUS, repeat=DEFAULT_REPEAT, only=None, warmup=DEFAULT_WARMUP, rounds=DEFAULT_ROUNDS):
+    docs, manifest = load_corpus(version)
+    cases, skipped = [], []
+    for name, fn, banks in CASES:
+        if only and not any(o in name for o in only): continue
+        subset = [d for d in docs if (banks is None or d["bank"] in banks) and (name not in HTML_CASES or d.get("html"))]
+        if subset: cases.append((name, fn, subset))
+        else: skipped.append(name)
+    # Turlar vakalar arasında dönüşümlüdür: kısa süreli bir yavaşlama yalnızca tek turu etkiler
+    # İlk tur atılır: süreç başındaki soğuk durum (CPU frekansı, önbellekler) ilk vakaları yavaş gösterir
+    measured = {name: [] for name, _, _ in cases}
+    for i in range(rounds + 1):
+        for name, fn, subset in cases:
+            result = measure(fn, subset, repeat, name in UNORDERED, warmup)
+            if i: measured[name].append(result)
+    results = {name: median_round(r) for name, r in measured.items()}
+    return {"corpus": version, "corpus_docs": len(docs), "provenance": manifest.get("provenance", "scraper_output"),
+            "machine": machine_id(), "cases": results, "skipped": skipped}
+
+
+# --- KARŞILAŞTIRMA ---
+def relative_speed(cur, base):
+    """Baseline'a göre hız oranı, referans iş yükünün süre oranıyla düzeltilmiş (1.0 = aynı)."""
+    if not base.get("docs_per_s"): return None
+    ratio = cur["docs_per_s"] / base["docs_per_s"]
+    if cur.get("ref_ns") and base.get("ref_ns"): ratio *= cur["ref_ns"] / base["ref_ns"]
+    return ratio
+
+
+def compare(report, baseline, threshold, check_speed=True):
+    """Regresyon mesajlarının listesi; boş liste = geçti."""
+    failures = []
+    if baseline.get("corpus") != report["corpus"]:
+        return [f"Baseline korpusu {baseline.get('corpus')} ama ölçülen {report['corpus']}; --update-baseline gerekli"]
+    for name, cur in report["cases"].items():
+        base = baseline["cases"].get(name)
+        if not base:
+            failures.append(f"{name}: baseline'da yok"); continue
+        if cur["digest"] != base["digest"]:
+            changed = sorted(k for k, v in cur["outputs"].items() if base["outputs"].get(k) != v)
+            failures.append(f"{name}: {len(changed)} belgenin çıktısı değişti ({', '.join(changed[:5])})")
+        ratio = relative_speed(cur, base)
+        if check_speed and ratio and ratio < 1 - threshold:
+            failures.append(f"{name}: %{100 * (1 - ratio):.0f} yavaşladı ({base['docs_per_s']} -> {cur['docs_per_s']} "
+                            f"belge/sn, makine hızına göre düzeltilmiş)")
+    return failures
+
+
+def format_table(report, baseline=None):
+    lines = [f"{'fonksiyon':<26} {'belge':>5} {'belge/sn':>11} {'Δ':>6} {'p50 µs':>8} {'p99 µs':>8} {'KiB/belge':>9}"]
+    for name, r in report["cases"].items():
+        base = (baseline or {}).get("cases", {}).get(name)
+        ratio = relative_speed(r, base) if base else None
+        delta = f"{100 * (ratio - 1):+.0f}%" if ratio else "-"
+        lines.append(f"{name:<26} {r['docs']:>5} {r['docs_per_s']:>11,.0f} {delta:>6} {r['p50_us']:>8} "
+                     f"{r['p99_us']:>8} {r['alloc_kib_per_doc']:>9}")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Çıkarım yardımcıları mikro benchmark")
+    parser.add_argument("--corpus", default=DEFAULT_CORPUS, help="Korpus sürümü")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT, help="Zamanlama turu sayısı")
+    parser.add_argument("--warmup", type=int, default=DEFAULT_WARMUP, help="Zamanlamadan önceki ısınma turu sayısı")
+    parser.add_argument("--rounds", type=int, default=DEFAULT_ROUNDS, help="Tüm vakaların tekrar ölçülme sayısı (medyan)")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="İzin verilen en fazla yavaşlama oranı (0.25 = %%25)")
+    parser.add_argument("--only", action="append", help="Ada göre vaka filtresi (tekrarlanabilir)")
+    parser.add_argument("--baseline", default=BASELINE_FILE)
+    parser.add_argument("--update-baseline", action="store_true", help="Ölçümü yeni baseline olarak kaydet")
+    parser.add_argument("--outputs-only", action="store_true",
+                        help="Yalnızca çıktı değişikliklerini kontrol et (farklı makinede CI için)")
+    parser.add_argument("--report", help="Ölçümü JSON olarak bu dosyaya da yaz")
+    args = parser.parse_args(argv)
+
+    report = run(args.corpus, args.repeat, args.only, max(1, args.warmup), max(1, args.rounds))
+    baseline = None
+    if os.path.exists(args.baseline):
+        with open(args.baseline, 'r', encoding='utf-8') as f: baseline = json.load(f)
+
+    print(f"📊 Korpus {report['corpus']} ({report['corpus_docs']} belge, {report['provenance']}), {args.warmup} ısınma + "
+          f"{args.repeat} tur, {args.rounds} ölçümün medyanı, {report['machine']}")
+    print(format_table(report, baseline))
+    if report["skipped"]:
+        print(f"   ⚠️ Korpusta HTML'li belge yok, ölçülmedi: {', '.join(report['skipped'])} "
+              f"(build_corpus.py ile kayıtlı sayfalardan yeni sürüm üretin)")
+    if args.report:
+        with open(args.report, 'w', encoding='utf-8') as f: json.dump(report, f, ensure_ascii=False, indent=2)
+
+    if args.update_baseline:
+        merged = dict(report)
+        if baseline and args.only and baseline.get("corpus") == report["corpus"]:
+            merged["cases"] = dict(baseline["cases"], **report["cases"])
+        os.makedirs(os.path.dirname(args.baseline), exist_ok=True)
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            json.dump(merged, f, ensure_ascii=False, indent=2, sort_keys=True)
+        print(f"💾 Baseline güncellendi: {args.baseline}")
+        return 0
+    if not baseline:
+        print("⚠️ Baseline yok; --update-baseline ile oluşturun.")
+        return 1
+
+    check_speed = not args.outputs_only
+    if check_speed and baseline.get("machine") != report["machine"]:
+        print(f"   ⚠️ Baseline farklı makinede ölçülmüş ({baseline.get('machine')}); hız yine de karşılaştırılıyor.")
+    failures = compare(report, baseline, args.threshold, check_speed)
+    if failures:
+        print("\n❌ Regresyon:")
+        for msg in failures: print(f"   - {msg}")
+        return 1
+    print("\n✅ Baseline ile uyumlu.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
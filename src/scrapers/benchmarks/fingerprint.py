@@ -0,0 +1,89 @@
+"""Yakın-kopya indeksinin (`common/fingerprint.py`) ölçek benchmark'ı.
+
+Korpus belgelerinden tutar/marka değiştirilmiş `--history` kadar farklı kampanya üretilip
+indekse eklenir; ardından bunların bir kısmının küçük değişiklikli kopyaları (slug değişikliği,
+ek cümle, noktalama) ve hiç görülmemiş kampanyalar aranır. Parmak izi ve arama süresi, kopya
+yakalama oranı (recall) ve yanlış eşleşme sayısı raporlanır; recall `--min-recall`'un altına
+düşer veya yanlış eşleşme olursa 1 ile çıkar.
+
+    python3 src/scrapers/benchmarks/fingerprint.py --history 20000 --queries 500
+"""
+import os
+import sys
+import re
+import time
+import random
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from common.fingerprint import FingerprintIndex, fingerprint
+from benchmarks.extractors import load_corpus, DEFAULT_CORPUS
+
+DEFAULT_HISTORY = 20000
+DEFAULT_QUERIES = 500
+MERCHANTS = ("Trendyol", "Hepsiburada", "Migros", "Boyner", "Teknosa", "Pegasus", "Shell", "Opet", "Getir", "Koton")
+
+
+def synthetic(docs, i):
+    """i. sentetik kampanya: korpus şablonu, tutarları/tarihleri ve markası değiştirilmiş."""
+    d = docs[i % len(docs)]
+    rng = random.Random(i)
+    merchant = f"{rng.choice(MERCHANTS)}{i}"
+    text = re.sub(r'\d+', lambda m: str(rng.randint(1, 99) * 50), d["text"])
+    title = re.sub(r'\d+', lambda m: str(rng.randint(1, 99) * 50), d["title"])
+    return (f"https://example.com/kampanya/{i}", f"{merchant}'da {title}",
+            f"{merchant} alışverişlerinde geçerlidir. {text} {merchant} iadelerinde kazanım geri alınır.")
+
+
+def perturb(text, rng):
+    """Aynı kampanyanın başka URL/sitedeki kopyası: noktalama, kart adı ve kısa ek."""
+    text = text.replace(".", ",").replace("Maximum", "Maximiles").replace("Paraf", "Parafly")
+    return text + rng.choice(("", " Detaylar için tıklayın.", " Kampanya sayfasını ziyaret edin."))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Yakın-kopya parmak izi indeksi benchmark'ı")
+    parser.add_argument("--corpus", default=DEFAULT_CORPUS, help="Korpus sürümü")
+    parser.add_argument("--history", type=int, default=DEFAULT_HISTORY, help="İndeksteki geçmiş kampanya sayısı")
+    parser.add_argument("--queries", type=int, default=DEFAULT_QUERIES, help="Kopya ve yeni kampanya sorgu sayısı")
+    parser.add_argument("--min-recall", type=float, default=0.95, help="Kopyaların en az bu oranı yakalanmalı")
+    args = parser.parse_args(argv)
+
+    docs, _ = load_corpus(args.corpus)
+    index = FingerprintIndex()
+    started = time.perf_counter()
+    for i in range(args.history):
+        url, title, text = synthetic(docs, i)
+        index.add({"key": url, "url": url, "bank": "bench", **fingerprint(title, text)})
+    build_s = time.perf_counter() - started
+
+    rng = random.Random(0)
+    found, false_hits, lookup_s = 0, 0, 0.0
+    for q in range(args.queries):
+        url, title, text = synthetic(docs, rng.randrange(args.history))
+        fp = fingerprint(title, perturb(text, rng))
+        started = time.perf_counter()
+        match = index.lookup(url + "-yeni", fp)
+        lookup_s += time.perf_counter() - started
+        if match and match[0]["url"] == url: found += 1
+
+        _, title, text = synthetic(docs, args.history + q)
+        started = time.perf_counter()
+        if index.lookup(None, fingerprint(title, text)): false_hits += 1
+        lookup_s += time.perf_counter() - started
+
+    recall = found / args.queries if args.queries else 1.0
+    print(f"🧬 {args.history:,} kampanyalık indeks, {args.queries} kopya + {args.queries} yeni sorgu")
+    print(f"   parmak izi + ekleme : {1000 * build_s / max(1, args.history):.2f} ms/kampanya ({build_s:.1f} sn)")
+    print(f"   arama               : {1000 * lookup_s / max(1, 2 * args.queries):.3f} ms/sorgu")
+    print(f"   kopya yakalama      : {found}/{args.queries} (%{100 * recall:.1f})")
+    print(f"   yanlış eşleşme      : {false_hits}/{args.queries}")
+    if recall < args.min_recall or false_hits:
+        print("\n❌ Yakın-kopya tespiti eşiğin altında.")
+        return 1
+    print("\n✅ Yakın-kopya tespiti eşiğin üstünde.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,73 @@
+"""Detay HTML -> indirgenmiş metin (`common/reducer.py`) boyut benchmark'ı.
+
+Korpustaki HTML'i olan her belge, banka başına ayrı bir çalışma gibi (ortak boilerplate
+takibiyle) indirgenir. Banka başına bayt ve tahmini token azalması raporlanır; indirgenmiş
+metin, çıkarıcıların kullandığı metindeki herhangi bir sayıyı (tutar, tarih, yüzde)
+kaybederse 1 ile çıkar.
+
+    python3 src/scrapers/benchmarks/reducer.py
+    python3 src/scrapers/benchmarks/reducer.py --corpus v1 --report reducer.json
+"""
+import os
+import sys
+import json
+import argparse
+from collections import Counter
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from common.reducer import reduce_html, count_reduction, format_reduction, Boilerplate
+from common.confidence import NUMBER_RE
+from benchmarks.extractors import load_corpus, DEFAULT_CORPUS
+
+
+class _Counters:
+    """RunMetrics.count ile aynı arayüz; benchmark dosya yazmaz."""
+
+    def __init__(self):
+        self.counters = Counter()
+
+    def count(self, name, n=1):
+        self.counters[name] += n
+
+
+def measure(docs):
+    """Banka -> {docs, sayaçlar, kaybolan sayılar}."""
+    results = {}
+    for bank in sorted({d["bank"] for d in docs}):
+        counters, boilerplate, lost = _Counters(), Boilerplate(), []
+        bank_docs = [d for d in docs if d["bank"] == bank and d.get("html")]
+        for d in bank_docs:
+            text = reduce_html(d["html"], boilerplate)
+            count_reduction(counters, d["html"], text)
+            missing = set(NUMBER_RE.findall(d["text"])) - set(NUMBER_RE.findall(text))
+            if missing: lost.append({"id": d["id"], "numbers": sorted(missing)})
+        results[bank] = {"docs": len(bank_docs), **counters.counters, "lost": lost}
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Detay HTML metin indirgeme benchmark'ı")
+    parser.add_argument("--corpus", default=DEFAULT_CORPUS, help="Korpus sürümü")
+    parser.add_argument("--report", help="Sonuçları JSON olarak bu dosyaya da yaz")
+    args = parser.parse_args(argv)
+
+    docs, _ = load_corpus(args.corpus)
+    results = measure(docs)
+    print(f"✂️ Detay HTML -> metin, korpus {args.corpus}")
+    for bank, r in results.items():
+        if not r["docs"]: print(f"   {bank:<10} HTML yok"); continue
+        print(f"   {bank:<10} {r['docs']:>3} belge  {format_reduction(r)}")
+    if args.report:
+        with open(args.report, "w", encoding="utf-8") as f: json.dump(results, f, ensure_ascii=False, indent=2)
+
+    lost = [(bank, item) for bank, r in results.items() for item in r["lost"]]
+    if lost:
+        print("\n❌ İndirgenmiş metinde kaybolan sayılar:")
+        for bank, item in lost: print(f"   - {bank}/{item['id']}: {', '.join(item['numbers'])}")
+        return 1
+    print("\n✅ Tüm tutar/tarih sayıları indirgenmiş metinde korunuyor.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,181 @@
+"""Scraper'ların uçtan uca throughput benchmark'ı (yerel test sunucusuna karşı).
+
+Her scraper değiştirilmeden alt süreç olarak `site_harness` sunucusuna yönlendirilir;
+her çalışma için sayfa/dk, CPU süresi ve süreç ağacının (Python + chromedriver + Chrome)
+tepe RSS'i raporlanır. `--workers` destekleyen scraper'lar her eşzamanlılık ayarıyla, `--backend`
+destekleyenler `--backends` listesindeki her detay arka ucuyla ayrı çalışır; bellek verimi
+karşılaştırması için GB RSS başına sayfa/dk da raporlanır.
+
+    python3 src/scrapers/benchmarks/scrape_throughput.py --scrapers paraf,vakifbank \\
+        --concurrency 1,2,4 --campaigns 48 --latency-ms 200 --jitter-ms 100
+    python3 src/scrapers/benchmarks/scrape_throughput.py --scrapers paraf \\
+        --backends selenium,playwright --concurrency 1,4,8,16 --campaigns 96
+"""
+import os
+import sys
+import json
+import time
+import argparse
+import tempfile
+import threading
+import subprocess
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from site_harness import add_harness_arguments, harness_from_args
+from common.metrics import children_map, proc_usage
+
+SCRAPERS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SAMPLE_INTERVAL = 0.25
+
+# site: harness'taki site; workers / backend: eşzamanlılık ve arka uç bayrağı (yoksa tek ayarda çalışır)
+SCRAPERS = {
+    "maximum": {"script": "isbankasi/maximum.py", "args": ["--outputs", "raw"], "site": "maximum",
+                "limit": "--limit", "workers": None, "backend": None, "output": "maximum_kampanyalar_raw.json"},
+    "paraf": {"script": "paraf.py", "args": [], "site": "paraf",
+              "limit": None, "workers": "--workers", "backend": "--backend", "output": "paraf_restored_v25.json"},
+    "halkbank": {"script": "halkbank/paraf.py", "args": [], "site": "paraf",
+                 "limit": "--limit", "workers": None, "backend": None, "output": "paraf_kampanyalar_raw.json"},
+    "vakifbank": {"script": "vakifbank/vakifbank.py", "args": [], "site": "vakifbank",
+                  "limit": "--limit", "workers": None, "backend": None, "output": "vakifbank_kampanyalar_raw.json"},
+}
+
+
+class TreeSampler(threading.Thread):
+    """Kök süreç ve tüm alt süreçlerinin RSS toplamını ve CPU süresini örnekler."""
+
+    def __init__(self, pid, interval=SAMPLE_INTERVAL):
+        super().__init__(name="tree-sampler", daemon=True)
+        self.pid, self.interval = pid, interval
+        self.peak_rss = 0
+        self.cpu = {}  # pid -> son görülen CPU sn; biten Chrome süreçleri de toplamda kalır
+        self._halt = threading.Event()
+
+    def sample(self):
+        children = children_map()
+        stack, rss = [self.pid], 0
+        while stack:
+            pid = stack.pop()
+            usage = proc_usage(pid)
+            if usage:
+                rss += usage[0]
+                self.cpu[pid] = max(self.cpu.get(pid, 0.0), usage[1])
+            stack.extend(children.get(pid, []))
+        self.peak_rss = max(self.peak_rss, rss)
+
+    def run(self):
+        while not self._halt.is_set():
+            self.sample()
+            self._halt.wait(self.interval)
+
+    def stop(self):
+        self._halt.set()
+        self.join()
+
+    @property
+    def cpu_seconds(self):
+        return sum(self.cpu.values())
+
+
+# --- ÇALIŞTIRMA ---
+def run_once(name, spec, harness, workers=None, limit=None, timeout=1800, keep_logs=None, backend=None):
+    harness.reset()
+    workdir = tempfile.mkdtemp(prefix=f"bench-{name}-")
+    cmd = [sys.executable, "-u", os.path.join(SCRAPERS_DIR, spec["script"]), *spec["args"]]
+    if limit and spec["limit"]: cmd += [spec["limit"], str(limit)]
+    if workers and spec["workers"]: cmd += [spec["workers"], str(workers)]
+    if backend and spec["backend"]: cmd += [spec["backend"], backend]
+    env = dict(os.environ, **harness.env())
+    log_path = os.path.join(keep_logs or workdir, f"{name}-{backend or 'default'}-w{workers or 1}.log")
+
+    started = time.monotonic()
+    with open(log_path, "w", encoding="utf-8") as log:
+        proc = subprocess.Popen(cmd, cwd=workdir, env=env, stdout=log, stderr=subprocess.STDOUT)
+        sampler = TreeSampler(proc.pid)
+        sampler.start()
+        try:
+            code = proc.wait(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            proc.kill(); code = proc.wait()
+        finally:
+            sampler.stop()
+    wall = time.monotonic() - started
+
+    records = 0
+    out_path = os.path.join(workdir, spec["output"])
+    if os.path.exists(out_path):
+        try:
+            with open(out_path, "r", encoding="utf-8") as f: records = len(json.load(f))
+        except ValueError:
+            pass
+    site = harness.snapshot()[spec["site"]]
+    pages_per_min = site["page"] / (wall / 60) if wall else 0.0
+    return {
+        "scraper": name, "backend": backend or "-", "workers": workers or 1, "exit_code": code, "wall_s": round(wall, 1),
+        "pages": site["page"], "fragments": site["fragment"], "injected_errors": site["error"],
+        "injected_challenges": site["challenge"],
+        "pages_per_min": round(pages_per_min, 1),
+        "pages_per_min_per_gb": round(pages_per_min / (sampler.peak_rss / 2 ** 30), 1) if sampler.peak_rss else 0.0,
+        "cpu_s": round(sampler.cpu_seconds, 1),
+        "cpu_pct": round(100 * sampler.cpu_seconds / wall, 1) if wall else 0.0,
+        "peak_rss_mib": round(sampler.peak_rss / 2 ** 20, 1),
+        "records": records, "log": log_path,
+    }
+
+
+def format_table(results):
+    lines = [f"{'scraper':<10} {'arka uç':<10} {'işçi':>4} {'sayfa':>6} {'süre sn':>8} {'sayfa/dk':>9} {'/dk/GB':>7} "
+             f"{'CPU sn':>7} {'CPU %':>6} {'RSS MiB':>8} {'kayıt':>6} {'hata':>5} {'çıkış':>5}"]
+    for r in results:
+        lines.append(f"{r['scraper']:<10} {r['backend']:<10} {r['workers']:>4} {r['pages']:>6} {r['wall_s']:>8} "
+                     f"{r['pages_per_min']:>9} {r['pages_per_min_per_gb']:>7} "
+                     f"{r['cpu_s']:>7} {r['cpu_pct']:>6} {r['peak_rss_mib']:>8} {r['records']:>6} "
+                     f"{r['injected_errors']:>5} {r['exit_code']:>5}")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Scraper uçtan uca throughput benchmark'ı")
+    parser.add_argument("--scrapers", default=",".join(SCRAPERS), help=f"Virgülle ({', '.join(SCRAPERS)})")
+    parser.add_argument("--concurrency", default="1,2,4", help="İşçi sayıları (yalnızca --workers destekleyenler)")
+    parser.add_argument("--backends", default="selenium",
+                        help="Detay arka uçları, virgülle (selenium, playwright; yalnızca --backend destekleyenler)")
+    parser.add_argument("--limit", type=int, default=None, help="Destekleyen scraper'lara geçilecek kampanya limiti")
+    parser.add_argument("--timeout", type=int, default=1800, help="Çalışma başına en fazla süre (sn)")
+    parser.add_argument("--logs", default=None, help="Scraper loglarının yazılacağı dizin")
+    parser.add_argument("--report", help="Sonuçları JSON olarak bu dosyaya da yaz")
+    add_harness_arguments(parser)
+    args = parser.parse_args(argv)
+
+    names = [n.strip() for n in args.scrapers.split(",") if n.strip()]
+    unknown = [n for n in names if n not in SCRAPERS]
+    if unknown: parser.error(f"Bilinmeyen scraper: {', '.join(unknown)}")
+    levels = [int(x) for x in args.concurrency.split(",") if x.strip()]
+    backends = [b.strip() for b in args.backends.split(",") if b.strip()]
+    if args.logs: os.makedirs(args.logs, exist_ok=True)
+
+    harness = harness_from_args(args).start()
+    print(f"🧪 Test sunucusu: {', '.join(harness.urls.values())} ({args.campaigns} kampanya/site, "
+          f"gecikme {args.latency_ms}±{args.jitter_ms} ms, hata oranı {args.error_rate})")
+    results = []
+    try:
+        for name in names:
+            spec = SCRAPERS[name]
+            for backend in (backends if spec["backend"] else [None]):
+                for workers in (levels if spec["workers"] else [None]):
+                    print(f"   ▶️ {name} (arka uç: {backend or '-'}, işçi: {workers or 1})...")
+                    r = run_once(name, spec, harness, workers, args.limit, args.timeout, args.logs, backend)
+                    print(f"      {r['pages']} sayfa, {r['wall_s']} sn, {r['pages_per_min']} sayfa/dk, "
+                          f"RSS {r['peak_rss_mib']} MiB, {r['pages_per_min_per_gb']} sayfa/dk/GB (çıkış {r['exit_code']})")
+                    results.append(r)
+    finally:
+        harness.stop()
+
+    print("\n" + format_table(results))
+    if args.report:
+        with open(args.report, "w", encoding="utf-8") as f: json.dump(results, f, ensure_ascii=False, indent=2)
+    return 0 if all(r["exit_code"] == 0 for r in results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,353 @@
+"""maximum.com.tr, paraf.com.tr ve vakifkart.com.tr için yerel HTTP test sunucusu.
+
+Her site ayrı bir portta, gerçek sitenin scraper'ların beklediği yapısıyla sunulur:
+Maximum'da "Daha Fazla" butonu, Paraf'ta "Daha Fazla Göster" ile yüklenen liste ve
+Vakıfkart'ta `/kampanyalar/sayfa/{n}` sayfalaması. Kampanya içerikleri benchmark korpusundan
+üretilir; `--snapshots` dizinindeki kayıtlı sayfalar (örn. `snapshots/paraf/tr/kampanyalar.html`)
+varsa üretilen sayfanın yerine olduğu gibi sunulur.
+
+    python3 src/scrapers/benchmarks/site_harness.py --campaigns 120 --latency-ms 150 --jitter-ms 100
+    # Çıktıdaki SCRAPER_*_BASE_URL değişkenleriyle scraper'lar değiştirilmeden sunucuya yönlenir.
+"""
+import os
+import sys
+import json
+import time
+import re
+import random
+import argparse
+import threading
+from datetime import datetime
+from html import escape
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlsplit, parse_qs
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from extractors import load_corpus, DEFAULT_CORPUS
+
+DEFAULT_PORT = 8700
+DEFAULT_CAMPAIGNS = 60
+PAGE_SIZE = 12  # liste sayfası / "Daha Fazla" başına kampanya
+# 1x1 şeffaf PNG; görsel istekleri sayfa sayılmaz
+PIXEL = bytes.fromhex("89504e470d0a1a0a0000000d4948445200000001000000010806000000"
+                      "1f15c4890000000d49444154789c6360000002000154a24f5d0000000049454e44ae426082")
+
+# --- SİTELER ---
+# bank: scraper'ların site_urls() anahtarı; families: korpusun hangi banka belgeleri kullanılır
+SITES = {
+    "maximum": {"offset": 0, "families": ("maximum",)},
+    "paraf": {"offset": 1, "families": ("paraf", "halkbank")},
+    "vakifbank": {"offset": 2, "families": ("vakifbank",)},
+}
+
+
+def _slug(url):
+    last = url.rstrip("/").rsplit("/", 1)[-1]
+    return last[:-5] if last.endswith(".html") else last
+
+
+def build_campaigns(docs, families, count, year_shift=0):
+    """Korpus belgelerini çoğaltarak benzersiz URL'li `count` kampanya üretir."""
+    # Tarihler korpusun oluşturulduğu yıldan bugüne kaydırılır; yoksa liste filtreleri zamanla her şeyi eler
+    shift = (lambda t: re.sub(r'\b20\d\d\b', lambda m: str(int(m.group(0)) + year_shift), t)) if year_shift else (lambda t: t)
+    pool = [d for d in docs if d["bank"] in families]
+    campaigns = []
+    for i in range(count if pool else 0):
+        d = pool[i % len(pool)]
+        lines = [shift(l.strip()) for l in d["raw_text"].split("\n") if len(l.strip()) > 15]
+        campaigns.append({"slug": f"{_slug(d['url'])}-{i + 1}", "title": d["title"],
+                          "date_text": shift(d.get("date_text") or ""), "lines": lines or [shift(d["text"])]})
+    return campaigns
+
+
+def _page(title, body, script=""):
+    return (f'<!DOCTYPE html><html lang="tr"><head><meta charset="utf-8"><title>{escape(title)}</title>'
+            f'<meta property="og:image" content="/images/og.png"></head><body>{body}'
+            f'{f"<script>{script}</script>" if script else ""}</body></html>')
+
+
+# Butona basıldıkça bir sonraki parçayı ekler; son parçada buton kaldırılır
+LOAD_MORE_JS = """
+let next = 2;
+function loadMore(ev) {
+  if (ev) ev.preventDefault();
+  fetch('%(endpoint)s?page=' + next).then(r => r.json()).then(data => {
+    document.getElementById('list').insertAdjacentHTML('beforeend', data.html);
+    next += 1;
+    if (data.last) document.getElementById('%(button)s').remove();
+  });
+}
+"""
+
+
+class MaximumSite:
+    """maximum.com.tr: tek liste sayfası + 'Daha Fazla' butonu, kart kapsayıcılarında tarih."""
+    list_path = "/kampanyalar"
+
+    def __init__(self, campaigns): self.campaigns = campaigns; self.by_slug = {c["slug"]: c for c in campaigns}
+
+    def _cards(self, chunk):
+        return "".join(
+            f'<div class="campaign-card"><a href="/kampanyalar/{c["slug"]}"><img src="/images/{c["slug"]}.png" alt="">'
+            f'</a><h3 class="card-title">{escape(c["title"])}</h3><span class="card-date">{escape(c["date_text"])}</span></div>'
+            for c in chunk)
+
+    def route(self, path, query):
+        if path == self.list_path:
+            last = len(self.campaigns) <= PAGE_SIZE
+            button = "" if last else '<button id="more" onclick="loadMore()">Daha Fazla</button>'
+            body = f'<div id="list" class="campaign-list">{self._cards(self.campaigns[:PAGE_SIZE])}</div>{button}'
+            return "page", _page("Kampanyalar", body, LOAD_MORE_JS % {"endpoint": "/api/kampanyalar", "button": "more"})
+        if path == "/api/kampanyalar":
+            return "fragment", _fragment(self.campaigns, query, self._cards)
+        if path.startswith("/kampanyalar/"):
+            c = self.by_slug.get(path[len("/kampanyalar/"):])
+            if not c: return None
+            desc = "".join(f"<p>{escape(l)}</p>" for l in c["lines"])
+            body = (f'<h1 class="gradient-title-text">{escape(c["title"])}</h1>'
+                    f'<span id="ctl00_ContentPlaceHolder1_KampanyaTarihleri">{escape(c["date_text"])}</span>'
+                    f'<img id="ctl00_ContentPlaceHolder1_CampaignImage" src="/images/{c["slug"]}.png">'
+                    f'<span id="ctl00_ContentPlaceHolder1_CampaignDescription">{desc}</span>')
+            return "page", _page(c["title"], body)
+        return None
+
+
+class ParafSite:
+    """paraf.com.tr: AEM teaser listesi + 'Daha Fazla Göster', master-banner detay sayfası."""
+    list_path = "/tr/kampanyalar.html"
+
+    def __init__(self, campaigns): self.campaigns = campaigns; self.by_slug = {c["slug"]: c for c in campaigns}
+
+    def _cards(self, chunk):
+        return "".join(
+            f'<li class="cmp-list__item"><div class="cmp-teaser"><div class="cmp-teaser__title">'
+            f'<a href="/tr/kampanyalar/kampanya/{c["slug"]}.html">{escape(c["title"])}</a></div></div></li>'
+            for c in chunk)
+
+    def route(self, path, query):
+        if path == self.list_path:
+            last = len(self.campaigns) <= PAGE_SIZE
+            button = "" if last else ('<div id="more" class="button--more-campaign">'
+                                      '<a href="#" onclick="loadMore(event)">Daha Fazla Göster</a></div>')
+            body = f'<div class="cmp-list--campaigns"><ul id="list">{self._cards(self.campaigns[:PAGE_SIZE])}</ul></div>{button}'
+            return "page", _page("Kampanyalar", body, LOAD_MORE_JS % {"endpoint": "/api/kampanyalar", "button": "more"})
+        if path == "/api/kampanyalar":
+            return "fragment", _fragment(self.campaigns, query, self._cards)
+        if path.startswith("/tr/kampanyalar/kampanya/") and path.endswith(".html"):
+            c = self.by_slug.get(_slug(path))
+            if not c: return None
+            items = "".join(f"<li>{escape(l)}</li>" for l in c["lines"])
+            body = (f'<div class="master-banner"><div class="master-banner__image" '
+                    f'style="background-image: url(\'/content/dam/parafcard/kampanyalar/{c["slug"]}.png\')"></div>'
+                    f'<div class="master-banner__content"><h1>{escape(c["title"])}</h1></div></div>'
+                    f'<div class="text--use-ulol"><div class="cmp-text"><ul>{items}</ul></div></div>')
+            return "page", _page(c["title"], body)
+        return None
+
+
+class VakifkartSite:
+    """vakifkart.com.tr: sunucu taraflı `/kampanyalar/sayfa/{n}` sayfalaması."""
+    list_path = "/kampanyalar"
+
+    def __init__(self, campaigns): self.campaigns = campaigns; self.by_slug = {c["slug"]: c for c in campaigns}
+
+    def _list_page(self, n):
+        chunk = self.campaigns[(n - 1) * PAGE_SIZE:n * PAGE_SIZE]
+        items = "".join(f'<a class="item" href="/kampanyalar/{c["slug"]}"><span>{escape(c["title"])}</span></a>'
+                        for c in chunk)
+        return _page("Kampanyalar", f'<div class="mainKampanyalarDesktop"><div class="list">{items}</div></div>')
+
+    def route(self, path, query):
+        if path == self.list_path: return "page", self._list_page(1)
+        if path.startswith("/kampanyalar/sayfa/"):
+            n = path.rsplit("/", 1)[-1]
+            return ("page", self._list_page(int(n))) if n.isdigit() and int(n) > 0 else None
+        if path.startswith("/kampanyalar/"):
+            c = self.by_slug.get(path[len("/kampanyalar/"):])
+            if not c: return None
+            content = f"<p>{escape(c['lines'][0])}</p><ul>" + "".join(f"<li>{escape(l)}</li>" for l in c["lines"][1:]) + "</ul>"
+            body = (f'<div class="kampanyaDetay"><div class="title"><h1>{escape(c["title"])}</h1></div>'
+                    f'<div class="coverSide"><img src="/images/{c["slug"]}.png"></div>'
+                    f'<div class="contentSide">{content}</div></div>')
+            return "page", _page(c["title"], body)
+        return None
+
+
+SITE_CLASSES = {"maximum": MaximumSite, "paraf": ParafSite, "vakifbank": VakifkartSite}
+
+
+def _fragment(campaigns, query, render):
+    page = int((query.get("page") or ["2"])[0])
+    chunk = campaigns[(page - 1) * PAGE_SIZE:page * PAGE_SIZE]
+    return json.dumps({"html": render(chunk), "last": page * PAGE_SIZE >= len(campaigns)})
+
+
+# --- SUNUCU ---
+class SiteStats:
+    """Site başına sunulan sayfa/parça/görsel ve enjekte edilen hata sayıları."""
+    KEYS = ("page", "fragment", "asset", "error", "challenge", "not_found", "bytes")
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock: self.counts = {k: 0 for k in self.KEYS}
+
+    def add(self, key, size=0):
+        with self._lock:
+            self.counts[key] += 1
+            self.counts["bytes"] += size
+
+    def snapshot(self):
+        with self._lock: return dict(self.counts)
+
+
+# Cloudflare "Just a moment..." ara sayfasının küçültülmüş hâli
+CHALLENGE_PAGE = ('<!DOCTYPE html><html><head><title>Just a moment...</title></head><body>'
+                  '<div id="challenge-running">Checking your browser before accessing the site.</div>'
+                  '<script src="/cdn-cgi/challenge-platform/h/g/orchestrate/jsch/v1"></script></body></html>')
+
+
+def make_handler(bank, site, stats, faults, snapshots):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def log_message(self, *args): pass
+
+        def _send(self, status, body, content_type):
+            data = body if isinstance(body, bytes) else body.encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+            return len(data)
+
+        def do_GET(self):
+            parts = urlsplit(self.path)
+            path = parts.path.rstrip("/") or "/"
+            if path == "/__stats": return self._send(200, json.dumps(stats.snapshot()), "application/json")
+            if path.startswith(("/images/", "/content/")) or path.endswith((".png", ".jpg", ".ico")):
+                stats.add("asset", self._send(200, PIXEL, "image/png")); return
+
+            faults.delay()
+            if faults.should_fail():
+                stats.add("error", self._send(503, "<html><body><h1>503 Service Unavailable</h1></body></html>", "text/html"))
+                return
+            if faults.should_challenge():
+                stats.add("challenge", self._send(403, CHALLENGE_PAGE, "text/html; charset=utf-8"))
+                return
+            snap = os.path.join(snapshots, bank, path.lstrip("/")) if snapshots else None
+            if snap and os.path.isfile(snap):
+                with open(snap, "rb") as f: stats.add("page", self._send(200, f.read(), "text/html; charset=utf-8"))
+                return
+            routed = site.route(path, parse_qs(parts.query))
+            if routed is None:
+                stats.add("not_found", self._send(404, "<html><body><h1>Sayfa bulunamadı</h1></body></html>", "text/html"))
+                return
+            kind, body = routed
+            ctype = "application/json" if kind == "fragment" else "text/html; charset=utf-8"
+            stats.add(kind, self._send(200, body, ctype))
+
+    return Handler
+
+
+class Faults:
+    """Gecikme, jitter ve hata enjeksiyonu; aynı tohumla tekrarlanabilir."""
+
+    def __init__(self, latency_ms=0, jitter_ms=0, error_rate=0.0, seed=None, challenge_rate=0.0):
+        self.latency_ms, self.jitter_ms, self.error_rate = latency_ms, jitter_ms, error_rate
+        self.challenge_rate = challenge_rate
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def delay(self):
+        if not (self.latency_ms or self.jitter_ms): return
+        with self._lock: jitter = self._rng.uniform(-self.jitter_ms, self.jitter_ms)
+        time.sleep(max(0.0, self.latency_ms + jitter) / 1000)
+
+    def should_fail(self):
+        if self.error_rate <= 0: return False
+        with self._lock: return self._rng.random() < self.error_rate
+
+    def should_challenge(self):
+        if self.challenge_rate <= 0: return False
+        with self._lock: return self._rng.random() < self.challenge_rate
+
+
+class Harness:
+    """Üç siteyi ardışık portlarda arka plan thread'lerinde çalıştırır."""
+
+    def __init__(self, campaigns=DEFAULT_CAMPAIGNS, port=DEFAULT_PORT, host="127.0.0.1", corpus=DEFAULT_CORPUS,
+                 latency_ms=0, jitter_ms=0, error_rate=0.0, seed=None, snapshots=None, challenge_rate=0.0):
+        docs, manifest = load_corpus(corpus)
+        year_shift = datetime.now().year - int(manifest["created_at"][:4])
+        self.faults = Faults(latency_ms, jitter_ms, error_rate, seed, challenge_rate)
+        self.stats, self.urls, self._servers = {}, {}, []
+        for bank, spec in SITES.items():
+            site = SITE_CLASSES[bank](build_campaigns(docs, spec["families"], campaigns, year_shift))
+            self.stats[bank] = SiteStats()
+            handler = make_handler(bank, site, self.stats[bank], self.faults, snapshots)
+            server = ThreadingHTTPServer((host, port + spec["offset"]), handler)
+            server.daemon_threads = True
+            self._servers.append(server)
+            self.urls[bank] = f"http://{host}:{server.server_address[1]}"
+
+    def start(self):
+        for server in self._servers:
+            threading.Thread(target=server.serve_forever, name="site-harness", daemon=True).start()
+        return self
+
+    def env(self):
+        """Scraper süreçlerine verilecek SCRAPER_<BANKA>_BASE_URL değişkenleri."""
+        return {f"SCRAPER_{bank.upper()}_BASE_URL": url for bank, url in self.urls.items()}
+
+    def snapshot(self):
+        return {bank: s.snapshot() for bank, s in self.stats.items()}
+
+    def reset(self):
+        for s in self.stats.values(): s.reset()
+
+    def stop(self):
+        for server in self._servers:
+            server.shutdown()
+            server.server_close()
+
+
+def add_harness_arguments(parser):
+    parser.add_argument("--campaigns", type=int, default=DEFAULT_CAMPAIGNS, help="Site başına kampanya sayısı")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help="İlk port (maximum); paraf +1, vakifkart +2")
+    parser.add_argument("--latency-ms", type=float, default=0, help="Sayfa başına sabit gecikme")
+    parser.add_argument("--jitter-ms", type=float, default=0, help="Gecikmeye eklenen ± rastgele sapma")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="503 dönecek sayfa oranı (0-1)")
+    parser.add_argument("--challenge-rate", type=float, default=0.0,
+                        help="Bot doğrulama (Cloudflare benzeri, 403) sayfası dönecek sayfa oranı (0-1)")
+    parser.add_argument("--seed", type=int, default=None, help="Jitter/hata enjeksiyonu tohumu")
+    parser.add_argument("--snapshots", default=None, help="Kayıtlı sayfa dizini (<banka>/<yol>)")
+    parser.add_argument("--corpus", default=DEFAULT_CORPUS, help="Kampanya içeriği için korpus sürümü")
+    return parser
+
+
+def harness_from_args(args):
+    return Harness(campaigns=args.campaigns, port=args.port, corpus=args.corpus, latency_ms=args.latency_ms,
+                   jitter_ms=args.jitter_ms, error_rate=args.error_rate, seed=args.seed, snapshots=args.snapshots,
+                   challenge_rate=args.challenge_rate)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Banka siteleri için yerel test sunucusu")
+    add_harness_arguments(parser)
+    args = parser.parse_args(argv)
+    harness = harness_from_args(args).start()
+    print(f"🧪 Test sunucusu hazır ({args.campaigns} kampanya/site). Scraper'ları yönlendirmek için:")
+    for key, value in harness.env().items(): print(f"   export {key}={value}")
+    try:
+        while True: time.sleep(3600)
+    except KeyboardInterrupt:
+        print(f"\n📊 {json.dumps(harness.snapshot(), ensure_ascii=False)}")
+        harness.stop()
+
+
+if __name__ == "__main__":
+    main()
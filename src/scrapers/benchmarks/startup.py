@@ -0,0 +1,107 @@
+"""Scraper giriş noktalarının başlangıç (import) maliyeti benchmark'ı.
+
+Her script `python -X importtime <script> --help` ile birkaç kez çalıştırılır. Medyan duvar
+süresi, toplam import süresi, en pahalı üst düzey import'lar ve tarayıcı yığınının
+(`selenium`, `undetected_chromedriver`, `webdriver_manager`, `setuptools`) yüklenip
+yüklenmediği raporlanır. `--help` tarayıcı yığınını yüklerse veya `--max-import-ms` aşılırsa 1 ile çıkar.
+
+    python3 src/scrapers/benchmarks/startup.py
+    python3 src/scrapers/benchmarks/startup.py --scrapers paraf,vakifbank --repeat 10 --top 5
+"""
+import os
+import sys
+import json
+import time
+import argparse
+import subprocess
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from common.cli import SCRAPERS, SCRAPERS_DIR
+
+BROWSER_MODULES = ("selenium", "undetected_chromedriver", "webdriver_manager", "setuptools")
+DEFAULT_REPEAT = 5
+DEFAULT_TOP = 8
+
+
+def parse_importtime(stderr):
+    """`-X importtime` çıktısı -> [(modül, self_us, cumulative_us, üst_düzey_mi)]."""
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line: continue
+        fields = line.split(":", 1)[1].split("|")
+        if len(fields) != 3: continue
+        self_us, cum_us, name = fields
+        # İç içe import'lar ad sütununda ek boşlukla girintilenir
+        rows.append((name.strip(), int(self_us), int(cum_us), not name[1:].startswith(" ")))
+    return rows
+
+
+def measure(script, repeat):
+    cmd = [sys.executable, "-X", "importtime", os.path.join(SCRAPERS_DIR, script), "--help"]
+    walls, rows, code = [], [], 0
+    for _ in range(repeat):
+        started = time.perf_counter()
+        proc = subprocess.run(cmd, capture_output=True, text=True, cwd=SCRAPERS_DIR)
+        walls.append(time.perf_counter() - started)
+        code = code or proc.returncode
+        rows = parse_importtime(proc.stderr)  # son (sıcak önbellekli) çalışma
+    walls.sort()
+    modules = {name for name, _, _, _ in rows}
+    return {
+        "script": script,
+        "exit_code": code,
+        "wall_ms": round(walls[len(walls) // 2] * 1000, 1),
+        "import_ms": round(sum(r[1] for r in rows) / 1000, 1),
+        "modules": len(modules),
+        "browser_modules": sorted(m for m in BROWSER_MODULES if m in modules),
+        "top": [{"module": name, "cumulative_ms": round(cum / 1000, 1)}
+                for name, _, cum, top_level in sorted(rows, key=lambda r: -r[2]) if top_level],
+    }
+
+
+def format_table(results, top):
+    lines = [f"{'scraper':<15} {'süre ms':>8} {'import ms':>10} {'modül':>6}  tarayıcı yığını"]
+    for name, r in results.items():
+        lines.append(f"{name:<15} {r['wall_ms']:>8} {r['import_ms']:>10} {r['modules']:>6}  "
+                     f"{', '.join(r['browser_modules']) or '-'}")
+    for name, r in results.items():
+        heaviest = ", ".join(f"{t['module']} {t['cumulative_ms']}" for t in r["top"][:top])
+        lines.append(f"   {name}: {heaviest}")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Scraper başlangıç (import) süresi benchmark'ı")
+    parser.add_argument("--scrapers", default=",".join(SCRAPERS), help=f"Virgülle ({', '.join(SCRAPERS)})")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT, help="Script başına çalıştırma sayısı")
+    parser.add_argument("--top", type=int, default=DEFAULT_TOP, help="Gösterilecek en pahalı üst düzey import sayısı")
+    parser.add_argument("--max-import-ms", type=float, default=None, help="Bu süreyi aşan import toplamı hata sayılır")
+    parser.add_argument("--report", help="Sonuçları JSON olarak bu dosyaya da yaz")
+    args = parser.parse_args(argv)
+
+    names = [n.strip() for n in args.scrapers.split(",") if n.strip()]
+    unknown = [n for n in names if n not in SCRAPERS]
+    if unknown: parser.error(f"Bilinmeyen scraper: {', '.join(unknown)}")
+
+    results = {name: measure(SCRAPERS[name][0], max(1, args.repeat)) for name in names}
+    print(f"⏱️ `--help` başlangıcı, {args.repeat} tekrar (medyan), {sys.version.split()[0]}")
+    print(format_table(results, args.top))
+    if args.report:
+        with open(args.report, "w", encoding="utf-8") as f: json.dump(results, f, ensure_ascii=False, indent=2)
+
+    failures = []
+    for name, r in results.items():
+        if r["exit_code"]: failures.append(f"{name}: çıkış kodu {r['exit_code']}")
+        if r["browser_modules"]: failures.append(f"{name}: --help tarayıcı yığınını yüklüyor ({', '.join(r['browser_modules'])})")
+        if args.max_import_ms and r["import_ms"] > args.max_import_ms:
+            failures.append(f"{name}: import {r['import_ms']} ms > {args.max_import_ms} ms")
+    if failures:
+        print("\n❌ Başlangıç regresyonu:")
+        for msg in failures: print(f"   - {msg}")
+        return 1
+    print("\n✅ Tarayıcı yığını yalnızca sürücü açılırken yükleniyor.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1 @@
+"""Python scraper'ları arasında paylaşılan yardımcılar."""
@@ -0,0 +1,265 @@
+"""İşçi sayısının ölçülen throughput'a göre otomatik ayarı (`--workers auto`).
+
+Detay aşaması küçük bir havuzla (`START_WORKERS`) başlar; her adımda ısınmadan sonra bir ölçüm
+penceresi boyunca sayfa/dk, hata oranı, süreç ağacının CPU kullanımı (çekirdek sınırına oranla) ve
+RSS'i ölçülür, sonra havuz büyütülür (1, 2, 3, 4, 6, 9, ...). Büyüme şu durumlarda durur:
+
+- eklenen işçi başına kazanç ilk adımdaki işçi başına hızın `KNEE_FRACTION`'ından azsa (eğrinin
+  dirseği; önceki adım seçilir),
+- hata oranı `ERROR_LIMIT`'i ve ilk adımın `ERROR_MARGIN` fazlasını aşarsa (banka yükü kaldırmıyor;
+  önceki adım seçilir),
+- CPU `CPU_CEILING`'e ulaşırsa veya bir adım daha cgroup/makine belleğine sığmıyorsa,
+- kuyruk biterse (değer kaydedilmez).
+
+Fazla işçiler ellerindeki sayfayı bitirip çıkar, çalışma seçilen sayıyla sürer. Seçilen değer
+ve ölçüm eğrisi `autotune.json` dosyasında banka, arka uç ve makine sınıfı (`4c-8g`, uzak uç
+noktalarda `remote`) anahtarıyla saklanır; `--workers` verilmeyen sonraki çalışmalar ve
+`scrape.py run` bu değeri kullanır.
+
+    python3 src/scrapers/paraf.py --workers auto
+    python3 src/scrapers/scrape.py tune paraf
+"""
+import os
+import json
+import time
+import argparse
+from datetime import datetime
+
+from common.metrics import children_map, descendants, proc_usage
+from common.resources import cpu_limit, memory_limit_mb, available_memory_mb
+from common.remote import ENDPOINTS_ENV
+
+DEFAULT_FILE = os.environ.get("AUTOTUNE_FILE", "autotune.json")
+START_WORKERS = 1
+WARMUP_MAX_S = 60           # yeni işçilerin oturum açması için en fazla bekleme
+WINDOW_S = 20               # ölçüm penceresi en az süresi
+WINDOW_PAGES = 3            # pencere başına işçi başına en az sayfa
+WINDOW_MAX_S = 120
+KNEE_FRACTION = 0.25        # eklenen işçi başına kazanç < ilk adımdaki işçi başı hızın %25'i -> dirsek
+ERROR_LIMIT = 0.05
+ERROR_MARGIN = 0.05
+CPU_CEILING = 0.85          # çekirdek sınırına oranla
+MEMORY_HEADROOM = 0.8
+MAX_WORKERS = 32
+MAX_RUNS = 10               # anahtar başına saklanan ayar çalışması
+
+REASONS = {"knee": "throughput dirseği", "errors": "hata oranı arttı", "cpu": "CPU sınırı",
+           "memory": "bellek sınırı", "limit": "işçi/kuyruk üst sınırı", "queue_empty": "kuyruk bitti"}
+
+
+def parse_workers(value):
+    """'auto' veya pozitif tam sayı."""
+    if value == "auto": return value
+    try: workers = int(value)
+    except ValueError: raise argparse.ArgumentTypeError(f"Geçersiz işçi sayısı: {value} (sayı veya 'auto')")
+    if workers < 1: raise argparse.ArgumentTypeError(f"Geçersiz işçi sayısı: {value}")
+    return workers
+
+
+def machine_class():
+    """Ayarın geçerli olduğu makine sınıfı: çekirdek ve bellek sınırı; uzak tarayıcılarda 'remote'."""
+    if os.environ.get(ENDPOINTS_ENV, "").strip(): return "remote"
+    memory = memory_limit_mb()
+    return f"{cpu_limit():g}c-{round(memory / 1024) if memory else '?'}g"
+
+
+def tune_key(bank, backend="selenium"):
+    return f"{bank}:{backend}:{machine_class()}"
+
+
+def load_tunings(path=DEFAULT_FILE):
+    try:
+        with open(path, 'r', encoding='utf-8') as f: data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def tuned_workers(bank, backend="selenium", path=DEFAULT_FILE):
+    """Bu makine sınıfı için kaydedilmiş işçi sayısı veya None."""
+    entry = load_tunings(path).get(tune_key(bank, backend))
+    return entry.get("workers") if entry else None
+
+
+def _tree_usage():
+    """(rss_mib, cpu_sn): bu süreç ve alt süreçleri (chromedriver, Chrome)."""
+    rss = cpu = 0.0
+    pid = os.getpid()
+    for p in [pid, *descendants(pid, children_map())]:
+        usage = proc_usage(p)
+        if usage: rss += usage[0]; cpu += usage[1]
+    return rss / 2 ** 20, cpu
+
+
+class Autotuner:
+    """İşçileri adım adım başlatır, her adımı ölçer ve dirsekte durur."""
+
+    def __init__(self, bank, metrics, frontier, backend="selenium", path=DEFAULT_FILE, max_workers=MAX_WORKERS):
+        self.bank, self.metrics, self.frontier = bank, metrics, frontier
+        self.key, self.path = tune_key(bank, backend), path
+        self.max_workers = max(START_WORKERS, min(max_workers, len(frontier)))
+        self.cpus = cpu_limit()
+        self.memory_mb = memory_limit_mb()
+        self.target = self.started = 0
+        self.history = []
+        self.chosen, self.reason = None, None
+
+    # --- İŞÇİ TARAFI ---
+    def retired(self, worker_id):
+        return worker_id > self.target
+
+    def feed(self, frontier, worker_id):
+        """İşçinin URL kaynağı; işçi hedefin dışına düşünce sayfa almayı bırakır."""
+        while not self.retired(worker_id):
+            nxt = frontier.pop()
+            if nxt is None: return
+            yield nxt[0]
+
+    # --- ÖLÇÜM ---
+    def _done(self):
+        pages = dict(self.metrics.pages)
+        return sum(pages.values()), pages.get("error", 0)
+
+    def _wait(self, until, limit_s):
+        started = time.monotonic()
+        while time.monotonic() - started < limit_s and len(self.frontier):
+            if until(time.monotonic() - started): return True
+            time.sleep(0.5)
+        return False
+
+    def measure(self, workers):
+        base, _ = self._done()
+        self._wait(lambda _: self._done()[0] - base >= workers, WARMUP_MAX_S)  # her yeni oturum bir sayfa
+        pages0, errors0 = self._done()
+        rss0, cpu0 = _tree_usage()
+        started = time.monotonic()
+        want = WINDOW_PAGES * workers
+        self._wait(lambda elapsed: elapsed >= WINDOW_S and self._done()[0] - pages0 >= want, WINDOW_MAX_S)
+        elapsed = time.monotonic() - started
+        pages, errors = self._done()
+        rss, cpu = _tree_usage()
+        pages, errors = pages - pages0, errors - errors0
+        step = {
+            "workers": workers, "pages": pages, "seconds": round(elapsed, 1),
+            "pages_per_min": round(pages / (elapsed / 60), 1) if elapsed else 0.0,
+            "error_rate": round(errors / pages, 3) if pages else 0.0,
+            "cpu_pct": round(100 * max(0.0, cpu - cpu0) / elapsed / self.cpus, 1) if elapsed else 0.0,
+            "rss_mib": round(max(rss, rss0)),
+        }
+        self.history.append(step)
+        return step
+
+    # --- KARAR ---
+    def decide(self, step):
+        """(seçilen işçi, neden) veya büyümeye devam için None."""
+        first, previous = self.history[0], self.history[-2] if len(self.history) > 1 else None
+        n = step["workers"]
+        if previous:
+            if step["error_rate"] > max(ERROR_LIMIT, first["error_rate"] + ERROR_MARGIN):
+                return previous["workers"], "errors"
+            per_worker = first["pages_per_min"] / first["workers"]
+            gain = (step["pages_per_min"] - previous["pages_per_min"]) / (n - previous["workers"])
+            if gain < KNEE_FRACTION * per_worker: return previous["workers"], "knee"
+        if step["cpu_pct"] >= CPU_CEILING * 100: return n, "cpu"
+        grow = self.next_size(n)
+        if grow == n: return n, "limit"
+        session_mb = step["rss_mib"] / n
+        available = available_memory_mb()
+        if self.memory_mb and step["rss_mib"] + session_mb * (grow - n) > self.memory_mb * MEMORY_HEADROOM:
+            return n, "memory"
+        if available is not None and available < session_mb * (grow - n):
+            return n, "memory"
+        return None
+
+    def next_size(self, n):
+        return min(self.max_workers, n + max(1, n // 2))
+
+    def _start(self, launch, workers):
+        self.target = workers
+        futures = []
+        while self.started < workers:
+            self.started += 1
+            futures.append(launch(self.started))
+        return futures
+
+    def run(self, launch):
+        """`launch(worker_id)` ile işçileri başlatır; ayar bitince fazla işçileri emekliye ayırır. Future'lar döner."""
+        workers = min(START_WORKERS, self.max_workers)
+        futures = self._start(launch, workers)
+        print(f"   🎛️ Otomatik ayar: {workers} işçiyle başlanıyor (en fazla {self.max_workers}, {self.cpus:g} çekirdek, "
+              f"{f'{self.memory_mb:.0f} MiB' if self.memory_mb else 'bellek sınırı yok'})")
+        while True:
+            step = self.measure(workers)
+            print(f"   🎛️ {workers} işçi: {step['pages_per_min']} sayfa/dk, hata %{100 * step['error_rate']:.0f}, "
+                  f"CPU %{step['cpu_pct']}, RSS {step['rss_mib']} MiB")
+            if not len(self.frontier):
+                best = max(self.history, key=lambda s: s["pages_per_min"])
+                self.chosen, self.reason = best["workers"], "queue_empty"
+                break
+            decision = self.decide(step)
+            if decision:
+                self.chosen, self.reason = decision
+                break
+            workers = self.next_size(workers)
+            futures += self._start(launch, workers)
+        self.target = self.chosen
+        print(f"   🎛️ Seçilen: {self.chosen} işçi ({REASONS[self.reason]})")
+        return futures
+
+    # --- KAYIT ---
+    def save(self):
+        """Dirsek/sınır bulunduysa seçimi ve eğriyi kaydeder; kuyruk erken bittiyse kaydetmez."""
+        if self.chosen is None or self.reason == "queue_empty":
+            print("   🎛️ Kuyruk ayar bitmeden tükendi, değer kaydedilmedi.")
+            return False
+        data = load_tunings(self.path)
+        entry = data.get(self.key) or {"runs": []}
+        now = datetime.now().strftime("%Y-%m-%dT%H:%M:%S")
+        run = {"tuned_at": now, "workers": self.chosen, "reason": self.reason, "history": self.history}
+        data[self.key] = {"workers": self.chosen, "reason": self.reason, "tuned_at": now,
+                          "runs": (entry.get("runs", []) + [run])[-MAX_RUNS:]}
+        tmp = f"{self.path}.tmp"
+        with open(tmp, 'w', encoding='utf-8') as f: json.dump(data, f, ensure_ascii=False, indent=2)
+        os.replace(tmp, self.path)
+        print(f"   🎛️ Kaydedildi: {self.key} -> {self.chosen} işçi ({self.path})")
+        return True
+
+    def to_dict(self):
+        return {"key": self.key, "workers": self.chosen, "reason": self.reason, "history": self.history}
+
+
+def format_curve(history, chosen=None, width=30):
+    """Ölçüm eğrisi: işçi sayısına göre sayfa/dk çubukları."""
+    top = max((s["pages_per_min"] for s in history), default=0) or 1
+    lines = [f"   {'işçi':>4} {'sayfa/dk':>9} {'hata':>5} {'CPU %':>6} {'RSS MiB':>8}"]
+    for s in history:
+        bar = "█" * max(1, round(width * s["pages_per_min"] / top))
+        mark = " ◀" if s["workers"] == chosen else ""
+        lines.append(f"   {s['workers']:>4} {s['pages_per_min']:>9} {100 * s['error_rate']:>4.0f}% "
+                     f"{s['cpu_pct']:>6} {s['rss_mib']:>8}  {bar}{mark}")
+    return "\n".join(lines)
+
+
+# --- KOMUT ---
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="scrape.py tune", description="Kaydedilmiş işçi ayarları ve ölçüm eğrileri")
+    parser.add_argument("banks", nargs="*", help="Gösterilecek scraper'lar (varsayılan: hepsi)")
+    parser.add_argument("--file", default=DEFAULT_FILE, help="Ayar dosyası")
+    parser.add_argument("--all-runs", action="store_true", help="Her anahtarın tüm ayar çalışmalarını göster")
+    args = parser.parse_args(argv)
+
+    data = load_tunings(args.file)
+    keys = [k for k in sorted(data) if not args.banks or k.split(":")[0] in args.banks]
+    if not keys:
+        print(f"❌ Kayıtlı ayar yok: {args.file} (önce --workers auto ile çalıştırın)")
+        return 1
+    current = machine_class()
+    for key in keys:
+        entry = data[key]
+        here = " (bu makine)" if key.endswith(f":{current}") else ""
+        print(f"\n🎛️ {key}{here}: {entry['workers']} işçi, {REASONS.get(entry['reason'], entry['reason'])}, "
+              f"{entry['tuned_at']}")
+        for run in entry["runs"] if args.all_runs else entry["runs"][-1:]:
+            if args.all_runs: print(f"   {run['tuned_at']}: {run['workers']} işçi ({REASONS.get(run['reason'], run['reason'])})")
+            print(format_curve(run["history"], run["workers"]))
+    return 0
@@ -0,0 +1,239 @@
+"""Detay sayfası getirme arka uçları: Selenium (oturum başına Chrome + chromedriver) veya
+Playwright (tek headless Chromium sürecinde oturum başına izole BrowserContext).
+
+Scraper'lar yalnızca `backend.session()` ve `session.fetch(url, metrics)` kullanır; aşamalar
+(`get`, `sleep`, `wait`, `page_source`) her iki arka uçta aynı adlarla ölçülür. Playwright
+tarafında tüm bağlamlar arka plandaki tek bir asyncio döngüsünde sürülür; işçi thread'leri
+çağrıları bu döngüye iletip sonucu bekler. Görsel, font ve medya istekleri indirilmez (kayıtlar
+görsel adresini HTML'den alır).
+
+Uç nokta havuzu (`--browser-endpoints`, `common/remote.py`) tanımlıysa Selenium oturumları Grid
+düğümlerinde, Playwright bağlamları CDP uç noktalarındaki tarayıcılarda açılır. Getirme sırasında
+oturum koparsa (düğüm düştü, tarayıcı kapandı) oturum başka uçta yeniden açılıp sayfa bir kez
+yeniden denenir (`session_failovers` sayacı). `guard` verilirse sayfa yüklenir yüklenmez
+sınıflandırılır (`common/pageguard.py`); challenge/hata sayfalarında seçici beklenmez,
+`PageRejected` fırlatılır.
+
+    python3 src/scrapers/paraf.py --backend playwright --workers 8
+
+Playwright isteğe bağlıdır: `pip install playwright && python -m playwright install chromium`.
+"""
+import asyncio
+import threading
+
+from common.browser import selenium_chrome, chrome_options
+from common.remote import endpoint_pool, session_lost, PLAYWRIGHT_KINDS
+from common.pageguard import PageRejected
+
+BACKENDS = ("selenium", "playwright")
+WAIT_TIMEOUT = 6            # sn, bekleme seçicisi için
+NAV_TIMEOUT = 30            # sn, sayfa yüklemesi için
+BLOCKED_RESOURCES = {"image", "media", "font"}
+VIEWPORT = {"width": 1920, "height": 1080}
+
+
+class Session:
+    """Ortak getirme: oturum koparsa yenisini açıp sayfayı bir kez yeniden dener."""
+
+    def fetch(self, url, metrics, **kwargs):
+        try:
+            return self._fetch(url, metrics, **kwargs)
+        except PageRejected:
+            raise
+        except Exception as e:
+            if not self.lost(e): raise
+            metrics.count("session_failovers")
+            print(f"      ♻️ Tarayıcı oturumu koptu ({type(e).__name__}), yeni oturum açılıyor...")
+            self.reopen()
+            return self._fetch(url, metrics, **kwargs)
+
+
+# --- SELENIUM ---
+class SeleniumSession(Session):
+    def __init__(self, backend, driver):
+        self.backend, self.driver = backend, driver
+
+    def lost(self, error):
+        return session_lost(error)
+
+    def reopen(self, lost=True):
+        """Yeni oturum; `lost` ise kopan uç nokta havuzda devre dışı işaretlenir."""
+        pool, endpoint = endpoint_pool(), getattr(self.driver, "endpoint", None)
+        if lost and pool and endpoint: pool.mark_down(endpoint, "oturum koptu")
+        self.close()
+        self.driver = self.backend.driver()
+
+    def _fetch(self, url, metrics, wait_for=None, timeout=WAIT_TIMEOUT, settle=0.5, guard=None):
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support.ui import WebDriverWait
+        from selenium.webdriver.support import expected_conditions as EC
+        with metrics.span("get", url): self.driver.get(url)
+        verdict = self._classify(url, metrics, guard) if guard else None
+        if settle: metrics.sleep(settle, url)
+        if wait_for and (verdict is None or verdict.pending):
+            with metrics.span("wait", url):
+                try: WebDriverWait(self.driver, timeout).until(EC.presence_of_element_located((By.CSS_SELECTOR, wait_for)))
+                except Exception: metrics.count("wait_timeouts")
+        with metrics.span("page_source", url): html = self.driver.page_source
+        if guard and not verdict.ok: self._classify(url, metrics, guard, html, final=True)
+        return html
+
+    def _classify(self, url, metrics, guard, html=None, final=False):
+        with metrics.span("classify", url):
+            return guard.check(html if html is not None else self.driver.page_source, self.driver.title, final=final)
+
+    def close(self):
+        try: self.driver.quit()
+        except Exception: pass
+
+
+class SeleniumBackend:
+    """Her oturum ayrı bir Chrome + chromedriver süreci."""
+    name = "selenium"
+
+    def __init__(self, headless=True):
+        self.headless = headless
+
+    def driver(self):
+        options = chrome_options()
+        if self.headless: options.add_argument("--headless=new")
+        options.add_argument(f"--window-size={VIEWPORT['width']},{VIEWPORT['height']}")
+        return selenium_chrome(options)
+
+    def session(self):
+        return SeleniumSession(self, self.driver())
+
+    def close(self):
+        pass
+
+
+# --- PLAYWRIGHT ---
+async def _route(route):
+    if route.request.resource_type in BLOCKED_RESOURCES: await route.abort()
+    else: await route.continue_()
+
+
+class PlaywrightSession(Session):
+    def __init__(self, backend, endpoint, context, page):
+        self.backend, self.endpoint, self.context, self.page = backend, endpoint, context, page
+
+    def lost(self, error):
+        browser = self.context.browser
+        return self.page.is_closed() or (browser is not None and not browser.is_connected())
+
+    def reopen(self, lost=True):
+        browser = self.context.browser
+        if lost and (browser is None or not browser.is_connected()): self.backend.discard(self.endpoint)
+        self.close()
+        fresh = self.backend.session()
+        self.endpoint, self.context, self.page = fresh.endpoint, fresh.context, fresh.page
+
+    def _fetch(self, url, metrics, wait_for=None, timeout=WAIT_TIMEOUT, settle=0.5, guard=None):
+        call = self.backend.call
+        with metrics.span("get", url):
+            response = call(self.page.goto(url, wait_until="domcontentloaded", timeout=NAV_TIMEOUT * 1000))
+        status = response.status if response else None
+        verdict = None
+        if guard:
+            with metrics.span("classify", url):
+                verdict = guard.check(call(self.page.content()), call(self.page.title()), status)
+        if settle: metrics.sleep(settle, url)
+        if wait_for and (verdict is None or verdict.pending):
+            with metrics.span("wait", url):
+                try: call(self.page.wait_for_selector(wait_for, state="attached", timeout=timeout * 1000))
+                except Exception: metrics.count("wait_timeouts")
+        with metrics.span("page_source", url): html = call(self.page.content())
+        if guard and not verdict.ok:
+            with metrics.span("classify", url): guard.check(html, call(self.page.title()), status, final=True)
+        return html
+
+    def close(self):
+        try: self.backend.call(self.context.close(), timeout=NAV_TIMEOUT)
+        except Exception: pass
+        finally: self.backend.release(self.endpoint)
+
+
+class PlaywrightBackend:
+    """Tek Chromium süreci (veya CDP uç noktası başına bir bağlantı); oturumlar ayrı çerez/depolama
+    alanına sahip BrowserContext'lerdir."""
+    name = "playwright"
+
+    def __init__(self, headless=True, user_agent=None):
+        try:
+            from playwright.async_api import async_playwright
+        except ImportError:
+            raise RuntimeError("Playwright yüklü değil: pip install playwright && python -m playwright install chromium")
+        self.headless, self.user_agent = headless, user_agent
+        self.pool = endpoint_pool()
+        self.browsers = {}  # uç nokta -> Browser (yerel için "local")
+        self.lock = threading.Lock()
+        self.loop = asyncio.new_event_loop()
+        self.thread = threading.Thread(target=self.loop.run_forever, name="playwright-loop", daemon=True)
+        self.thread.start()
+        self.playwright = self.call(async_playwright().start())
+
+    def call(self, coro, timeout=None):
+        """Coroutine'i döngüde çalıştırıp sonucunu (çağıran thread'de) döner."""
+        return asyncio.run_coroutine_threadsafe(coro, self.loop).result(timeout)
+
+    def _browser(self, endpoint):
+        key = endpoint.url if endpoint else "local"
+        with self.lock:
+            if key not in self.browsers:
+                chromium = self.playwright.chromium
+                if key == "local":
+                    connect = chromium.launch(headless=self.headless, args=["--disable-dev-shm-usage"])
+                else:
+                    connect = chromium.connect_over_cdp(endpoint.cdp_url, timeout=NAV_TIMEOUT * 1000)
+                self.browsers[key] = self.call(connect)
+            return self.browsers[key]
+
+    async def _new_session(self, browser):
+        context = await browser.new_context(viewport=VIEWPORT, user_agent=self.user_agent)
+        await context.route("**/*", _route)
+        return context, await context.new_page()
+
+    def _open(self, endpoint):
+        try:
+            return self.call(self._new_session(self._browser(endpoint)), timeout=NAV_TIMEOUT)
+        except Exception:
+            self.discard(endpoint)
+            raise
+
+    def session(self):
+        if not self.pool: return PlaywrightSession(self, None, *self._open(None))
+        endpoint, (context, page) = self.pool.open(PLAYWRIGHT_KINDS, self._open)
+        return PlaywrightSession(self, endpoint, context, page)
+
+    def discard(self, endpoint):
+        """Kopan uç noktanın bağlantısını bırakır; havuzda devre dışı işaretler."""
+        with self.lock: browser = self.browsers.pop(endpoint.url if endpoint else "local", None)
+        if endpoint and self.pool: self.pool.mark_down(endpoint, "bağlantı koptu")
+        if browser is not None:
+            try: self.call(browser.close(), timeout=5)
+            except Exception: pass
+
+    def release(self, endpoint):
+        if endpoint and self.pool: self.pool.release(endpoint)
+
+    def close(self):
+        try:
+            for browser in list(self.browsers.values()):
+                try: self.call(browser.close(), timeout=NAV_TIMEOUT)
+                except Exception: pass
+            self.call(self.playwright.stop())
+        finally:
+            self.loop.call_soon_threadsafe(self.loop.stop)
+            self.thread.join(timeout=5)
+
+
+def add_backend_arguments(parser):
+    parser.add_argument("--backend", choices=BACKENDS, default="selenium",
+                        help="Detay sayfası arka ucu: oturum başına Chrome (selenium) veya tek Chromium'da "
+                             "izole bağlamlar (playwright)")
+    return parser
+
+
+def open_backend(args):
+    name = getattr(args, "backend", "selenium")
+    return PlaywrightBackend() if name == "playwright" else SeleniumBackend()
@@ -0,0 +1,237 @@
+"""Toplu yeniden çıkarım (backfill): kayıtlı kampanyaların alanlarını güncel çıkarıcılarla yeniden hesaplar.
+
+Çıkarıcılar (`extract_financials_v8` / `v25`, `format_tarih_iso`, `extract_cards_precise` ...)
+iyileştirildiğinde siteleri yeniden taramadan, veritabanı dışa aktarımından (JSON Lines veya
+Parquet; başlık, koşullar / detay metni, banka) tüm alanlar yeniden çıkarılır ve kayıtlı
+değerlerle alan alan karşılaştırılır.
+
+- Girdi akış olarak okunur; satırlar `--chunk` büyüklüğünde parçalar hâlinde süreç havuzuna
+  gider. JSON çözme, çıkarım, karşılaştırma ve çıktı satırının kodlanması işçidedir; ana süreç
+  yalnızca bayt okur/yazar, bu yüzden hız çekirdek sayısıyla yaklaşık doğrusal artar.
+- Aynı anda en fazla `işçi x 2` parça bekler; bellek girdi boyutundan bağımsızdır.
+- Çıktı (`<girdi>.backfill.jsonl`) girdiyle aynı sıradadır: `id`, `family`, `fields` (yeni
+  değerler) ve `changes` (`{alan: {"old", "new"}}`). Özet `<çıktı>.summary.json`'a yazılır.
+
+Karşılaştırmada boş değerler (None, "", []) eşittir, tam sayı değerli ondalıklar tam sayıya, liste
+alanları sıralıya, tarihler ilk 19 karaktere (`+00:00` / `Z` farkı yok) indirgenir.
+
+    python3 src/scrapers/scrape.py backfill campaigns_export.jsonl --workers 8
+    python3 src/scrapers/scrape.py backfill campaigns.parquet --changed-only --limit 5000
+"""
+import os
+import re
+import sys
+import json
+import time
+import argparse
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from common.extract import FAMILIES, FIELDS, family_for, extract_fields, warm
+from common.records import _load
+from common.resources import cpu_limit
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+DEFAULT_CHUNK = 256
+PROGRESS_S = 5
+EXAMPLES = 3                # alan başına özette tutulan örnek kayıt
+DATE_RE = re.compile(r'^\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}:\d{2}')
+LIST_FIELDS = {"eligible_customers"}
+ID_KEYS = ("id", "reference_url", "url")
+
+
+# --- KARŞILAŞTIRMA ---
+def normalize(value, field=None):
+    """Kayıtlı ve yeni değeri aynı biçime getirir (veritabanı dışa aktarımı sayıları/tarihleri farklı yazar)."""
+    if value is None or value == "" or value == []: return None
+    if hasattr(value, "isoformat"): value = value.isoformat()  # Parquet zaman damgaları
+    if isinstance(value, float) and value.is_integer(): return int(value)
+    if isinstance(value, str):
+        text = value.strip()
+        if re.fullmatch(r'-?\d+(?:\.0+)?', text) and field not in ("earning", "discount"): return int(float(text))
+        if DATE_RE.match(text): return text[:19].replace(" ", "T")
+        return text
+    if isinstance(value, (list, tuple)):
+        items = [normalize(v) for v in value]
+        return tuple(sorted(items, key=str)) if field in LIST_FIELDS else tuple(items)
+    return value
+
+
+def diff_fields(stored, fields, family):
+    """{alan: {"old", "new"}}: yalnızca kayıtta bulunan ve farklı olan alanlar."""
+    changes = {}
+    for name in FIELDS[family]:
+        if name not in stored: continue
+        old, new = stored[name], fields.get(name)
+        if normalize(old, name) != normalize(new, name): changes[name] = {"old": old, "new": new}
+    return changes
+
+
+def _empty_stats():
+    return {name: {"compared": 0, "changed": 0, "filled": 0, "cleared": 0, "examples": []}
+            for name in sorted({f for fields in FIELDS.values() for f in fields})}
+
+
+def _dumps(value):
+    # Parquet'ten gelen Decimal / datetime değerleri metin olarak yazılır
+    if orjson is not None: return orjson.dumps(value, default=str)
+    return json.dumps(value, ensure_ascii=False, default=str).encode('utf-8')
+
+
+# --- İŞÇİ ---
+def run_chunk(items, family=None, changed_only=False):
+    """Parça (ham JSON satırları veya sözlükler) -> (çıktı baytları, alan istatistiği, kayıt, hata)."""
+    out, stats, count, errors = [], _empty_stats(), 0, 0
+    for item in items:
+        try:
+            record = _load(item) if isinstance(item, (bytes, str)) else item
+            fam = family or family_for(record)
+            fields = extract_fields(record, fam)
+        except Exception:
+            errors += 1
+            continue
+        count += 1
+        changes = diff_fields(record, fields, fam)
+        record_id = next((record[k] for k in ID_KEYS if record.get(k) is not None), None)
+        for name in FIELDS[fam]:
+            if name not in record: continue
+            s = stats[name]
+            s["compared"] += 1
+            if name not in changes: continue
+            s["changed"] += 1
+            old, new = normalize(changes[name]["old"], name), normalize(changes[name]["new"], name)
+            if old is None: s["filled"] += 1
+            elif new is None: s["cleared"] += 1
+            if len(s["examples"]) < EXAMPLES: s["examples"].append({"id": record_id, **changes[name]})
+        if changed_only and not changes: continue
+        out.append(_dumps({"id": record_id, "family": fam, "fields": fields, "changes": changes}))
+    return b"\n".join(out) + b"\n" if out else b"", stats, count, errors
+
+
+def _init_worker():
+    import signal
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    warm()
+
+
+def merge_stats(total, part):
+    for name, s in part.items():
+        t = total[name]
+        for key in ("compared", "changed", "filled", "cleared"): t[key] += s[key]
+        t["examples"].extend(s["examples"][:EXAMPLES - len(t["examples"])])
+
+
+# --- GİRDİ ---
+def iter_chunks(path, chunk, limit=None):
+    """JSON Lines (ham satırlar) veya Parquet (sözlükler) parçaları; hiçbiri belleğe tam yüklenmez."""
+    taken = 0
+    if path.endswith(".parquet"):
+        try:
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise SystemExit("❌ Parquet için pyarrow gerekli: pip install pyarrow")
+        for batch in pq.ParquetFile(path).iter_batches(batch_size=chunk):
+            rows = batch.to_pylist()
+            if limit is not None: rows = rows[:limit - taken]
+            taken += len(rows)
+            if rows: yield rows
+            if limit is not None and taken >= limit: return
+        return
+    with open(path, 'rb') as f:
+        lines = []
+        for line in f:
+            if not line.strip(): continue
+            lines.append(line)
+            taken += 1
+            if len(lines) >= chunk:
+                yield lines
+                lines = []
+            if limit is not None and taken >= limit: break
+        if lines: yield lines
+
+
+# --- ÇALIŞTIRMA ---
+class Backfill:
+    def __init__(self, workers=None, chunk=DEFAULT_CHUNK, family=None, changed_only=False):
+        self.workers = max(1, workers or int(cpu_limit()))
+        self.chunk, self.family, self.changed_only = max(1, chunk), family, changed_only
+        self.stats = _empty_stats()
+        self.records = self.errors = 0
+        self.started = None
+
+    def run(self, source, output):
+        """`source` parçalarını sırayla işleyip `output` dosyasına yazar; bekleyen parça sayısı sınırlı."""
+        self.started = last_report = time.monotonic()
+        limit = self.workers * 2
+        with ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker) as pool, open(output, 'wb') as out:
+            pending = deque()
+            for items in source:
+                pending.append(pool.submit(run_chunk, items, self.family, self.changed_only))
+                while len(pending) >= limit or (pending and pending[0].done()):
+                    self._collect(pending.popleft().result(), out)
+                if time.monotonic() - last_report >= PROGRESS_S:
+                    last_report = time.monotonic()
+                    print(f"   ⏳ {self.progress()}", file=sys.stderr, flush=True)
+            while pending: self._collect(pending.popleft().result(), out)
+        return self.summary()
+
+    def _collect(self, result, out):
+        payload, stats, count, errors = result
+        if payload: out.write(payload)
+        merge_stats(self.stats, stats)
+        self.records += count
+        self.errors += errors
+
+    def wall(self):
+        return time.monotonic() - self.started if self.started else 0.0
+
+    def progress(self):
+        changed = sum(s["changed"] for s in self.stats.values())
+        return f"{self.records} kayıt, {self.records / max(self.wall(), 1e-6):.0f} kayıt/sn, {changed} alan değişti"
+
+    def summary(self):
+        wall = self.wall()
+        return {"records": self.records, "errors": self.errors, "workers": self.workers, "chunk": self.chunk,
+                "wall_s": round(wall, 2), "records_per_s": round(self.records / max(wall, 1e-6), 1),
+                "fields": {name: s for name, s in self.stats.items() if s["compared"]}}
+
+
+def format_summary(summary):
+    lines = [f"{'alan':<22}{'karşılaştırılan':>16}{'değişen':>10}{'dolan':>8}{'boşalan':>9}{'oran':>8}"]
+    for name, s in summary["fields"].items():
+        rate = f"%{100 * s['changed'] / s['compared']:.1f}" if s["compared"] else "-"
+        lines.append(f"{name:<22}{s['compared']:>16}{s['changed']:>10}{s['filled']:>8}{s['cleared']:>9}{rate:>8}")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="scrape.py backfill",
+                                     description="Kayıtlı kampanyaların alanlarını güncel çıkarıcılarla yeniden hesaplar")
+    parser.add_argument("input", help="Dışa aktarım: .jsonl / .ndjson veya .parquet")
+    parser.add_argument("--output", default=None, help="Yeniden hesaplanan alanlar (varsayılan: <girdi>.backfill.jsonl)")
+    parser.add_argument("--workers", type=int, default=None, help="Süreç sayısı (varsayılan: çekirdek sayısı)")
+    parser.add_argument("--chunk", type=int, default=DEFAULT_CHUNK, help="İşçiye giden parça başına kayıt")
+    parser.add_argument("--family", choices=FAMILIES, default=None,
+                        help="Tüm kayıtlar için çıkarıcı ailesi (varsayılan: kaydın `bank` alanından)")
+    parser.add_argument("--changed-only", action="store_true", help="Yalnızca alanı değişen kayıtları yaz")
+    parser.add_argument("--limit", type=int, default=None, help="İlk N kayıt (deneme için)")
+    args = parser.parse_args(argv)
+
+    output = args.output or f"{os.path.splitext(args.input)[0]}.backfill.jsonl"
+    job = Backfill(args.workers, args.chunk, args.family, args.changed_only)
+    print(f"🔁 Yeniden çıkarım: {args.input} -> {output} ({job.workers} işçi, parça {job.chunk})")
+    try:
+        summary = job.run(iter_chunks(args.input, job.chunk, args.limit), output)
+    except KeyboardInterrupt:
+        print(f"\n⛔ Durduruldu: {job.progress()}")
+        return 130
+    summary_path = f"{os.path.splitext(output)[0]}.summary.json"
+    with open(summary_path, 'w', encoding='utf-8') as f: json.dump(summary, f, ensure_ascii=False, indent=2)
+    print(format_summary(summary))
+    print(f"\n✅ {summary['records']} kayıt {summary['wall_s']} sn'de ({summary['records_per_s']} kayıt/sn), "
+          f"{summary['errors']} hatalı satır. Özet: {summary_path}")
+    return 0
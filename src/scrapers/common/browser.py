@@ -0,0 +1,99 @@
+"""Tarayıcı yığınının tembel (lazy) yüklenmesi ve chromedriver yolunun önbelleklenmesi.
+
+`selenium`, `undetected_chromedriver` ve `webdriver_manager` modül yüklenirken değil,
+tarayıcı gerçekten açılırken içe aktarılır; `--help`, replay ve yalnızca çıkarım yapan
+kullanımlar bu maliyeti ödemez.
+
+`ChromeDriverManager().install()` her çağrıda ağdan sürüm kontrolü yapar. Bulunan yol
+`CHROMEDRIVER_CACHE` dosyasında (varsayılan `~/.cache/kartavantaj-scraper/chromedriver.json`)
+`CHROMEDRIVER_CACHE_TTL` saniye (7 gün) saklanır. Chrome güncellenip sürücü uyumsuz kalırsa
+önbellek bir kez yenilenir. `CHROMEDRIVER_PATH` verilirse doğrudan o kullanılır.
+
+`BROWSER_ENDPOINTS` tanımlıysa `selenium_chrome` oturumu uzak uç noktalardan birinde açar
+(`common/remote.py`); scraper kodu değişmez.
+"""
+import os
+import sys
+import json
+import time
+
+CACHE_FILE = os.environ.get("CHROMEDRIVER_CACHE") or os.path.join(
+    os.path.expanduser("~"), ".cache", "kartavantaj-scraper", "chromedriver.json")
+CACHE_TTL = int(os.environ.get("CHROMEDRIVER_CACHE_TTL", 7 * 24 * 3600))
+
+
+def distutils_shim():
+    """Python 3.12+'da `distutils` kaldırıldı; undetected_chromedriver setuptools kopyasını kullanır."""
+    if sys.version_info < (3, 12) or "distutils" in sys.modules: return
+    try:
+        import setuptools
+        from setuptools import _distutils
+        sys.modules["distutils"] = _distutils
+    except ImportError:
+        pass
+
+
+def import_uc():
+    distutils_shim()
+    import undetected_chromedriver as uc
+    return uc
+
+
+# --- CHROMEDRIVER ÖNBELLEĞİ ---
+def _read_cache():
+    try:
+        with open(CACHE_FILE, 'r', encoding='utf-8') as f: entry = json.load(f)
+    except (OSError, ValueError):
+        return None
+    path = entry.get("path")
+    if not path or not os.path.exists(path): return None
+    if time.time() - entry.get("resolved_at", 0) > CACHE_TTL: return None
+    return path
+
+
+def _write_cache(path):
+    try:
+        os.makedirs(os.path.dirname(CACHE_FILE), exist_ok=True)
+        tmp = f"{CACHE_FILE}.tmp"
+        with open(tmp, 'w', encoding='utf-8') as f: json.dump({"path": path, "resolved_at": time.time()}, f)
+        os.replace(tmp, CACHE_FILE)
+    except OSError:
+        pass  # salt okunur ev dizini: her çalışmada yeniden çözülür
+
+
+def chromedriver_path(refresh=False):
+    """Önbellekteki chromedriver yolu; yoksa/eskiyse webdriver_manager ile çözüp kaydeder."""
+    override = os.environ.get("CHROMEDRIVER_PATH")
+    if override: return override
+    path = None if refresh else _read_cache()
+    if path: return path
+    from webdriver_manager.chrome import ChromeDriverManager
+    path = ChromeDriverManager().install()
+    _write_cache(path)
+    return path
+
+
+def selenium_chrome(options):
+    """Uç nokta havuzu varsa oradan (uzak veya yerel), yoksa yerel `webdriver.Chrome`."""
+    from common.remote import endpoint_pool
+    pool = endpoint_pool()
+    if pool: return pool.webdriver(options, local_chrome)
+    return local_chrome(options)
+
+
+def local_chrome(options):
+    """Önbellekli sürücüyle `webdriver.Chrome`; sürüm uyumsuzluğunda önbelleği bir kez yeniler."""
+    from selenium import webdriver
+    from selenium.webdriver.chrome.service import Service
+    from selenium.common.exceptions import SessionNotCreatedException
+    try:
+        return webdriver.Chrome(service=Service(chromedriver_path()), options=options)
+    except SessionNotCreatedException:
+        if os.environ.get("CHROMEDRIVER_PATH"): raise
+        print("   ♻️ Chromedriver uyumsuz, önbellek yenileniyor...")
+        return webdriver.Chrome(service=Service(chromedriver_path(refresh=True)), options=options)
+
+
+def chrome_options():
+    from selenium.webdriver.chrome.options import Options
+    return Options()
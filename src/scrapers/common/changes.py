@@ -0,0 +1,210 @@
+"""Çalışmalar arası değişiklik akışı: yeni, alan bazında değişen ve kaybolan kampanyalar.
+
+Scraper çıktı dosyasının önceki hâli çalışma başında okunur; çalışma sonunda yeni kayıtlarla
+karşılaştırılıp `<çıktı>.changes.json` yazılır. Kampanyalar önce kanonik URL ile, eşleşmeyenler
+içerik parmak iziyle (`common/fingerprint.py`, slug değişikliği) eşlenir.
+
+- `added`: yeni kampanyalar (tam kayıt)
+- `modified`: değişen alanlar `{alan: [eski, yeni]}` + tam kayıt; URL değiştiyse `previous_url`
+- `removed`: liste sayfasında artık görünmeyen kampanyalar; `valid_until` geçmişse `expired`,
+  değilse `disappeared`. Sayfaları açmaya gerek yoktur. Listede olup bu çalışmada çekilmeyen
+  (süre/limit) kampanyalar silinmiş sayılmaz.
+
+    python3 src/scrapers/scrape.py diff eski.json yeni.json --bank maximum -o degisiklik.json
+"""
+import os
+import json
+import argparse
+from datetime import datetime
+
+from common.records import to_dict
+from common.frontier import canonicalize_url
+from common.fingerprint import FingerprintIndex, fingerprint
+from common.reducer import reduce_html
+
+# Her çalışmada değişen veya içerikten türetilen alanlar karşılaştırılmaz
+IGNORED_FIELDS = {"id", "created_at", "extraction", "fingerprint", "raw_html"}
+HTML_FIELDS = {"detail_html"}
+REMOVED_EXPIRED = "expired"
+REMOVED_GONE = "disappeared"
+
+
+def _text(item):
+    """İçerik eşlemesi için metin: koşullar, indirgenmiş metin veya HTML, yoksa açıklama."""
+    if item.get("conditions"): return " ".join(item["conditions"])
+    if item.get("detail_text") or item.get("raw_text"): return item.get("detail_text") or item["raw_text"]
+    if item.get("detail_html"): return reduce_html(item["detail_html"])
+    return item.get("description") or ""
+
+
+def _comparable(field, value):
+    return " ".join(reduce_html(value).split()) if field in HTML_FIELDS and value else value
+
+
+def field_changes(old, new):
+    """{alan: [eski, yeni]}; HTML alanları indirgenmiş metinle karşılaştırılır ve yalnızca "changed" yazılır."""
+    changes = {}
+    for field in dict.fromkeys([*new, *old]):
+        if field in IGNORED_FIELDS: continue
+        before, after = old.get(field), new.get(field)
+        if before == after or _comparable(field, before) == _comparable(field, after): continue
+        changes[field] = "changed" if field in HTML_FIELDS else [before, after]
+    return changes
+
+
+def diff(previous, current, bank, listed=None, check_removed=True, today=None):
+    """Önceki ve yeni kayıt listelerinden değişiklik akışı.
+
+    `listed`: bu çalışmada liste sayfasında görülen URL'leri içeren (`url in listed`) kap; bunlar
+    yeni çıktıda olmasa da kaybolmuş sayılmaz. `check_removed=False` kaybolan hesabını kapatır.
+    """
+    today = today or datetime.now().strftime("%Y-%m-%d")
+    previous = [to_dict(i) for i in previous]
+    current = [to_dict(i) for i in current]
+    prev_by_key = {canonicalize_url(i.get("url"), bank): i for i in previous if i.get("url")}
+    cur_by_key = {canonicalize_url(i.get("url"), bank): i for i in current if i.get("url")}
+
+    pairs = [(prev_by_key[k], cur_by_key[k]) for k in cur_by_key if k in prev_by_key]
+    orphans = {k: i for k, i in prev_by_key.items() if k not in cur_by_key}
+    fresh = [i for k, i in cur_by_key.items() if k not in prev_by_key]
+
+    # URL'i değişmiş ama içeriği aynı/çok benzer kampanyalar (slug değişikliği, arşiv bağlantısı)
+    if orphans and fresh:
+        index = FingerprintIndex()
+        for key, item in orphans.items():
+            index.add({"key": key, "url": item["url"], **fingerprint(item.get("title", ""), _text(item))})
+        still_new = []
+        for item in fresh:
+            match = index.lookup(None, fingerprint(item.get("title", ""), _text(item)))
+            if match and match[0]["key"] in orphans:
+                pairs.append((orphans.pop(match[0]["key"]), item))
+            else:
+                still_new.append(item)
+        fresh = still_new
+
+    modified, unchanged = [], 0
+    for old, new in pairs:
+        changes = field_changes(old, new)
+        if not changes:
+            unchanged += 1
+            continue
+        entry = {"url": new["url"], "changes": changes, "record": new}
+        if changes.get("url"): entry["previous_url"] = old["url"]
+        modified.append(entry)
+
+    removed, unfetched = [], 0
+    for item in orphans.values() if check_removed else ():
+        if listed is not None and item["url"] in listed:
+            unfetched += 1
+            continue
+        valid_until = item.get("valid_until")
+        reason = REMOVED_EXPIRED if valid_until and valid_until[:10] < today else REMOVED_GONE
+        removed.append({"url": item["url"], "title": item.get("title"), "valid_until": valid_until, "reason": reason})
+
+    return {
+        "bank": bank,
+        "generated_at": datetime.now().strftime("%Y-%m-%dT%H:%M:%S"),
+        "summary": {"added": len(fresh), "modified": len(modified), "removed": len(removed), "unchanged": unchanged,
+                    "unfetched": unfetched, "removals_checked": check_removed},
+        "added": fresh,
+        "modified": modified,
+        "removed": removed,
+    }
+
+
+def format_summary(feed):
+    s = feed["summary"]
+    line = f"Değişiklik: +{s['added']} yeni, ~{s['modified']} değişen, -{s['removed']} kaybolan, {s['unchanged']} aynı"
+    if not s["removals_checked"]: line += " (liste eksik, kaybolanlar hesaplanmadı)"
+    elif s["unfetched"]: line += f", {s['unfetched']} listede ama çekilmedi"
+    return line
+
+
+def write_feed(path, feed):
+    tmp = f"{path}.tmp"
+    with open(tmp, 'w', encoding='utf-8') as f: json.dump(feed, f, ensure_ascii=False, indent=2)
+    os.replace(tmp, path)
+
+
+def read_snapshot(path):
+    if not path or not os.path.exists(path): return None
+    try:
+        with open(path, 'r', encoding='utf-8') as f: items = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return items if isinstance(items, list) else None
+
+
+# --- ÇALIŞMA ---
+class ChangeFeed:
+    """Önceki çıktıyı çalışma başında tutar; `write` ile yeni çıktıya göre akışı yazar."""
+
+    def __init__(self, bank, output_file, path):
+        self.bank = bank
+        self.path = path
+        self.previous = read_snapshot(output_file) if path else None
+
+    def write(self, items, frontier, complete=True):
+        """Frontier liste sayfasında görülen URL'leri tutar. Liste boşsa (yüklenemedi) veya
+        `complete=False` ise (ör. --limit ile kısaltılmış liste) kaybolan hesaplanmaz."""
+        if not self.path: return None
+        if self.previous is None:
+            print("   🔁 Önceki çıktı yok, değişiklik akışı yazılmadı (ilk çalışma).")
+            return None
+        feed = diff(self.previous, items, self.bank, frontier, check_removed=complete and frontier.seen > 0)
+        write_feed(self.path, feed)
+        print(f"   🔁 {format_summary(feed)} -> {self.path}")
+        return feed
+
+
+def skip_unchanged(args, frontier, metrics, changes=None):
+    """Liste önceki tam çalışmayla aynıysa (`Frontier.listing_unchanged`) detay aşaması atlanır:
+    önceki çıktı aynen kalır, metriklere "no_change" ve boş bir değişiklik akışı yazılır. True dönerse
+    scraper hemen çıkmalıdır."""
+    if getattr(args, "force_details", False) or not frontier.listing_unchanged(getattr(args, "refresh_after", None)):
+        return False
+    metrics.result = "no_change"
+    metrics.count("listing_unchanged")
+    print(f"   💤 Liste önceki çalışmayla aynı ({frontier.seen} kampanya), detay aşaması atlandı; önceki çıktı geçerli.")
+    # Önceki akış (değişiklikleriyle) importer'lar tarafından yeniden uygulanmasın
+    if changes is not None and changes.previous is not None: changes.write(changes.previous, frontier)
+    return True
+
+
+def add_changes_arguments(parser):
+    parser.add_argument("--changes-file", default=None,
+                        help="Önceki çalışmaya göre değişiklik akışı (varsayılan: <çıktı>.changes.json, '-' kapatır)")
+    return parser
+
+
+def changes_path(output_file):
+    return f"{os.path.splitext(output_file)[0]}.changes.json"
+
+
+def open_changes(args, bank, output_file):
+    path = getattr(args, "changes_file", None)
+    if path == "-": path = None
+    elif path is None: path = changes_path(output_file)
+    return ChangeFeed(bank, output_file, path)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="scrape.py diff", description="İki çıktı dosyasından değişiklik akışı")
+    parser.add_argument("previous", help="Önceki çalışmanın çıktısı")
+    parser.add_argument("current", help="Yeni çıktı")
+    parser.add_argument("--bank", default=None, help="Kanonik URL kuralları (maximum, paraf, vakifbank)")
+    parser.add_argument("-o", "--output", default=None, help="Akış dosyası (varsayılan: <yeni>.changes.json)")
+    parser.add_argument("--no-removed", action="store_true",
+                        help="Yeni çıktıda olmayanları kaybolan sayma (kısmi çalışma)")
+    args = parser.parse_args(argv)
+
+    previous, current = read_snapshot(args.previous), read_snapshot(args.current)
+    if previous is None or current is None:
+        print("❌ Çıktı dosyaları okunamadı (JSON liste bekleniyor).")
+        return 1
+    # Dosyadan dosyaya karşılaştırmada liste sayfası yoktur; yeni çıktıda olmayan her şey kaybolmuştur
+    feed = diff(previous, current, args.bank, check_removed=not args.no_removed)
+    path = args.output or changes_path(args.current)
+    write_feed(path, feed)
+    print(f"🔁 {format_summary(feed)} -> {path}")
+    return 0
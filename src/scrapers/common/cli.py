@@ -0,0 +1,94 @@
+"""Scraper'ların ortak komut satırı: paylaşılan argümanlar, çalışma başlangıcı ve ad ile çalıştırma.
+
+Bu modül ve import ettikleri tarayıcı yığınını yüklemez; `selenium` / `undetected_chromedriver`
+yalnızca sürücü açılırken `common/browser.py` üzerinden gelir.
+
+    python3 src/scrapers/scrape.py --list
+    python3 src/scrapers/scrape.py paraf --workers 4 --deadline 20m
+"""
+import os
+import sys
+import runpy
+import importlib
+import argparse
+
+from common.frontier import add_frontier_arguments
+from common.ndjson import add_stream_arguments, open_stream, fanout
+from common.metrics import add_metrics_arguments, build_metrics
+from common.profiler import add_profile_arguments, build_profiler
+from common.fingerprint import add_fingerprint_arguments
+from common.changes import add_changes_arguments
+from common.remote import add_remote_arguments, configure_remote
+from common.sink import add_sink_arguments, open_sink
+
+SCRAPERS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# ad -> (script, açıklama); script'ler kendi __main__ bloklarıyla çalıştırılır
+SCRAPERS = {
+    "maximum": ("isbankasi/maximum.py", "Maximum (Selenium) -> maximum_kampanyalar_raw.json"),
+    "maximum-hybrid": ("maximum.py", "Maximum hibrit (uc) -> maximum_kampanyalar_hibrit.json"),
+    "maximum-full": ("isbankasi/maximum-full.py", "Maximum + ham HTML -> maximum_campaigns_full.json"),
+    "maximum-links": ("isbankasi/maximum-links.py", "Maximum link listesi -> maximum_links.json"),
+    "paraf": ("paraf.py", "Paraf v25 (paralel işçiler) -> paraf_restored_v25.json"),
+    "halkbank": ("halkbank/paraf.py", "Halkbank Paraf (uc) -> paraf_kampanyalar_raw.json"),
+    "vakifbank": ("vakifbank/vakifbank.py", "Vakıfbank -> vakifbank_kampanyalar_raw.json"),
+}
+
+# ad -> (modül, açıklama); modülün main(argv) fonksiyonu çağrılır
+COMMANDS = {
+    "diff": ("common.changes", "İki çıktı dosyası -> değişiklik akışı (yeni/değişen/kaybolan)"),
+    "merge": ("common.merge", "--shard i/N çıktıları -> birleşik çıktı (+ değişiklik akışı)"),
+    "watch": ("common.watch", "Sürekli izleme: uyarlanır aralıkla artımlı tarama, kayıtları anında NDJSON akıtır"),
+    "run": ("common.orchestrator", "Birden fazla scraper, ortak oturum/bellek bütçesi ve host başına sınırlarla"),
+    "tune": ("common.autotune", "--workers auto ile kaydedilen işçi ayarları ve ölçeklenme eğrileri"),
+    "endpoints": ("common.remote", "Uzak tarayıcı uç noktalarının (Grid, CDP) sağlığı ve doluluğu"),
+    "backfill": ("common.backfill", "Dışa aktarım (JSONL / Parquet) -> yeniden çıkarılan alanlar + alan bazında fark özeti"),
+    "serve": ("common.extract_service", "Kalıcı çıkarım servisi: belge partileri -> alanlar (HTTP / Unix soketi)"),
+    "sink": ("common.sink", "Çıktı dosyaları -> veritabanı (PostgreSQL / PostgREST), toplu upsert"),
+}
+
+
+def add_common_arguments(parser):
+    add_frontier_arguments(parser)
+    add_stream_arguments(parser)
+    add_metrics_arguments(parser)
+    add_profile_arguments(parser)
+    add_fingerprint_arguments(parser)
+    add_changes_arguments(parser)
+    add_remote_arguments(parser)
+    add_sink_arguments(parser)
+    return parser
+
+
+def scraper_parser(description=None):
+    return add_common_arguments(argparse.ArgumentParser(description=description))
+
+
+def start_run(args, scraper, output_file):
+    """NDJSON akışını ve `--sink` verildiyse veritabanı sink'ini açar, metrikleri ve `--profile`
+    verildiyse profiler'ı kurar; (stream, metrics). `stream` kaydı açık olan tüm hedeflere iletir."""
+    configure_remote(args)
+    stream = open_stream(args)
+    metrics = build_metrics(args, scraper, output_file)
+    build_profiler(args, metrics, output_file)
+    return fanout(stream, open_sink(args, metrics, output_file)), metrics
+
+
+def main(argv=None):
+    argv = list(sys.argv[1:] if argv is None else argv)
+    if not argv or argv[0] in ("-h", "--help", "--list"):
+        print("Kullanım: scrape.py <scraper|komut> [argümanlar]\n")
+        for name, (script, about) in SCRAPERS.items(): print(f"  {name:<15} {about}")
+        print()
+        for name, (module, about) in COMMANDS.items(): print(f"  {name:<15} {about}")
+        return 0
+    name, rest = argv[0], argv[1:]
+    if name in COMMANDS:
+        return importlib.import_module(COMMANDS[name][0]).main(rest)
+    if name not in SCRAPERS:
+        print(f"❌ Bilinmeyen scraper: {name} (seçenekler: {', '.join([*SCRAPERS, *COMMANDS])})", file=sys.stderr)
+        return 2
+    script = os.path.join(SCRAPERS_DIR, SCRAPERS[name][0])
+    sys.argv = [script, *rest]
+    runpy.run_path(script, run_name="__main__")
+    return 0
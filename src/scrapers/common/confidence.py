@@ -0,0 +1,154 @@
+"""Kural tabanlı çıkarımın güven skoru; AI çağrısını atlamak veya kısaltmak için.
+
+`assess()` çıkarılan alanları kampanya metniyle karşılaştırır:
+
+- `rules`: hangi kuralların sonuç ürettiği (taksit, yüzde, tutar, tavan, harcama, tarih ...)
+- `missing`: boş kalan zorunlu alanlar (kazanç/taksit, bitiş tarihi, kategori)
+- `conflicts`: tutarsızlıklar (harcama < tavan, ters tarih, metindeki yüzdenin kullanılmaması ...)
+- `unparsed_amounts`: metinde geçip hiçbir alana yansımayan TL tutarları
+
+`ai` alanı `skip` (alanlar eksiksiz ve tutarlı, AI gerekmez), `short` (alanlar AI'ya veri
+olarak verilip kısa metinle doğrulatılabilir) veya `full` olur. TS tarafı bu kararı yalnızca
+`--trust-extraction` ile uygular; varsayılan davranış değişmez. Çıkarıcıları kendi site metni
+üzerinde doğrulanmamış ailelerde (`UNVALIDATED_FAMILIES`) karar her zaman `full`'dur.
+"""
+import re
+
+from common import maximum as mx
+from common import paraf as pf
+
+SKIP_THRESHOLD = 0.9
+SHORT_THRESHOLD = 0.6
+
+GENERIC_CATEGORIES = {"Diğer", None, ""}
+GENERIC_PARTICIPATION = {"Detayları İnceleyin", "Detayları kontrol ediniz", None, ""}
+DEFAULT_CARDS = {"Paraf Kartları"}
+# Maximum v8 çıkarıcılarını kullanan ama bu çıkarıcıların kendi metni üzerinde doğrulanmadığı aileler:
+# skor raporlanır, alanlar AI'ya yalnızca veri olarak gider (`--trust-extraction` bunları atlamaz)
+UNVALIDATED_FAMILIES = {"vakifbank"}
+
+AMOUNT_RE = re.compile(r'(\d{1,3}(?:\.\d{3})+|\d+)\s*(?:tl|₺)')
+PERCENT_RE = re.compile(r'%\s*(\d+)|(\d+)\s*%')
+NUMBER_RE = re.compile(r'\d{1,3}(?:\.\d{3})+|\d+')
+DATE_HINT_RE = re.compile(r'\d{1,2}[./]\d{1,2}[./]\d{2,4}|\d{1,2}\s+(?:ocak|şubat|mart|nisan|mayıs|haziran|temmuz|'
+                          r'ağustos|eylül|ekim|kasım|aralık)')
+
+
+def _numbers(value):
+    return {int(n.replace('.', '')) for n in NUMBER_RE.findall(value or "")}
+
+
+def _earning_rule(earning):
+    e = mx.tr_lower(earning)
+    if e.startswith("%"): return "percent"
+    if "fiyat avantajı" in e: return "price_advantage"
+    if "tl" in e: return "amount"
+    return "earning_text"
+
+
+def assess(fields, text, title=""):
+    """Alanlar + metin -> güven raporu. `fields` Campaign anahtarlarını kullanır."""
+    t_low = mx.tr_lower(f"{title} {text}")
+    earning, discount = fields.get("earning"), fields.get("discount")
+    min_s, max_d = fields.get("min_spend") or 0, fields.get("max_discount") or 0
+    valid_from, valid_until = fields.get("valid_from"), fields.get("valid_until")
+    rules, missing, conflicts = [], [], []
+
+    # --- ATEŞLENEN KURALLAR ---
+    if discount and "taksit" in mx.tr_lower(discount): rules.append("installment")
+    if earning: rules.append(_earning_rule(earning))
+    if max_d: rules.append("max_discount")
+    if min_s: rules.append("min_spend")
+    if valid_until: rules.append("dates")
+    if fields.get("category") not in GENERIC_CATEGORIES: rules.append("category")
+    cards = fields.get("eligible_customers")
+    if cards and not set(cards) <= DEFAULT_CARDS: rules.append("cards")
+    if fields.get("participation_method") not in GENERIC_PARTICIPATION: rules.append("participation")
+
+    # --- EKSİKLER ---
+    if not earning and not discount: missing.append("earning")
+    if not valid_until: missing.append("valid_until")
+    if fields.get("category") in GENERIC_CATEGORIES: missing.append("category")
+
+    # --- ÇELİŞKİLER ---
+    percents = {int(a or b) for a, b in PERCENT_RE.findall(t_low)}
+    if min_s and max_d and min_s < max_d: conflicts.append("min_spend_below_max_discount")
+    if valid_from and valid_until and valid_from > valid_until: conflicts.append("dates_reversed")
+    if len(percents) > 1: conflicts.append("multiple_percents")
+    if percents and earning and "%" not in earning and not discount: conflicts.append("percent_ignored")
+    if earning and earning.startswith("%") and not _numbers(earning.split()[0]) & percents:
+        conflicts.append("percent_mismatch")
+    if not valid_until and DATE_HINT_RE.search(t_low): conflicts.append("date_unparsed")
+    if re.search(r'her\s*\d', t_low) and not max_d and earning: conflicts.append("cycle_without_cap")
+
+    # --- AYRIŞTIRILMAYAN TUTARLAR ---
+    known = {min_s, max_d} | _numbers(earning) | _numbers(discount)
+    amounts = {int(a.replace('.', '')) for a in AMOUNT_RE.findall(t_low)}
+    unparsed = sorted(a for a in amounts if a not in known)
+
+    if not rules:
+        score = 0.0
+    else:
+        score = 1.0 - 0.2 * len(missing) - 0.25 * len(conflicts) - 0.05 * min(len(unparsed), 6)
+        score = round(max(0.0, min(1.0, score)), 2)
+    if score >= SKIP_THRESHOLD and not missing and not conflicts and not unparsed: ai = "skip"
+    elif score >= SHORT_THRESHOLD: ai = "short"
+    else: ai = "full"
+    return {"confidence": score, "ai": ai, "rules": rules, "missing": missing,
+            "conflicts": conflicts, "unparsed_amounts": unparsed}
+
+
+# --- HAM KAYITLAR (halkbank/paraf.py, vakifbank.py) ---
+def paraf_fields(text, title):
+    """paraf.com.tr metni için Paraf v25 çıkarıcıları (paraf.py ile aynı)."""
+    vf, vu = pf.extract_dates(text)
+    min_s, earn, disc, _, max_d = pf.extract_financials_v25(text, title)
+    return {"category": pf.get_category(text, title), "min_spend": min_s, "earning": earn, "discount": disc,
+            "max_discount": max_d, "valid_from": vf, "valid_until": vu,
+            "eligible_customers": sorted(pf.extract_cards(f"{title} {text}")),
+            "participation_method": pf.extract_participation(text)}
+
+
+def maximum_fields(text, title, date_text=None):
+    """Maximum v8 çıkarıcıları (Vakıfbank metinleri için de kullanılır, bkz. UNVALIDATED_FAMILIES)."""
+    date_text = date_text or text
+    min_s, earn, disc, max_d = mx.extract_financials_v8(text, title)
+    return {"category": mx.get_category(title, text), "min_spend": min_s, "earning": earn, "discount": disc,
+            "max_discount": max_d, "valid_from": mx.format_tarih_iso(date_text, False),
+            "valid_until": mx.format_tarih_iso(date_text, True),
+            "eligible_customers": mx.extract_cards_precise(text),
+            "participation_method": mx.extract_participation(text)}
+
+
+FIELD_EXTRACTORS = {"paraf": paraf_fields, "maximum": maximum_fields, "vakifbank": maximum_fields}
+
+
+def assess_family(family, fields, text, title=""):
+    """assess() + aile kısıtı: doğrulanmamış ailede `skip` / `short` kararı `full`'a indirilir."""
+    report = assess(fields, text, title)
+    if family in UNVALIDATED_FAMILIES and report["ai"] != "full":
+        report["ai"] = "full"
+        report["conflicts"] = report["conflicts"] + ["unvalidated_family"]
+    return report
+
+
+def assess_raw(family, text, title):
+    """Ham kayıt için çıkarılan alanları rapora (`fields`) ekleyerek döner."""
+    fields = FIELD_EXTRACTORS[family](text, title)
+    report = assess_family(family, fields, text, title)
+    report["fields"] = fields
+    return report
+
+
+# --- RAPOR ---
+def record(metrics, report):
+    """AI kararını çalışma metriklerine sayar (`ai_skip`, `ai_short`, `ai_full`)."""
+    if report: metrics.count(f"ai_{report['ai']}")
+
+
+def format_bypass(counters):
+    skip, short, full = (counters.get(f"ai_{k}", 0) for k in ("skip", "short", "full"))
+    total = skip + short + full
+    if not total: return "AI kararı yok"
+    return (f"AI atlanabilir {skip}/{total} (%{100 * skip / total:.0f}), "
+            f"kısaltılabilir {short} (%{100 * short / total:.0f}), tam {full}")
@@ -0,0 +1,91 @@
+"""Kural tabanlı alan çıkarımı, scraper çalıştırmadan: belge (başlık + koşul metni) -> kampanya alanları.
+
+Scraper'ların detay sayfasında kullandığı çıkarıcıların aynısıdır; aile bankaya göre seçilir:
+
+| Aile        | Bankalar            | Çıkarıcılar                                                          |
+|-------------|---------------------|-----------------------------------------------------------------------|
+| `maximum`   | maximum, isbankasi  | `extract_financials_v8`, `format_tarih_iso`, `get_category`, `extract_cards_precise`, `extract_merchant` |
+| `vakifbank` | vakifbank           | `maximum` ile aynı; güven kararı her zaman `full` (`confidence.UNVALIDATED_FAMILIES`) |
+| `paraf`     | paraf, halkbank     | `extract_financials_v25`, `format_tarih_iso`, `get_category`, `extract_cards` |
+
+Belge alanları: `title`, metin için sırayla `text`, `conditions` (liste), `detail_text`, `raw_text`,
+`description`; tarih metni için `date_text` (yoksa metin). `family` veya `bank` aileyi belirler.
+Çıkarım servisi (`common/extract_service.py`) ve toplu yeniden çıkarım (`scrape.py backfill`) bunu kullanır.
+"""
+from common import maximum as mx
+from common import paraf as pf
+from common.confidence import assess_family, paraf_fields, maximum_fields
+
+FAMILIES = ("maximum", "vakifbank", "paraf")
+BANK_FAMILIES = {"maximum": "maximum", "isbankasi": "maximum", "vakifbank": "vakifbank",
+                 "paraf": "paraf", "halkbank": "paraf"}
+_TR = str.maketrans("çÇğĞıİöÖşŞüÜ", "cCgGiIoOsSuU")
+TEXT_KEYS = ("text", "conditions", "detail_text", "raw_text", "description")
+# Aile başına üretilen alanlar (fark özetleri ve istemciler için sabit sıra)
+FIELDS = {
+    "maximum": ("category", "merchant", "min_spend", "earning", "discount", "max_discount", "valid_from",
+                "valid_until", "eligible_customers", "participation_method"),
+    "vakifbank": ("category", "merchant", "min_spend", "earning", "discount", "max_discount", "valid_from",
+                  "valid_until", "eligible_customers", "participation_method"),
+    "paraf": ("category", "min_spend", "earning", "discount", "max_discount", "valid_from", "valid_until",
+              "eligible_customers", "participation_method"),
+}
+
+WARMUP_DOC = {"title": "Market'te 1.000 TL'ye 100 TL İndirim",
+              "text": "1-31 Aralık 2026 tarihleri arasında her 1.000 TL ve üzeri harcamaya 100 TL, toplamda "
+                      "500 TL indirim; en fazla 500 TL. %10 indirim. Maximum Kart ile 3 taksit. MARKET yazıp 4402."}
+
+
+def family_for(doc, default=None):
+    """Belgenin ailesi: `family`, yoksa `bank` (büyük/küçük harf, 'Halkbank' gibi adlar da olur)."""
+    family = doc.get("family")
+    if family in FAMILIES: return family
+    # Veritabanı adları: "İş Bankası", "Vakıfbank", "Halkbank" -> "isbankasi", "vakifbank", "halkbank"
+    bank = (doc.get("bank") or "").translate(_TR).lower()
+    bank = "".join(c for c in bank if c.isalnum())
+    for key, value in BANK_FAMILIES.items():
+        if key in bank: return value
+    if default: return default
+    raise ValueError(f"Aile belirlenemedi (family/bank): {doc.get('id') or doc.get('url') or doc.get('title')}")
+
+
+def document_text(doc):
+    for key in TEXT_KEYS:
+        value = doc.get(key)
+        if isinstance(value, list): value = " ".join(v for v in value if isinstance(v, str))
+        if value: return value
+    return ""
+
+
+def extract_fields(doc, family=None):
+    """Belge -> alan sözlüğü (`FIELDS[family]` anahtarları)."""
+    family = family or family_for(doc)
+    title, text = doc.get("title") or "", document_text(doc)
+    if family == "paraf": return paraf_fields(text, title)
+    fields = maximum_fields(text, title, doc.get("date_text"))
+    fields["merchant"] = mx.extract_merchant(title)
+    return fields
+
+
+def extract_document(doc, family=None, confidence=False):
+    """Tek belge -> {"id", "family", "fields"[, "extraction"]}; hata belgeye yazılır, partiyi durdurmaz."""
+    result = {"id": doc.get("id") or doc.get("url")}
+    try:
+        result["family"] = family = family or family_for(doc)
+        result["fields"] = fields = extract_fields(doc, family)
+        if confidence: result["extraction"] = assess_family(family, fields, document_text(doc), doc.get("title") or "")
+    except Exception as e:
+        result["error"] = f"{type(e).__name__}: {e}"
+    return result
+
+
+def extract_batch(docs, family=None, confidence=False):
+    """Süreç havuzu işçilerinde çalışır: belge listesi -> sonuç listesi (aynı sıra)."""
+    return [extract_document(doc, family, confidence) for doc in docs]
+
+
+def warm():
+    """İşçi başlangıcı: her aileyi bir kez çalıştırıp `re` önbelleğini ve modülleri ısıtır."""
+    for family in FAMILIES:
+        extract_document(dict(WARMUP_DOC, family=family), confidence=True)
+    pf.format_tarih_iso("1 Ocak 2026", True)
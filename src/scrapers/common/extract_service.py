@@ -0,0 +1,192 @@
+"""Kalıcı çıkarım servisi: Python çıkarıcıları (`common/extract.py`) yerel HTTP veya Unix soketi üzerinden.
+
+TS hatları (yeniden işleme, kalite kontrolü) her kampanya için Python başlatmadan veya kuralları
+yeniden yazmadan aynı alanları alır. Süreç havuzundaki işçiler başlangıçta ısıtılır (modüller
+yüklü, desenler `re` önbelleğinde derli); istek belgeleri `--chunk` büyüklüğünde parçalara bölünüp
+işçilere dağıtılır, sonuçlar aynı sırayla döner. Eşzamanlı istekler aynı havuzu paylaşır.
+
+| Yol             | Açıklama                                                                   |
+|-----------------|-----------------------------------------------------------------------------|
+| `POST /extract` | `{"docs": [...], "family": ?, "confidence": ?}` -> `{"results": [...], "took_ms"}` |
+| `GET /health`   | işçi sayısı ve aileler                                                      |
+| `GET /stats`    | istek, belge, hata, başarısız istek, havuz yenileme sayıları ve belge/sn       |
+
+Belge biçimi ve aileler `common/extract.py`'de; TS istemcisi `src/utils/extractionService.ts`.
+
+    python3 src/scrapers/scrape.py serve --port 8765
+    python3 src/scrapers/scrape.py serve --socket /tmp/kartavantaj-extract.sock --workers 4
+"""
+import os
+import sys
+import json
+import time
+import signal
+import argparse
+import threading
+import socketserver
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from common.extract import FAMILIES, extract_batch, warm
+from common.resources import cpu_limit
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+DEFAULT_CHUNK = 32          # işçiye giden parça başına belge
+MAX_BODY = 64 * 2 ** 20     # bayt, istek gövdesi sınırı
+MAX_DOCS = 20000            # istek başına belge
+
+
+def _init_worker():
+    signal.signal(signal.SIGINT, signal.SIG_IGN)  # Ctrl+C yalnızca ana süreçte
+    warm()
+
+
+class ExtractionService:
+    """Isıtılmış süreç havuzu ve sayaçlar; HTTP katmanından bağımsız."""
+
+    def __init__(self, workers=None, chunk=DEFAULT_CHUNK):
+        self.workers = max(1, workers or int(cpu_limit()))
+        self.chunk = max(1, chunk)
+        self.pool = self._start_pool()
+        self.started = time.monotonic()
+        self.lock = threading.Lock()
+        self.stats = {"requests": 0, "docs": 0, "errors": 0, "failed": 0, "restarts": 0, "busy_s": 0.0}
+
+    def _start_pool(self):
+        pool = ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker)
+        # İşçileri istek gelmeden başlat (ilk isteğe ısınma süresi binmesin)
+        for f in [pool.submit(extract_batch, []) for _ in range(self.workers)]: f.result()
+        return pool
+
+    def _restart(self, broken):
+        """Çöken havuz (OOM, öldürülen işçi) yenisiyle değiştirilir; eşzamanlı istekler tek kez yeniler."""
+        with self.lock:
+            if self.pool is not broken: return
+            self.stats["restarts"] += 1
+        broken.shutdown(wait=False, cancel_futures=True)
+        pool = self._start_pool()
+        with self.lock: self.pool = pool
+
+    def extract(self, docs, family=None, confidence=False):
+        started = time.monotonic()
+        chunks = [docs[i:i + self.chunk] for i in range(0, len(docs), self.chunk)]
+        pool = self.pool
+        try:
+            futures = [pool.submit(extract_batch, c, family, confidence) for c in chunks]
+            results = [r for f in futures for r in f.result()]
+        except Exception as e:
+            with self.lock: self.stats["failed"] += 1
+            if isinstance(e, BrokenProcessPool): self._restart(pool)
+            raise
+        took = time.monotonic() - started
+        with self.lock:
+            self.stats["requests"] += 1
+            self.stats["docs"] += len(docs)
+            self.stats["errors"] += sum(1 for r in results if "error" in r)
+            self.stats["busy_s"] += took
+        return results, took
+
+    def health(self):
+        return {"ok": True, "workers": self.workers, "chunk": self.chunk, "families": list(FAMILIES), "pid": os.getpid()}
+
+    def summary(self):
+        with self.lock: stats = dict(self.stats)
+        stats["uptime_s"] = round(time.monotonic() - self.started, 1)
+        stats["busy_s"] = round(stats["busy_s"], 3)
+        stats["docs_per_s"] = round(stats["docs"] / stats["busy_s"], 1) if stats["busy_s"] else 0.0
+        return stats
+
+    def close(self):
+        self.pool.shutdown(cancel_futures=True)
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"   # keep-alive: istemci bağlantıyı yeniden kullanır
+    service = None
+
+    def _send(self, status, payload):
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        if self.path == "/health": return self._send(200, self.service.health())
+        if self.path == "/stats": return self._send(200, self.service.summary())
+        self._send(404, {"error": "bilinmeyen yol"})
+
+    def do_POST(self):
+        if self.path != "/extract": return self._send(404, {"error": "bilinmeyen yol"})
+        length = int(self.headers.get("Content-Length") or 0)
+        if length > MAX_BODY:
+            self.close_connection = True
+            return self._send(413, {"error": f"gövde {MAX_BODY} baytı aşıyor"})
+        try:
+            request = json.loads(self.rfile.read(length) or b"{}")
+            docs, family = request.get("docs"), request.get("family")
+            if not isinstance(docs, list) or not all(isinstance(d, dict) for d in docs):
+                raise ValueError("'docs' nesne listesi olmalı")
+            if family is not None and family not in FAMILIES: raise ValueError(f"bilinmeyen aile: {family}")
+            if len(docs) > MAX_DOCS: raise ValueError(f"istek başına en fazla {MAX_DOCS} belge")
+        except (ValueError, AttributeError) as e:
+            return self._send(400, {"error": str(e)})
+        try:
+            results, took = self.service.extract(docs, family, bool(request.get("confidence")))
+        except Exception as e:
+            # Havuz çöktüyse yenilenmiştir; istemci 500 alır ve isteği tekrarlayabilir
+            return self._send(500, {"error": f"{type(e).__name__}: {e}"})
+        self._send(200, {"results": results, "took_ms": round(took * 1000, 1)})
+
+    def log_message(self, format, *args):
+        pass  # istek başına log yok; sayaçlar /stats'ta
+
+
+class UnixHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+    def get_request(self):
+        request, _ = super().get_request()
+        return request, ("unix", 0)  # BaseHTTPRequestHandler adres bekler
+
+
+def serve(service, host=DEFAULT_HOST, port=DEFAULT_PORT, socket_path=None):
+    handler = type("ServiceHandler", (Handler,), {"service": service})
+    if socket_path:
+        if os.path.exists(socket_path): os.unlink(socket_path)
+        server = UnixHTTPServer(socket_path, handler)
+    else:
+        server = ThreadingHTTPServer((host, port), handler)
+        server.daemon_threads = True
+    return server
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="scrape.py serve", description="Kalıcı çıkarım servisi (HTTP / Unix soketi)")
+    parser.add_argument("--host", default=DEFAULT_HOST, help="Dinlenecek adres")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help="Dinlenecek port")
+    parser.add_argument("--socket", default=None, help="TCP yerine Unix soketi (yol)")
+    parser.add_argument("--workers", type=int, default=None, help="Süreç havuzu büyüklüğü (varsayılan: çekirdek sayısı)")
+    parser.add_argument("--chunk", type=int, default=DEFAULT_CHUNK, help="İşçiye giden parça başına belge")
+    args = parser.parse_args(argv)
+
+    service = ExtractionService(args.workers, args.chunk)
+    server = serve(service, args.host, args.port, args.socket)
+    where = f"unix:{args.socket}" if args.socket else f"http://{args.host}:{server.server_address[1]}"
+    print(f"🧩 Çıkarım servisi: {where} ({service.workers} işçi, parça {service.chunk})", file=sys.stderr, flush=True)
+    signal.signal(signal.SIGTERM, lambda *_: threading.Thread(target=server.shutdown, daemon=True).start())
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        service.close()
+        if args.socket and os.path.exists(args.socket): os.unlink(args.socket)
+        stats = service.summary()
+        print(f"⛔ Servis durdu: {stats['requests']} istek, {stats['docs']} belge ({stats['docs_per_s']} belge/sn)",
+              file=sys.stderr)
+    return 0
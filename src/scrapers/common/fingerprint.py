@@ -0,0 +1,250 @@
+"""Kampanya içerik parmak izi ve yakın-kopya indeksi.
+
+Aynı kampanya birden fazla URL'de (slug değişikliği, liste/arşiv bağlantısı, Maximum ve
+Maximiles gibi farklı siteler) görünebilir. Başlık + koşul metni normalize edilip (küçük harf,
+noktalama, binlik ayırıcı ve kart programı adları atılmış) kelime 3'lülerine bölünür:
+
+- `exact`: normalize metnin özeti; birebir kopyalar
+- `simhash`: 64 bitlik SimHash; kayıtta saklanır, TS denetim script'leri Hamming mesafesiyle
+  MinHash olmadan karşılaştırabilir
+- `minhash`: 128 permütasyonlu MinHash; Jaccard benzerliği tahmini
+
+`FingerprintIndex` MinHash imzalarını 21 banda (6'şar satır) bölen bir LSH ile saklar; her
+arama yalnızca en az bir bandı aynı olan adaylarla karşılaştırılır, on binlerce geçmiş
+kampanyada da sabit sürede kalır. Aynı kanonik URL kopya sayılmaz (aynı kampanyanın yenilemesi).
+"""
+import os
+import re
+import json
+import base64
+import random
+import hashlib
+from array import array
+import threading
+from datetime import datetime, timedelta
+
+from common.maximum import tr_lower
+from common.frontier import canonicalize_url
+
+NUM_PERM = 128
+# BANDS * ROWS <= NUM_PERM; Jaccard 0.75 çifti %98, 0.9 çifti ~%100, 0.5 çifti %28 olasılıkla aday olur
+BANDS, ROWS = 21, 6
+SHINGLE_SIZE = 3
+NEAR_THRESHOLD = 0.75       # MinHash Jaccard tahmini
+INDEX_MAX_AGE_DAYS = 365    # bu süredir görülmeyen kampanyalar indeksten düşer
+DUPLICATE_MODES = ("flag", "drop")
+SKIP_DUPLICATE = "duplicate"
+
+_PRIME = (1 << 61) - 1
+_MASK = (1 << 32) - 1  # imza değerleri 32 bite kırpılır; indeks dosyasında kampanya başına 512 bayt
+# Sabit tohum: imzalar çalışmalar ve makineler arasında karşılaştırılabilir kalmalı
+_rng = random.Random(20260101)
+_PERMS = [(_rng.randrange(1, _PRIME), _rng.randrange(0, _PRIME)) for _ in range(NUM_PERM)]
+
+_THOUSANDS_RE = re.compile(r'(?<=\d)[.,](?=\d{3}\b)')
+_URL_RE = re.compile(r'https?://\S+')
+_NON_WORD_RE = re.compile(r'[^\w%]+')
+# Aynı teklif farklı kart programlarında yayınlanır (Maximum/Maximiles, Paraf/Parafly ...);
+# program adları metni ayırt etmez, normalizasyonda atılır
+BRAND_WORDS = {"maximum", "maximiles", "maxipuan", "paraf", "parafly", "parafpara", "vakıfbank", "world",
+               "worldpuan", "halkbank", "iş", "bankası", "kart", "kartı", "kartla", "kartlar", "kartları", "kartlarla"}
+
+
+# --- PARMAK İZİ ---
+def normalize(title, text):
+    value = tr_lower(f"{title} {text}")
+    value = _THOUSANDS_RE.sub("", _URL_RE.sub(" ", value))
+    return " ".join(w for w in _NON_WORD_RE.sub(" ", value).split() if w not in BRAND_WORDS)
+
+
+def _hash64(value):
+    return int.from_bytes(hashlib.blake2b(value.encode('utf-8'), digest_size=8).digest(), 'little')
+
+
+def shingles(normalized, size=SHINGLE_SIZE):
+    words = normalized.split()
+    if len(words) <= size: return {_hash64(" ".join(words))} if words else set()
+    return {_hash64(" ".join(words[i:i + size])) for i in range(len(words) - size + 1)}
+
+
+def simhash(hashes):
+    weights = [0] * 64
+    for h in hashes:
+        for bit in range(64):
+            weights[bit] += 1 if h >> bit & 1 else -1
+    return sum(1 << bit for bit in range(64) if weights[bit] > 0)
+
+
+def minhash(hashes):
+    if not hashes: return [_MASK] * NUM_PERM
+    return [min((a * h + b) % _PRIME for h in hashes) & _MASK for a, b in _PERMS]
+
+
+def fingerprint(title, text):
+    """Başlık + metin -> {exact, simhash, minhash}."""
+    normalized = normalize(title, text)
+    hashes = shingles(normalized)
+    return {"exact": hashlib.blake2b(normalized.encode('utf-8'), digest_size=8).hexdigest(),
+            "simhash": f"{simhash(hashes):016x}", "minhash": minhash(hashes)}
+
+
+def jaccard(a, b):
+    return sum(x == y for x, y in zip(a, b)) / NUM_PERM
+
+
+def hamming(a, b):
+    return bin(int(a, 16) ^ int(b, 16)).count("1")
+
+
+# --- İNDEKS ---
+class FingerprintIndex:
+    """Kanonik URL -> parmak izi; exact eşleşme sözlüğü + MinHash LSH kovaları."""
+
+    def __init__(self, threshold=NEAR_THRESHOLD):
+        self.threshold = threshold
+        self.entries = {}   # key -> {"key", "url", "bank", "seen", "exact", "simhash", "minhash"}
+        self.exact = {}     # exact -> [key]
+        self.buckets = {}   # (band, satırlar) -> [key]
+        self.lock = threading.RLock()
+
+    def __len__(self):
+        return len(self.entries)
+
+    @staticmethod
+    def _bands(signature):
+        return [(band, tuple(signature[band * ROWS:(band + 1) * ROWS])) for band in range(BANDS)]
+
+    def add(self, entry):
+        with self.lock:
+            key = entry["key"]
+            if key in self.entries:
+                old = self.entries[key]
+                if old["exact"] == entry["exact"]:
+                    old["seen"] = entry.get("seen") or old.get("seen")
+                    return
+                self._unlink(old)
+            self.entries[key] = entry
+            self.exact.setdefault(entry["exact"], []).append(key)
+            for band in self._bands(entry["minhash"]): self.buckets.setdefault(band, []).append(key)
+
+    def _unlink(self, entry):
+        key = entry["key"]
+        self.exact[entry["exact"]].remove(key)
+        for band in self._bands(entry["minhash"]): self.buckets[band].remove(key)
+
+    def lookup(self, key, fp, prefer=()):
+        """En benzer başka kampanya: (entry, benzerlik, "exact" | "near") veya None.
+        Eşit eşleşmelerde `prefer` içindeki anahtarlar (bu çalışmada görülenler) seçilir."""
+        with self.lock:
+            exact = [other for other in self.exact.get(fp["exact"], ()) if other != key]
+            if exact:
+                other = next((k for k in exact if k in prefer), exact[0])
+                return self.entries[other], 1.0, "exact"
+            candidates = {other for band in self._bands(fp["minhash"]) for other in self.buckets.get(band, ())}
+            best, best_rank = None, None
+            for other in candidates - {key}:
+                entry = self.entries[other]
+                score = jaccard(fp["minhash"], entry["minhash"])
+                if score < self.threshold: continue
+                rank = (score, other in prefer)
+                if best is None or rank > best_rank: best, best_rank = (entry, score, "near"), rank
+            return best
+
+    def save(self, path):
+        """Dosyadaki (başka scraper'ların yazdığı) kayıtlarla birleştirip atomik yazar."""
+        if not path: return
+        merged = {e["key"]: e for e in _read_entries(path)}
+        with self.lock: merged.update(self.entries)
+        cutoff = (datetime.now() - timedelta(days=INDEX_MAX_AGE_DAYS)).strftime("%Y-%m-%d")
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        tmp = f"{path}.tmp"
+        with open(tmp, 'w', encoding='utf-8') as f:
+            for entry in merged.values():
+                if entry.get("seen", cutoff) < cutoff: continue
+                packed = base64.b64encode(array('I', entry["minhash"]).tobytes()).decode('ascii')
+                f.write(json.dumps(dict(entry, minhash=packed), ensure_ascii=False) + "\n")
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path, threshold=NEAR_THRESHOLD):
+        index = cls(threshold)
+        for entry in _read_entries(path): index.add(entry)
+        return index
+
+
+def _read_entries(path):
+    if not path or not os.path.exists(path): return []
+    entries = []
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            try:
+                entry = json.loads(line)
+                entry["minhash"] = array('I', base64.b64decode(entry["minhash"])).tolist()
+            except (ValueError, KeyError, TypeError): continue
+            if len(entry["minhash"]) == NUM_PERM: entries.append(entry)
+    return entries
+
+
+# --- ÇALIŞMA ---
+class Deduper:
+    """Yazmadan önce kayıt başına parmak izi + indeks araması; metriklere sayar."""
+
+    def __init__(self, index, mode="flag", metrics=None, index_path=None, history=0):
+        self.index = index
+        self.mode = mode
+        self.metrics = metrics
+        self.index_path = index_path
+        self.history = history
+        self.run_keys = set()
+        self.found = {"exact": 0, "near": 0}
+        self.dropped = 0
+
+    @property
+    def drop(self):
+        return self.mode == "drop"
+
+    def check(self, url, title, text, bank):
+        """Kayda yazılacak rapor: {exact, simhash} (+ kopyaysa duplicate_of, similarity, match, in_run)."""
+        fp = fingerprint(title, text)
+        key = canonicalize_url(url, bank)
+        with self.index.lock:
+            match = self.index.lookup(key, fp, self.run_keys)
+            self.index.add({"key": key, "url": url, "bank": bank, "seen": datetime.now().strftime("%Y-%m-%d"), **fp})
+            self.run_keys.add(key)
+            in_run = match is not None and match[0]["key"] in self.run_keys
+        report = {"exact": fp["exact"], "simhash": fp["simhash"]}
+        if match is None: return report
+        entry, score, kind = match
+        self.found[kind] += 1
+        if self.drop and in_run: self.dropped += 1
+        if self.metrics is not None: self.metrics.count(f"duplicates_{kind}")
+        report.update(duplicate_of=entry["url"], similarity=round(score, 2), match=kind, in_run=in_run)
+        return report
+
+    def is_dropped(self, report):
+        """Yalnızca bu çalışmada zaten yazılmış bir kampanyanın kopyası atılır; geçmişteki
+        eşleşme (ör. slug değişikliği) işaretlenir, yoksa kampanya çıktıdan tamamen kaybolurdu."""
+        return self.drop and bool(report and report.get("in_run"))
+
+    def save(self):
+        self.index.save(self.index_path)
+
+    def summary(self):
+        total = self.found["exact"] + self.found["near"]
+        return (f"Kopya: {total} ({self.found['exact']} birebir, {self.found['near']} yakın), {self.dropped} atıldı; "
+                f"indeks {len(self.index)} kampanya (geçmiş {self.history})")
+
+
+def add_fingerprint_arguments(parser):
+    parser.add_argument("--fingerprint-index", default=None,
+                        help="Çalışmalar (ve scraper'lar) arası parmak izi indeksi (JSON Lines); "
+                             "verilmezse yalnızca çalışma içi kopyalar bulunur")
+    parser.add_argument("--near-duplicates", choices=DUPLICATE_MODES, default="flag",
+                        help="Kopya kampanyalar: kayıtta işaretle (flag) veya yazma (drop)")
+    return parser
+
+
+def build_deduper(args, metrics=None):
+    path = getattr(args, "fingerprint_index", None)
+    index = FingerprintIndex.load(path)
+    return Deduper(index, getattr(args, "near_duplicates", "flag"), metrics, path, history=len(index))
@@ -0,0 +1,437 @@
+"""Crawl frontier: URL canonicalization, O(1) dedup and priority/deadline scheduling.
+
+Öncelik sırası: yeni kampanyalar > süresi yaklaşanlar > yenilemeler.
+`--shard i/N` ile detay aşaması N runner'a bölünür: her URL kanonik hâlinin sabit özetiyle
+tek bir shard'a düşer; liste her shard'da tam okunur, kuyruğa yalnızca kendi payı girer.
+`--incremental` ile liste kartı (başlık, tarih, görsel) önceki çalışmadakiyle aynı olan
+kampanyaların detayı açılmaz; kayıtları önceki çıktıdan taşınır (`carry_over`). Liste bütünüyle
+(sıra + kart imzaları) önceki çalışmayla aynıysa detay aşaması hiç başlamaz (`listing_unchanged`).
+"""
+import hashlib
+import heapq
+import json
+import math
+import os
+import re
+import threading
+import time
+from datetime import datetime, timedelta
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+
+# --- ÖNCELİKLER ---
+PRIORITY_NEW = 0
+PRIORITY_EXPIRING = 1
+PRIORITY_REFRESH = 2
+PRIORITY_NAMES = {PRIORITY_NEW: "new", PRIORITY_EXPIRING: "expiring", PRIORITY_REFRESH: "refresh"}
+
+EXPIRING_WINDOW_DAYS = 3
+DEFAULT_FETCH_ESTIMATE = 5.0  # sn, ilk ölçüm gelene kadar
+
+TRACKING_PARAMS = re.compile(r'^(utm_\w+|gclid|fbclid|yclid|mc_\w+|_ga|ref|referrer)$', re.IGNORECASE)
+
+# --- BANKA BAZLI KANONİK KURALLAR ---
+# drop_query: kampanya sayfaları path ile tanımlanır, query string tamamen atılır
+# keep_params: drop_query False ise korunacak parametreler (None = izleme dışındakilerin hepsi)
+CANONICAL_RULES = {
+    "maximum": {"drop_query": True, "strip_trailing_slash": True, "lowercase_path": True},
+    "paraf": {"drop_query": True, "strip_trailing_slash": True, "lowercase_path": False},
+    "vakifbank": {"drop_query": True, "strip_trailing_slash": True, "lowercase_path": True},
+}
+DEFAULT_RULE = {"drop_query": False, "keep_params": None, "strip_trailing_slash": True, "lowercase_path": False}
+
+
+def canonicalize_url(url, bank=None):
+    """Aynı kampanyaya giden URL varyantlarını tek bir anahtara indirger."""
+    if not url: return ""
+    rule = dict(DEFAULT_RULE, **CANONICAL_RULES.get(bank, {}))
+    parts = urlsplit(url.strip())
+    scheme = (parts.scheme or "https").lower()
+    if scheme == "http": scheme = "https"
+    host = parts.netloc.lower()
+    if host.endswith(":443"): host = host[:-4]
+
+    path = re.sub(r'/{2,}', '/', parts.path or "/")
+    if rule["lowercase_path"]: path = path.lower()
+    if rule["strip_trailing_slash"] and len(path) > 1: path = path.rstrip('/')
+
+    query = ""
+    if not rule["drop_query"] and parts.query:
+        keep = rule.get("keep_params")
+        params = [(k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+                  if not TRACKING_PARAMS.match(k) and (keep is None or k in keep)]
+        query = urlencode(sorted(params))
+
+    return urlunsplit((scheme, host, path, query, ""))
+
+
+# --- SHARD ---
+def _digest(canonical, size=8):
+    return int.from_bytes(hashlib.blake2b(canonical.encode('utf-8'), digest_size=size).digest(), 'big')
+
+
+def shard_of(canonical, count):
+    """Kanonik URL'in 1..count arasındaki shard'ı; makineler ve çalışmalar arası sabittir."""
+    return _digest(canonical) % count + 1
+
+
+def url_id(url, bank=None):
+    """Kanonik URL'den kalıcı kayıt ID'si (48 bit; JS'te güvenli tam sayı).
+    Sıra numarasının aksine shard'lar ve çalışmalar arasında aynı kampanyada aynı kalır."""
+    return _digest(canonicalize_url(url, bank), 6)
+
+
+def parse_shard(value):
+    """'2/4' -> (2, 4)."""
+    m = re.fullmatch(r'\s*(\d+)\s*/\s*(\d+)\s*', str(value))
+    if not m or not 1 <= int(m.group(1)) <= int(m.group(2)):
+        raise ValueError(f"Geçersiz shard: {value} (örn. 1/4)")
+    return int(m.group(1)), int(m.group(2))
+
+
+def shard_output_file(output_file, shard):
+    """Shard çıktısı: maximum_kampanyalar_raw.json -> maximum_kampanyalar_raw.shard-2-of-4.json"""
+    if not shard or not output_file: return output_file
+    stem, ext = os.path.splitext(output_file)
+    return f"{stem}.shard-{shard[0]}-of-{shard[1]}{ext or '.json'}"
+
+
+# --- LİSTE KARTLARI (artımlı çalışma) ---
+def card_signature(meta):
+    """Liste kartı metaverisinin özeti; meta yoksa None (yalnızca URL bilinir)."""
+    if not meta: return None
+    fields = {k: v for k, v in meta.items() if k != "url"}
+    payload = json.dumps(fields, ensure_ascii=False, sort_keys=True, default=str)
+    return hashlib.blake2b(payload.encode('utf-8'), digest_size=8).hexdigest()
+
+
+def listing_path(output_file):
+    return f"{os.path.splitext(output_file)[0]}.listing.json"
+
+
+def load_listing(path):
+    """Önceki çalışmanın liste anlık görüntüsü: {"cards": {kanonik: imza}, ...}."""
+    if not path or not os.path.exists(path): return {"cards": {}}
+    try:
+        with open(path, 'r', encoding='utf-8') as f: data = json.load(f)
+    except (OSError, ValueError):
+        return {"cards": {}}
+    return data if isinstance(data, dict) and isinstance(data.get("cards"), dict) else {"cards": {}}
+
+
+def _record_url(item):
+    return item.get("url") if isinstance(item, dict) else getattr(item, "url", None)
+
+
+def carry_over(previous, items, frontier):
+    """Artımlı çıktı: bu çalışmada çekilen kayıtlar + listede değişmeden görülen kampanyaların
+    önceki kaydı, liste sırasıyla. Artımlı mod kapalıysa `items` aynen döner."""
+    if frontier.known is None: return items
+    key = lambda item: canonicalize_url(_record_url(item), frontier.bank)
+    fetched = {key(i) for i in items}
+    carried = [i for i in previous or [] if isinstance(i, dict) and key(i) in frontier.unchanged and key(i) not in fetched]
+    order = {canonical: n for n, canonical in enumerate(frontier.listing_order())}
+    return sorted([*items, *carried], key=lambda item: order.get(key(item), len(order)))
+
+
+# --- BLOOM FİLTRESİ (arşiv ölçeğinde geçmiş) ---
+class BloomFilter:
+    """Sabit bellekli üyelik filtresi; yanlış pozitif olabilir, yanlış negatif olmaz."""
+
+    def __init__(self, capacity=200_000, error_rate=0.001):
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.size = max(8, int(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.hashes = max(1, int(round(self.size / capacity * math.log(2))))
+        self.bits = bytearray((self.size + 7) // 8)
+        self.count = 0
+
+    def _positions(self, key):
+        digest = hashlib.blake2b(key.encode('utf-8'), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:], 'little') | 1
+        return ((h1 + i * h2) % self.size for i in range(self.hashes))
+
+    def add(self, key):
+        new = False
+        for pos in self._positions(key):
+            byte, bit = divmod(pos, 8)
+            if not self.bits[byte] & (1 << bit):
+                self.bits[byte] |= 1 << bit
+                new = True
+        if new: self.count += 1
+        return new
+
+    def __contains__(self, key):
+        for pos in self._positions(key):
+            byte, bit = divmod(pos, 8)
+            if not self.bits[byte] & (1 << bit): return False
+        return True
+
+    def save(self, path):
+        header = json.dumps({"capacity": self.capacity, "error_rate": self.error_rate, "count": self.count})
+        tmp = f"{path}.tmp"
+        with open(tmp, 'wb') as f:
+            f.write(header.encode('utf-8') + b"\n")
+            f.write(self.bits)
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path, capacity=200_000, error_rate=0.001):
+        if not path or not os.path.exists(path):
+            return cls(capacity, error_rate)
+        with open(path, 'rb') as f:
+            meta = json.loads(f.readline().decode('utf-8'))
+            bloom = cls(meta["capacity"], meta["error_rate"])
+            bloom.bits = bytearray(f.read())
+            bloom.count = meta.get("count", 0)
+        return bloom
+
+
+# --- GEÇMİŞ ---
+def load_history(path, bank=None):
+    """Önceki çalışmanın çıktısından {kanonik_url: valid_until} sözlüğü üretir."""
+    history = {}
+    if not path or not os.path.exists(path): return history
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            items = json.load(f)
+    except (OSError, ValueError):
+        return history
+    for item in items if isinstance(items, list) else []:
+        url = item.get("url") if isinstance(item, dict) else None
+        if url: history[canonicalize_url(url, bank)] = item.get("valid_until")
+    return history
+
+
+def parse_duration(value):
+    """'90s', '25m', '1.5h', '7d' veya çıplak sayı (dakika) -> saniye."""
+    if value is None or value == "": return None
+    m = re.fullmatch(r'\s*(\d+(?:\.\d+)?)\s*([smhd]?)\s*', str(value).lower())
+    if not m: raise ValueError(f"Geçersiz süre: {value}")
+    amount, unit = float(m.group(1)), m.group(2) or "m"
+    return amount * {"s": 1, "m": 60, "h": 3600, "d": 86400}[unit]
+
+
+def _parse_iso(value):
+    if not value: return None
+    try: return datetime.strptime(value, "%Y-%m-%dT%H:%M:%SZ")
+    except (TypeError, ValueError): return None
+
+
+# --- FRONTIER ---
+class Frontier:
+    """Thread-safe öncelik kuyruğu; kanonik URL ile O(1) tekilleştirme yapar."""
+
+    def __init__(self, bank=None, history=None, bloom=None, deadline=None, started_at=None,
+                 expiring_days=EXPIRING_WINDOW_DAYS, shard=None, known=None, previous_listing=None):
+        self.bank = bank
+        self.shard = shard
+        # Artımlı modda önceki liste kartı imzaları {kanonik: imza}; None = kapalı
+        self.known = known
+        self.previous_listing = previous_listing or {"cards": {}}
+        self.history = history or {}
+        self.bloom = bloom
+        self.started_at = started_at or time.monotonic()
+        self.deadline_at = self.started_at + deadline if deadline else None
+        self.expiring_before = datetime.now() + timedelta(days=expiring_days)
+        self._heap = []
+        self._seen = {}
+        self.signatures = {}
+        self.unchanged = {}
+        self._seq = 0
+        self._lock = threading.Lock()
+        self._fetch_estimate = None
+        self._deferred = []     # tekrar denemesine ertelenen (url, meta)
+        self.deferred = set()   # bir kez ertelenmiş kanonik URL'ler; ikinci kez ertelenmez
+        self.retry_pass = False
+        self.counts = {name: 0 for name in PRIORITY_NAMES.values()}
+        self.duplicates = 0
+        self.other_shards = 0
+        self.popped = 0
+        self.deadline_hit = False
+
+    def __len__(self):
+        return len(self._heap) + len(self._deferred)
+
+    def __contains__(self, url):
+        return canonicalize_url(url, self.bank) in self._seen
+
+    @property
+    def seen(self):
+        """Bu çalışmada eklenen tekil URL sayısı (tüketilenler dahil)."""
+        return len(self._seen)
+
+    def classify(self, canonical):
+        if canonical not in self.history and not (self.bloom is not None and canonical in self.bloom):
+            return PRIORITY_NEW
+        vu = _parse_iso(self.history.get(canonical))
+        if vu and vu <= self.expiring_before:
+            return PRIORITY_EXPIRING
+        return PRIORITY_REFRESH
+
+    def add(self, url, meta=None, priority=None):
+        """URL'i ekler; zaten varsa False döner. Başka shard'ın URL'i görülmüş sayılır (True)
+        ama kuyruğa girmez; liste sayfalaması ve kaybolan hesabı shard'dan bağımsız kalır."""
+        canonical = canonicalize_url(url, self.bank)
+        if not canonical: return False
+        with self._lock:
+            if canonical in self._seen:
+                self.duplicates += 1
+                return False
+            self._seen[canonical] = url
+            signature = self.signatures[canonical] = card_signature(meta)
+            if self.shard and shard_of(canonical, self.shard[1]) != self.shard[0]:
+                self.other_shards += 1
+                return True
+            # Önceki çıktıda olan ve kartı değişmeyen kampanya yeniden açılmaz
+            if (self.known is not None and canonical in self.history
+                    and canonical in self.known and self.known[canonical] == signature):
+                self.unchanged[canonical] = url
+                return True
+            prio = self.classify(canonical) if priority is None else priority
+            # Süresi yaklaşanlar kendi içinde bitiş tarihine göre sıralanır
+            vu = _parse_iso(self.history.get(canonical)) if prio == PRIORITY_EXPIRING else None
+            order = vu.timestamp() if vu else 0.0
+            heapq.heappush(self._heap, (prio, order, self._seq, url, meta))
+            self._seq += 1
+            self.counts[PRIORITY_NAMES[prio]] += 1
+            return True
+
+    def remaining_time(self):
+        if self.deadline_at is None: return None
+        return self.deadline_at - time.monotonic()
+
+    def record_fetch(self, seconds):
+        """Sayfa başı maliyet tahminini (EWMA) günceller."""
+        with self._lock:
+            if self._fetch_estimate is None: self._fetch_estimate = seconds
+            else: self._fetch_estimate = 0.7 * self._fetch_estimate + 0.3 * seconds
+
+    def defer(self, url, meta=None):
+        """URL'i kuyruk bitince yapılacak tekrar geçişine bırakır; daha önce ertelendiyse False."""
+        canonical = canonicalize_url(url, self.bank)
+        with self._lock:
+            if canonical in self.deferred: return False
+            self.deferred.add(canonical)
+            self._deferred.append((url, meta))
+            return True
+
+    def pop(self):
+        """Sıradaki URL'i (url, meta) olarak döner; kuyruk boşsa veya süre yetmiyorsa None.
+        Kuyruk bittiğinde ertelenen URL'ler bir kez (tekrar geçişi) kuyruğa döner."""
+        with self._lock:
+            if not self._heap and self._deferred:
+                self.retry_pass = True
+                for url, meta in self._deferred:
+                    heapq.heappush(self._heap, (PRIORITY_REFRESH + 1, 0.0, self._seq, url, meta))
+                    self._seq += 1
+                self._deferred = []
+            if not self._heap: return None
+            if self.deadline_at is not None:
+                estimate = self._fetch_estimate or DEFAULT_FETCH_ESTIMATE
+                if time.monotonic() + estimate > self.deadline_at:
+                    self.deadline_hit = True
+                    return None
+            _, _, _, url, meta = heapq.heappop(self._heap)
+            self.popped += 1
+            return url, meta
+
+    def __iter__(self):
+        while True:
+            nxt = self.pop()
+            if nxt is None: return
+            yield nxt[0]
+
+    def items(self):
+        """(url, meta) çiftlerini öncelik sırasıyla tüketir."""
+        while True:
+            nxt = self.pop()
+            if nxt is None: return
+            yield nxt
+
+    def listing_order(self):
+        """Liste sayfasında görülme sırasıyla kanonik URL'ler."""
+        with self._lock: return list(self._seen)
+
+    def listing_fingerprint(self):
+        """Liste sayfasının özeti: sıralı kanonik URL'ler + kart imzaları."""
+        with self._lock:
+            payload = "\n".join(f"{canonical} {self.signatures.get(canonical) or ''}" for canonical in self._seen)
+        return hashlib.blake2b(payload.encode('utf-8'), digest_size=16).hexdigest()
+
+    def listing_unchanged(self, refresh_after=None):
+        """Liste önceki tam çalışmayla aynı ve yenilenmesi gereken kampanya yoksa True.
+
+        Yenileme gerekir: önceki çıktı yoksa, son tam (artımlı olmayan) çalışma `refresh_after`
+        saniyeden eskiyse veya listede bitişi yaklaşan (uzatılmış olabilecek) kampanya varsa."""
+        previous = self.previous_listing
+        if not self._seen or not self.history or previous.get("fingerprint") != self.listing_fingerprint():
+            return False
+        full_at = _parse_iso(previous.get("full_at"))
+        if refresh_after and (full_at is None or (datetime.now() - full_at).total_seconds() > refresh_after):
+            return False
+        now = datetime.now()
+        for canonical in self.listing_order():
+            vu = _parse_iso(self.history.get(canonical))
+            if vu and now < vu <= self.expiring_before: return False
+        return True
+
+    def save_listing(self, path):
+        """Liste kartı imzalarını ve liste özetini sonraki çalışma için yazar; liste boşsa yazmaz."""
+        if not path or not self._seen: return
+        fingerprint = self.listing_fingerprint()
+        with self._lock: cards = dict(self.signatures)
+        now = datetime.now().strftime("%Y-%m-%dT%H:%M:%SZ")
+        # Artımlı çalışma detayların hepsini yenilemez; son tam çalışmanın zamanı korunur
+        full_at = now if self.known is None else self.previous_listing.get("full_at")
+        tmp = f"{path}.tmp"
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump({"bank": self.bank, "saved_at": now, "full_at": full_at, "fingerprint": fingerprint,
+                       "cards": cards}, f, ensure_ascii=False, indent=1)
+        os.replace(tmp, path)
+
+    def save_archive(self, path):
+        if self.bloom is None or not path: return
+        for canonical in self._seen:
+            self.bloom.add(canonical)
+        self.bloom.save(path)
+
+    def summary(self):
+        parts = [f"{self.counts[n]} {n}" for n in PRIORITY_NAMES.values()]
+        line = f"{len(self._seen)} URL ({', '.join(parts)}; {self.duplicates} tekrar atıldı)"
+        if self.known is not None: line += f" — artımlı: {len(self.unchanged)} değişmedi, önceki kayıt taşınacak"
+        if self.shard: line += f" — shard {self.shard[0]}/{self.shard[1]}: {self.other_shards} URL diğer shard'larda"
+        if self.deferred: line += f" — {len(self.deferred)} URL tekrar geçişine ertelendi"
+        if self.deadline_hit:
+            line += f" — süre doldu, {len(self._heap) + len(self._deferred)} URL sonraki çalışmaya kaldı"
+        return line
+
+
+def add_frontier_arguments(parser):
+    parser.add_argument("--deadline", type=parse_duration, default=None,
+                        help="Zaman bütçesi (örn. 25m, 1500s, 1h; çıplak sayı = dakika). "
+                             "Süre yetmeyecekse kalan düşük öncelikli URL'ler atlanır.")
+    parser.add_argument("--seen-archive", default=None,
+                        help="Arşiv ölçeğinde görülen URL'ler için Bloom filtresi dosyası")
+    parser.add_argument("--shard", type=parse_shard, default=None,
+                        help="Detay aşamasının i/N'lik payını çek (örn. 2/4); çıktı <ad>.shard-2-of-4.json "
+                             "olur, `scrape.py merge` ile birleştirilir")
+    parser.add_argument("--incremental", action="store_true",
+                        help="Yalnızca yeni veya liste kartı değişen kampanyaların detayını çek; "
+                             "diğerlerinin kaydı önceki çıktıdan taşınır")
+    parser.add_argument("--force-details", action="store_true",
+                        help="Liste önceki çalışmayla aynı olsa da detay aşamasını çalıştır")
+    parser.add_argument("--refresh-after", type=parse_duration, default=parse_duration("7d"),
+                        help="Liste değişmese de bu süreden eski çıktıyı yeniden tara (örn. 3d, 12h)")
+    return parser
+
+
+def build_frontier(args, bank, history_file, started_at=None, listing_file=None):
+    """CLI argümanlarından ve önceki çıktı dosyasından frontier kurar; önceki liste anlık
+    görüntüsü (`--incremental` kart imzaları, liste özeti) `listing_file`'dan okunur."""
+    bloom = BloomFilter.load(args.seen_archive) if getattr(args, "seen_archive", None) else None
+    previous_listing = load_listing(listing_file)
+    known = previous_listing["cards"] if getattr(args, "incremental", False) else None
+    return Frontier(bank=bank, history=load_history(history_file, bank), bloom=bloom,
+                    deadline=getattr(args, "deadline", None), started_at=started_at,
+                    shard=getattr(args, "shard", None), known=known, previous_listing=previous_listing)
@@ -0,0 +1,318 @@
+"""Maximum (maximum.com.tr) ortak metin, tarih, finansal çıkarım ve filtre yardımcıları."""
+import re
+from datetime import datetime
+from urllib.parse import urljoin
+
+from common.frontier import canonicalize_url
+
+# --- YARDIMCI FONKSİYONLAR ---
+def tr_lower(text):
+    return text.replace('I', 'ı').replace('İ', 'i').lower() if text else ""
+
+def temizle_metin(text):
+    if not text: return ""
+    text = text.replace('\n', ' ').replace('\r', '')
+    text = re.sub(r'\s+', ' ', text).strip()
+    return text
+
+def format_rakam(rakam_int):
+    try: return f"{int(rakam_int):,}".replace(",", ".")
+    except: return None
+
+def format_tarih_iso(tarih_str, is_end=False):
+    if not tarih_str: return None
+    ts = tr_lower(tarih_str)
+    aylar = {'ocak':'01','şubat':'02','mart':'03','nisan':'04','mayıs':'05','haziran':'06',
+             'temmuz':'07','ağustos':'08','eylül':'09','ekim':'10','kasım':'11','aralık':'12'}
+    try:
+        m_dot = re.search(r'(\d{1,2})\.(\d{1,2})\.(\d{4})\s*-\s*(\d{1,2})\.(\d{1,2})\.(\d{4})', ts)
+        if m_dot:
+            g1, a1, y1, g2, a2, y2 = m_dot.groups()
+            if is_end: return f"{y2}-{a2.zfill(2)}-{g2.zfill(2)}T23:59:59Z"
+            else: return f"{y1}-{a1.zfill(2)}-{g1.zfill(2)}T00:00:00Z"
+        m = re.search(r'(\d{1,2})\s*([a-zğüşıöç]+)?\s*-\s*(\d{1,2})\s*([a-zğüşıöç]+)\s*(\d{4})', ts)
+        if m:
+            g1, a1, g2, a2, yil = m.groups()
+            if not a1: a1 = a2
+            if is_end: return f"{yil}-{aylar.get(a2,'12')}-{str(g2).zfill(2)}T23:59:59Z"
+            else: return f"{yil}-{aylar.get(a1,'01')}-{str(g1).zfill(2)}T00:00:00Z"
+    except: return None
+
+def get_category(title, text):
+    t = tr_lower(title + " " + text)
+    if any(x in t for x in ["market", "bakkal", "süpermarket", "migros"]): return "Market"
+    if any(x in t for x in ["restoran", "kafe", "yemek", "burger"]): return "Restoran & Kafe"
+    if any(x in t for x in ["akaryakıt", "benzin", "otogaz", "opet", "shell"]): return "Yakıt"
+    if any(x in t for x in ["giyim", "moda", "ayakkabı"]): return "Giyim & Moda"
+    if any(x in t for x in ["elektronik", "teknoloji", "telefon"]): return "Elektronik"
+    if any(x in t for x in ["seyahat", "otel", "uçak", "tatil"]): return "Seyahat"
+    if any(x in t for x in ["e-ticaret", "online", "internet", "trendyol"]): return "Online Alışveriş"
+    return "Diğer"
+
+def extract_merchant(title):
+    try:
+        match = re.search(r"(.+?)['’](?:ta|te|tan|ten|da|de|dan|den)\s", title, re.IGNORECASE)
+        if match:
+            merchant = match.group(1).strip()
+            if len(merchant.split()) < 5: return merchant
+    except: pass
+    return None
+
+# --- KART FİLTRESİ (EN GÜNCEL HALİ) ---
+def extract_cards_precise(text):
+    include_section = re.search(
+        r'(?:Kampanyaya|Kampanya)\s+(?:dâhil|dahil)\s+(?:olan|edilen)\s+(?:kartlar|işlemler|kartlar ve işlemler)\s*:?\s*(.*?)(?:Kampanyaya\s+(?:dâhil|dahil)\s+(?:olmayan)|$)',
+        text, re.IGNORECASE | re.DOTALL
+    )
+    target_text = include_section.group(1) if include_section else text
+    t_low = target_text.replace('İ', 'i').lower()
+
+    card_patterns = [
+        ("Maximiles Black", r"maximiles\s+black"), ("Maximiles", r"maximiles(?!.*\sblack)"),
+        ("Privia Black", r"privia\s+black"), ("Privia", r"privia(?!.*\sblack)"),
+        ("MercedesCard", r"mercedes\s*card|mercedes"),
+        ("İş'te Üniversiteli", r"iş['’\s]?te\s+üniversiteli"),
+        ("Maximum Genç", r"maximum\s+genç|genç\s+kart"),
+        ("Maximum Pati Kart", r"pati\s+kart"), ("Maximum TEMA Kart", r"tema\s+kart"),
+        ("Maximum Gold", r"maximum\s+gold"), ("Maximum Platinum", r"maximum\s+platinum"),
+        ("Maximum Premier", r"maximum\s+premier"), ("Bankamatik Kartı", r"bankamatik"),
+        ("MaxiPara", r"maxipara"), ("Ticari Kart", r"ticari|vadematik|şirket\s+kredi"),
+        ("Sanal Kart", r"sanal\s+kart"), ("TROY Logolu Kart", r"troy"),
+        ("Maximum Kart", r"maximum\s+kart|maximum\s+özellikli")
+    ]
+    found_cards = []
+    for name, pattern in card_patterns:
+        if re.search(pattern, t_low):
+            if name == "Maximiles" and "Maximiles Black" in found_cards: continue
+            if name == "Privia" and "Privia Black" in found_cards: continue
+            found_cards.append(name)
+    if not found_cards:
+        if "bireysel" in t_low and "kredi kartı" in t_low: found_cards.append("Maximum Kart")
+    return sorted(list(set(found_cards)))
+
+# --- FİNANSAL MOTOR V8 (HATASIZ) ---
+def extract_financials_v8(text, title):
+    text_clean = re.sub(r'(?<=\d)\.(?=\d)', '', text)
+    t_low = text_clean.replace('İ', 'i').lower()
+    title_low = title.replace('İ', 'i').lower()
+    min_s = 0; max_d = 0; earn = None; disc = None
+    
+    # 1. Taksit (Başlık Öncelikli)
+    title_taksit = re.search(r'(\d+)\s*(?:aya varan)?\s*taksit', title_low)
+    if title_taksit and int(title_taksit.group(1)) < 24:
+        disc = f"{title_taksit.group(1)} Taksit"
+    elif "taksit" in t_low:
+        pesin_m = re.findall(r'peşin fiyatına\s*(\d+)\s*taksit', t_low)
+        if pesin_m: disc = f"{max(map(int, pesin_m))} Taksit"
+        else:
+            taksit_m = re.findall(r'(\d+)\s*(?:aya varan|ay)?\s*taksit', t_low)
+            valid_t = [int(t) for t in taksit_m if 2 <= int(t) <= 18]
+            if valid_t: disc = f"{max(valid_t)} Taksit"
+    
+    if disc:
+        # Aralık Kontrolü (5.000 - 500.000 -> 5.000)
+        range_match = re.search(r'(\d+)\s*(?:-|ile)\s*(\d+)\s*tl.*?taksit', t_low)
+        if range_match: min_s = int(range_match.group(1))
+        else:
+            s_match = re.search(r'(\d+)\s*tl.*?taksit', t_low)
+            if s_match: min_s = int(s_match.group(1))
+
+    # 2. Fiyat Avantajı (S Sport Fix)
+    price_match = re.search(r'(\d+)\s*tl\s*yerine\s*(\d+)\s*tl', t_low)
+    if price_match:
+        old = int(price_match.group(1)); new = int(price_match.group(2))
+        if old - new > 0:
+            max_d = old - new; earn = f"{format_rakam(max_d)} TL İndirim (Fiyat Avantajı)"; min_s = new
+            return min_s, earn, disc, max_d
+
+    # 3. Yüzde (Çoklu/Tekli)
+    if not earn:
+        perc_match = re.search(r'%(\d+)', t_low)
+        if perc_match:
+            rate = int(perc_match.group(1))
+            cap_match = re.search(r'(?:en fazla|maksimum|max)\s*(\d+)\s*tl', t_low)
+            if cap_match:
+                cap = int(cap_match.group(1)); max_d = cap; min_s = int(cap * 100 / rate)
+                earn = f"{format_rakam(cap)} TL İndirim"
+            else:
+                earn = f"%{rate} İndirim"
+                entry = re.search(r'(\d+)\s*tl.*?alışveriş', t_low)
+                if entry: min_s = int(entry.group(1))
+
+    # 4. Puan (Maksimum Kazanç)
+    tier_pattern = r'(\d+)\s*tl.*?(\d+)\s*tl\s*(?:maxipuan|puan|indirim)'
+    tiers = re.findall(tier_pattern, t_low)
+    best_earn = 0; best_spend = 0
+    for s_str, e_str in tiers:
+        s = int(s_str); e = int(e_str)
+        if s > e and e > best_earn: best_earn = e; best_spend = s
+            
+    if best_earn > 0 and (max_d == 0 or best_earn > max_d):
+        max_d = best_earn; min_s = best_spend
+        suffix = "İndirim" if "indirim" in title_low else "MaxiPuan"
+        earn = f"{format_rakam(best_earn)} TL {suffix}"
+
+    # 5. Döngüsel
+    unit_match = re.search(r'her\s*(\d+)\s*tl', t_low)
+    total_match = re.search(r'toplam(?:da)?\s*(\d+)\s*tl', t_low)
+    if unit_match and total_match:
+        u_spend = int(unit_match.group(1)); total_cap = int(total_match.group(1))
+        u_earn_m = re.search(r'(\d+)\s*tl\s*(?:maxipuan|puan)', t_low)
+        u_earn = int(u_earn_m.group(1)) if u_earn_m else 0
+        if u_earn > 0 and u_earn < total_cap:
+             count = total_cap / u_earn
+             calc_spend = int(count * u_spend)
+             if total_cap >= max_d:
+                 max_d = total_cap; min_s = calc_spend
+                 suffix = "İndirim" if "indirim" in title_low else "MaxiPuan"
+                 earn = f"{format_rakam(total_cap)} TL {suffix}"
+
+    return min_s, earn, disc, max_d
+
+def extract_participation(text):
+    methods = []
+    t_low = tr_lower(text)
+    if "işcep" in t_low or "maximum mobil" in t_low: methods.append("Maximum Mobil / İşCep")
+    sms_match = re.search(r'([a-z0-9]+)\s*yazıp\s*(\d{4})', t_low)
+    if sms_match: methods.append(f"SMS ({sms_match.group(1).upper()} -> {sms_match.group(2)})")
+    if "otomatik" in t_low and not methods: return "Otomatik Katılım"
+    return ", ".join(list(set(methods))) if methods else "Detayları İnceleyin"
+
+# --- MENÜ FİLTRESİ ---
+MENU_KEYWORDS = [
+    'bireysel kart kampanyaları',
+    'tüm kampanyalar',
+    'kampanyalar',
+    'başlık yok',
+    'maximum mobil',
+    'ödeme kolaylıkları',
+    'vergi ödemeleri',
+    'online alışveriş',
+    'dijital alışveriş',
+    'otomotiv',
+    'market',
+    'turizm',
+    'seyahat',
+    'spor',
+    'eğlence',
+    'teknoloji',
+    'elektronik',
+    'giyim',
+    'ayakkabı',
+    'aksesuar',
+    'kozmetik',
+    'sağlık',
+    'ev',
+    'bahçe',
+    'mobilya',
+    'dekorasyon'
+]
+
+def is_menu_label(title):
+    """Başlık bilinen bir menü / kategori etiketinin kendisi mi (liste kartları için)"""
+    title_lower = title.lower().strip()
+    return title_lower in MENU_KEYWORDS or title_lower in ['market', 'turizm', 'teknoloji', 'giyim', 'spor', 'elektronik']
+
+def is_menu_item(title):
+    """Menü öğelerini filtrele (detay sayfası <h1>'i)"""
+    # Çok kısa başlıklar (menü olabilir); liste kartlarının kısa başlıkları gerçek kampanya olabilir
+    if len(title.strip()) < 20:
+        return True
+    return is_menu_label(title)
+
+# --- ATLAMA NEDENLERİ (liste ve detay aşaması aynı kuralları kullanır) ---
+SKIP_PAST = "past"
+SKIP_SHORT = "short"
+SKIP_MENU = "menu"
+SKIP_EXPIRED = "expired"
+
+def title_skip_reason(title, check_menu=True):
+    if "geçmiş" in title.lower(): return SKIP_PAST
+    if len(title) < 10: return SKIP_SHORT
+    if check_menu and is_menu_item(title): return SKIP_MENU
+    return None
+
+def is_expired(valid_until, now=None):
+    if not valid_until: return False
+    try: return datetime.strptime(valid_until, "%Y-%m-%dT%H:%M:%SZ") < (now or datetime.now())
+    except ValueError: return False
+
+# --- LİSTE KARTI META VERİSİ ---
+CARD_CLASS_RE = re.compile(r'card|item|campaign|kampanya', re.IGNORECASE)
+CARD_TITLE_SELECTORS = ["[class*='title']", "h2", "h3", "h4", "h5", "strong"]
+IMAGE_JUNK = ['logo', 'favicon', 'menu', 'icon', 'altmenu']
+
+def _card_container(a):
+    """Link sadece görseli sarıyorsa başlık/tarih kart kapsayıcısındadır."""
+    if temizle_metin(a.get_text()) and a.find('img'): return a
+    parent = a.find_parent(class_=CARD_CLASS_RE)
+    if parent is None: return a
+    # Kapsayıcı başka kampanyalara da link veriyorsa (liste/grid) tarihleri karıştırmamak için kullanma
+    hrefs = {x['href'] for x in parent.find_all('a', href=True) if "/kampanyalar/" in x['href']}
+    return parent if len(hrefs) == 1 else a
+
+def extract_card_meta(a, base_url):
+    """Liste kartından detay sayfasına gitmeden başlık, tarih ve görsel çıkarır."""
+    card = _card_container(a)
+
+    title = a.get('title') or ""
+    if not title:
+        for sel in CARD_TITLE_SELECTORS:
+            el = card.select_one(sel)
+            if el and temizle_metin(el.get_text()):
+                title = el.get_text()
+                break
+    if not title:
+        title = a.get_text(" ") or ""
+    title = temizle_metin(title)
+
+    image = None
+    img_tag = card.find('img')
+    if img_tag is not None:
+        src = img_tag.get('src') or img_tag.get('data-src')
+        if src and not any(x in src.lower() for x in IMAGE_JUNK):
+            image = urljoin(base_url, src)
+        if not title and img_tag.get('alt'):
+            title = temizle_metin(img_tag['alt'])
+
+    date_text = temizle_metin(card.get_text(" "))
+    return {
+        "url": urljoin(base_url, a['href']),
+        "title": title,
+        "image": image,
+        "valid_from": format_tarih_iso(date_text, False),
+        "valid_until": format_tarih_iso(date_text, True),
+    }
+
+def merge_card_meta(old, new):
+    """Aynı kampanyaya giden ikinci link (görsel + başlık linki) eksik alanları tamamlar."""
+    for key, value in new.items():
+        if value and not old.get(key): old[key] = value
+    return old
+
+def card_skip_reason(card, check_menu=True):
+    """Liste kartı verisiyle kesin olarak elenebilecek kampanyalar; bilinmeyen alan asla elemez.
+    Kart başlıkları kısaltılmış olabileceğinden menü için yalnızca açık etiket listesi kullanılır."""
+    title = card.get("title")
+    if title:
+        reason = title_skip_reason(title, check_menu=False)
+        if reason: return reason
+        if check_menu and is_menu_label(title): return SKIP_MENU
+    if is_expired(card.get("valid_until")): return SKIP_EXPIRED
+    return None
+
+def collect_listing_cards(soup, base_url, is_campaign_href):
+    """Liste sayfasındaki kampanya linklerini kanonik URL bazında birleştirilmiş kartlara çevirir."""
+    cards = {}
+    for a in soup.find_all('a', href=True):
+        if not is_campaign_href(a['href']): continue
+        card = extract_card_meta(a, base_url)
+        key = canonicalize_url(card["url"], "maximum")
+        if key in cards: merge_card_meta(cards[key], card)
+        else: cards[key] = card
+    return list(cards.values())
+
+def format_skip_report(skipped):
+    if not skipped: return "0 detay yüklemesi önlendi"
+    detail = ", ".join(f"{reason}: {n}" for reason, n in sorted(skipped.items()))
+    return f"{sum(skipped.values())} detay yüklemesi önlendi ({detail})"
@@ -0,0 +1,469 @@
+"""Tek geçişli Maximum taraması.
+
+Liste ve detay sayfaları bir kez yüklenir; sayfa verisi aynı geçişte birden fazla çıktı
+adaptörüne (hibrit, raw, full ve links JSON) dağıtılır. `maximum.py`, `isbankasi/maximum*.py`
+script'leri bu modülün ince sarmalayıcılarıdır.
+"""
+import ssl
+import time
+import random
+import argparse
+import platform
+from datetime import datetime
+from urllib.parse import urljoin
+from bs4 import BeautifulSoup
+
+from common.frontier import build_frontier, url_id, shard_output_file, listing_path, carry_over
+from common.sites import site_urls
+from common.metrics import RunMetrics
+from common.records import Campaign, FullCampaign, write_json
+from common.confidence import assess, record, format_bypass
+from common.reducer import add_reducer_arguments, build_reducer, format_reduction
+from common.fingerprint import build_deduper, SKIP_DUPLICATE
+from common.changes import open_changes, read_snapshot, skip_unchanged
+from common.cli import add_common_arguments, start_run
+from common.browser import import_uc, selenium_chrome, chrome_options
+from common.pageguard import PageGuard, PageRejected, check_driver
+from common.maximum import (
+    temizle_metin, format_tarih_iso, get_category, extract_merchant, extract_cards_precise,
+    extract_financials_v8, extract_participation, title_skip_reason, is_expired, card_skip_reason,
+    collect_listing_cards, format_skip_report, SKIP_EXPIRED,
+)
+
+# --- AYARLAR ---
+BASE_URL, CAMPAIGNS_URL = site_urls("maximum", BASE_URL="https://www.maximum.com.tr",
+                                    CAMPAIGNS_URL="https://www.maximum.com.tr/kampanyalar")
+DEFAULT_LIMIT = 1000
+MAX_RETRIES = 5
+# Geçerli detay sayfasının işaretleri (parse_detail_body'nin yedek seçicileri dahil); hiçbiri yoksa
+# seçici beklenir (common/pageguard.py)
+DETAIL_MARKERS = ("CampaignDescription", "gradient-title-text", "campaign-detail-content", "detail-text",
+                  "content-body")
+
+# --- SSL FIX ---
+try:
+    _create_unverified_https_context = ssl._create_unverified_context
+except AttributeError:
+    pass
+else:
+    ssl._create_default_https_context = _create_unverified_https_context
+
+
+# --- ÇIKTI ADAPTÖRLERİ ---
+class OutputAdapter:
+    """Ortak sayfa verisinden kendi JSON biçimini üreten tüketici."""
+    name = None
+    output_file = None
+    provider = None
+    needs_detail = True
+    check_menu = True
+    indent = 4
+
+    def __init__(self, limit=DEFAULT_LIMIT, shard=None):
+        self.limit = limit
+        self.items = []
+        # `--shard` çalışmasında çıktı shard dosyasına yazılır; birleşik dosya geçmiş olarak okunur
+        self.merged_file = self.output_file
+        self.output_file = shard_output_file(self.output_file, shard)
+
+    @property
+    def full(self):
+        return len(self.items) >= self.limit
+
+    def wants_card(self, card):
+        # Limit listede değil, detay kaydı eklenirken uygulanır (liste aşamasında items boştur)
+        return card_skip_reason(card, self.check_menu) is None
+
+    def skip_reason(self, page):
+        reason = title_skip_reason(page["title"], self.check_menu)
+        if reason: return reason
+        if is_expired(page["valid_until"]): return SKIP_EXPIRED
+        return None
+
+    def add_card(self, card):
+        pass
+
+    def write(self):
+        write_json(self.output_file, self.items, indent=self.indent)
+        print(f"   💾 {self.name}: {len(self.items)} kampanya -> {self.output_file}")
+
+
+class HybridJsonAdapter(OutputAdapter):
+    """maximum.py: Görsel v7 (ID selector) + Logic v8."""
+    name = "hybrid"
+    output_file = "maximum_kampanyalar_hibrit.json"
+    provider = "Maximum Kart"
+    record_type = Campaign
+
+    def image(self, page):
+        return page["campaign_image"] or page["card_image"]
+
+    def fields(self, page, item_id):
+        image = self.image(page)
+        return dict(
+            id=item_id,
+            title=page["title"],
+            provider=self.provider,
+            category=page["category"],
+            merchant=page["merchant"],
+            image=image,
+            images=[image] if image else [],
+            description=page["conditions"][0] if page["conditions"] else page["title"],
+            url=page["url"],
+            discount=page["discount"],
+            earning=page["earning"],
+            min_spend=page["min_spend"],
+            max_discount=page["max_discount"],
+            created_at=datetime.now().strftime("%Y-%m-%dT%H:%M:%SZ"),
+            valid_from=page["valid_from"],
+            valid_until=page["valid_until"],
+            participation_method=page["participation_method"],
+            conditions=page["conditions"],
+            eligible_customers=page["cards"],
+            source_url=BASE_URL,
+            extraction=page["extraction"],
+            fingerprint=page["fingerprint"],
+        )
+
+    def build(self, page, item_id):
+        return self.record_type(**self.fields(page, item_id))
+
+    def add(self, page):
+        """Detay kaydını ekler; limit doluysa False."""
+        if self.full: return False
+        self.items.append(self.build(page, url_id(page["url"], "maximum")))
+        return True
+
+
+class RawJsonAdapter(HybridJsonAdapter):
+    """isbankasi/maximum.py: OG görseli öncelikli, İş Bankası provider'ı."""
+    name = "raw"
+    output_file = "maximum_kampanyalar_raw.json"
+    provider = "İş Bankası"
+
+    def image(self, page):
+        return page["og_image"] or page["campaign_image"] or page["card_image"]
+
+
+class FullJsonAdapter(HybridJsonAdapter):
+    """isbankasi/maximum-full.py: AI işleme için ham HTML'in ilk 5000 karakteri (ve/veya `--detail-text` metni) eklenir."""
+    name = "full"
+    output_file = "maximum_campaigns_full.json"
+    check_menu = False
+    record_type = FullCampaign
+
+    def fields(self, page, item_id):
+        return dict(super().fields(page, item_id), raw_html=page["raw_html"], raw_text=page["raw_text"])
+
+
+class LinksJsonAdapter(OutputAdapter):
+    """isbankasi/maximum-links.py: sadece URL + kart görseli (maximum-v4.ts girdisi)."""
+    name = "links"
+    output_file = "maximum_links.json"
+    needs_detail = False
+    indent = 2
+
+    def add_card(self, card):
+        if not self.full: self.items.append({"url": card["url"], "image": card["image"]})
+
+
+ADAPTERS = {cls.name: cls for cls in (HybridJsonAdapter, RawJsonAdapter, FullJsonAdapter, LinksJsonAdapter)}
+
+
+# --- TARAYICI ---
+def make_driver(flavour):
+    if flavour == "uc":
+        uc = import_uc()
+        options = uc.ChromeOptions()
+        options.add_argument("--no-first-run")
+        options.add_argument("--password-store=basic")
+        options.add_argument('--ignore-certificate-errors')
+        options.add_argument("--window-position=-10000,0")
+        options.add_argument("--no-sandbox")
+        # MacOS'ta subprocess modu kapalı olmalı
+        driver = uc.Chrome(options=options, use_subprocess=platform.system() != "Darwin")
+    else:
+        options = chrome_options()
+        options.add_argument("--headless=new")
+        options.add_argument("--no-first-run")
+        options.add_argument("--password-store=basic")
+        options.add_argument('--ignore-certificate-errors')
+        options.add_argument("--window-position=-10000,0")
+        options.add_argument("--no-sandbox")
+        options.add_argument("--disable-dev-shm-usage")
+        options.add_argument("--disable-gpu")
+        options.add_argument("--disable-blink-features=AutomationControlled")
+        options.add_argument("--disable-extensions")
+        options.add_argument("--start-maximized")
+        options.add_argument("user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
+        driver = selenium_chrome(options)
+    driver.set_page_load_timeout(60)
+    return driver
+
+
+# --- LİSTE AŞAMASI ---
+def is_campaign_href(href):
+    h = href.lower()
+    return "/kampanyalar/" in href and "arsiv" not in h and "gecmis" not in h and "past" not in h and len(href) > 25
+
+def load_listing(driver, metrics):
+    from selenium.webdriver.common.by import By
+
+    with metrics.span("listing_get", CAMPAIGNS_URL): driver.get(CAMPAIGNS_URL)
+    print("   -> Liste yükleniyor...")
+    metrics.sleep(5)
+
+    # 🔥 GEÇMİŞ KAMPANYALAR BÖLÜMÜNÜ GİZLE
+    try:
+        driver.execute_script("""
+            const pastSections = document.querySelectorAll('[class*="past"], [class*="gecmis"], [class*="arsiv"], [id*="past"], [id*="gecmis"]');
+            pastSections.forEach(section => section.style.display = 'none');
+        """)
+    except Exception as e:
+        print(f"   -> Geçmiş kampanyalar bölümü bulunamadı (normal): {e}")
+
+    # Sonsuz Scroll (sayfa uzamıyorsa buton ölü demektir)
+    last_height = driver.execute_script("return document.body.scrollHeight")
+    while True:
+        try:
+            btn = driver.find_element(By.XPATH, "//button[contains(text(), 'Daha Fazla')]")
+            driver.execute_script("arguments[0].scrollIntoView(true);", btn)
+            metrics.sleep(1)
+            driver.execute_script("arguments[0].click();", btn)
+            metrics.count("load_more_clicks")
+            metrics.sleep(2)
+            new_height = driver.execute_script("return document.body.scrollHeight")
+            if new_height == last_height: break
+            last_height = new_height
+        except:
+            break
+    print("      Tüm liste yüklendi.")
+    with metrics.span("page_source"): html = driver.page_source
+    with metrics.span("parse"): return BeautifulSoup(html, 'html.parser')
+
+
+# --- DETAY AŞAMASI ---
+def fetch_detail(driver, url, delay, metrics, guard=None):
+    """Detay sayfası; challenge/hata/boş sayfa yüklenir yüklenmez PageRejected ile döner."""
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.support.ui import WebDriverWait
+    from selenium.webdriver.support import expected_conditions as EC
+
+    # Retry Logic (Bot Koruması İçin)
+    for attempt in range(MAX_RETRIES):
+        try:
+            with metrics.span("get", url): driver.get(url)
+            break
+        except Exception as e:
+            if attempt == MAX_RETRIES - 1: raise e
+            metrics.retry("get", url)
+            wait_time = 5 * (2 ** attempt)  # 5, 10, 20, 40...
+            print(f"      ⚠️ Bağlantı hatası, {wait_time}sn bekleniyor... ({attempt+1}/{MAX_RETRIES})")
+            metrics.sleep(wait_time, url)
+
+    verdict = check_driver(driver, url, metrics, guard)[0] if guard else None
+    metrics.sleep(random.uniform(*delay), url)
+
+    # 🔥 GÖRSEL İÇİN V7 TAKTİĞİ: SCROLL
+    driver.execute_script("window.scrollTo(0, 600);")
+    metrics.sleep(0.5, url)
+
+    if verdict is None or verdict.pending:
+        with metrics.span("wait", url):
+            try: WebDriverWait(driver, 5).until(EC.presence_of_element_located((By.CSS_SELECTOR, "span[id$='CampaignDescription']")))
+            except: metrics.count("wait_timeouts")
+    with metrics.span("page_source", url): html = driver.page_source
+    if guard and not verdict.ok:
+        with metrics.span("classify", url): guard.check(html, driver.title, final=True)
+    with metrics.span("parse", url): return BeautifulSoup(html, 'html.parser')
+
+def parse_detail_head(d_soup, url, card):
+    """Filtre kararları için gereken minimum alanlar (başlık, tarih)."""
+    title_el = d_soup.select_one('h1.gradient-title-text') or d_soup.find('h1')
+    date_el = d_soup.select_one("span[id$='KampanyaTarihleri']")
+    date_text = temizle_metin(date_el.text) if date_el else ""
+    return {
+        "url": url,
+        "title": temizle_metin(title_el.text) if title_el else "Başlık Yok",
+        "date_text": date_text,
+        "valid_from": format_tarih_iso(date_text, False),
+        "valid_until": format_tarih_iso(date_text, True),
+        "card_image": card.get("image") if card else None,
+    }
+
+def parse_detail_body(d_soup, page, reducer=None):
+    """Koşullar, görseller ve finansal alanlar; sayfa başına bir kez hesaplanır."""
+    # Metin, aşağıda <br>/<p> düzenlemelerinden önce tüm sayfadan indirgenir
+    page["raw_html"], page["raw_text"] = reducer.apply(d_soup, limit=5000) if reducer else (str(d_soup)[:5000], None)
+
+    desc_el = d_soup.select_one("span[id$='CampaignDescription']")
+    # Backup Selectors (Eğer ID değişirse)
+    if not desc_el:
+        desc_el = d_soup.select_one(".campaign-detail-content") or d_soup.select_one(".detail-text") or d_soup.select_one(".content-body")
+    conditions = []
+    if desc_el:
+        for br in desc_el.find_all("br"): br.replace_with("\n")
+        for p in desc_el.find_all("p"): p.insert(0, "\n")
+        raw_text = desc_el.get_text()
+        conditions = [temizle_metin(line) for line in raw_text.split('\n') if len(temizle_metin(line)) > 15]
+        full_text = " ".join(conditions)
+    else:
+        full_text = temizle_metin(d_soup.get_text())
+        conditions = [t for t in full_text.split('\n') if len(t)>20]
+
+    og_img = d_soup.select_one("meta[property='og:image']")
+    page["og_image"] = og_img['content'] if og_img and og_img.get('content') else None
+    img_el = d_soup.select_one("img[id$='CampaignImage']")
+    page["campaign_image"] = urljoin(BASE_URL, img_el['src']) if img_el and img_el.get('src') else None
+
+    title = page["title"]
+    min_s, earn, disc, max_d = extract_financials_v8(full_text, title)
+    page.update({
+        "conditions": conditions,
+        "category": get_category(title, full_text),
+        "merchant": extract_merchant(title),
+        "min_spend": min_s, "earning": earn, "discount": disc, "max_discount": max_d,
+        "cards": extract_cards_precise(full_text),
+        "participation_method": extract_participation(full_text),
+    })
+    page["extraction"] = assess(dict(page, eligible_customers=page["cards"]), full_text, title)
+    return page
+
+
+# --- ANA AKIŞ ---
+def crawl(adapters, args, driver_flavour="uc", delay=(1.5, 1.5), started_at=None, stream=None, metrics=None):
+    started_at = started_at or time.monotonic()
+    metrics = metrics or RunMetrics("maximum")
+    detail_adapters = [ad for ad in adapters if ad.needs_detail]
+    # Yalnızca full çıktısı HTML taşır; diğer çıktılar için indirgeme yapılmaz
+    reducer = build_reducer(args, metrics) if any(ad.name == "full" for ad in adapters) else None
+    dedup = build_deduper(args, metrics) if detail_adapters else None
+    # NDJSON akışı ilk çıktının kayıtlarını taşır
+    primary = adapters[0] if adapters else None
+    history_file = detail_adapters[0].merged_file if detail_adapters else None
+    listing_file = listing_path(detail_adapters[0].output_file) if detail_adapters else None
+    frontier = build_frontier(args, "maximum", history_file, started_at, listing_file)
+    # Değişiklik akışı ilk detay çıktısı (shard'da shard dosyası) için yazılır
+    changes = open_changes(args, "maximum", detail_adapters[0].output_file) if history_file else None
+
+    guard = PageGuard(metrics, frontier, expect=DETAIL_MARKERS)
+    driver = None
+    try:
+        with metrics.span("driver_start"): driver = make_driver(driver_flavour)
+        soup = load_listing(driver, metrics)
+        with metrics.span("extract"): cards = collect_listing_cards(soup, BASE_URL, is_campaign_href)
+
+        # 🔥 LİSTE ÖN FİLTRESİ: hiçbir adaptörün istemediği kart için detay açılmaz
+        listing_skips = {}
+        loose_menu = all(ad.check_menu for ad in detail_adapters)
+        for card in cards:
+            for ad in adapters: ad.add_card(card)
+            if stream and primary is not None and not primary.needs_detail and primary.items and primary.items[-1]["url"] == card["url"]:
+                stream.emit(primary.items[-1])
+            if not detail_adapters: continue
+            if any(ad.wants_card(card) for ad in detail_adapters):
+                frontier.add(card["url"], meta=card)
+            else:
+                reason = card_skip_reason(card, loose_menu)
+                listing_skips[reason] = listing_skips.get(reason, 0) + 1
+                metrics.skip(reason, card["url"], phase="listing")
+
+        print(f"   -> Toplam {len(cards)} kampanya linki bulundu.")
+        if detail_adapters:
+            print(f"   -> Liste filtresi: {format_skip_report(listing_skips)}")
+            print(f"   -> Frontier: {frontier.summary()}")
+            if skip_unchanged(args, frontier, metrics, changes): return
+
+        fetched = 0
+        for url, card in frontier.items():
+            if all(ad.full for ad in detail_adapters): break
+            fetch_started = time.monotonic()
+            try:
+                guard.wait(url)
+                d_soup = fetch_detail(driver, url, delay, metrics, guard)
+                fetched += 1
+                with metrics.span("extract", url):
+                    page = parse_detail_head(d_soup, url, card)
+                    accepting = [ad for ad in detail_adapters if not ad.full and ad.skip_reason(page) is None]
+                if not accepting:
+                    reasons = sorted(r for r in {ad.skip_reason(page) for ad in detail_adapters if not ad.full} if r)
+                    for reason in reasons: metrics.skip(reason, url)
+                    metrics.page(url, "skipped")
+                    print(f"      ⚠️ Atlandı ({', '.join(reasons)}): {page['title']}")
+                    continue
+
+                with metrics.span("extract", url):
+                    parse_detail_body(d_soup, page, reducer)
+                    page["fingerprint"] = dedup.check(url, page["title"], " ".join(page["conditions"]), "maximum")
+                if dedup.is_dropped(page["fingerprint"]):
+                    metrics.skip(SKIP_DUPLICATE, url); metrics.page(url, "skipped")
+                    print(f"      = Kopya atlandı: {page['title'][:35]} -> {page['fingerprint']['duplicate_of']}")
+                    continue
+                accepting = [ad for ad in accepting if ad.add(page)]
+                metrics.page(url)
+                record(metrics, page["extraction"])
+                if stream and primary in accepting: stream.emit(primary.items[-1])
+                image = page["campaign_image"] or page["og_image"] or page["card_image"]
+                print(f"      [{fetched}] {page['title'][:35]}... (M:{page['min_spend']} E:{page['earning']} Img:{'✅' if image else '❌'}) -> {', '.join(ad.name for ad in accepting)}")
+            except PageRejected as e:
+                if guard.handle(e.verdict, url, card):
+                    try: driver.quit()
+                    except: pass
+                    with metrics.span("driver_start"): driver = make_driver(driver_flavour)
+            except Exception as e:
+                metrics.page(url, "error")
+                print(f"      ⚠️ Hata: {e}")
+                continue
+            finally:
+                frontier.record_fetch(time.monotonic() - fetch_started)
+
+        if frontier.deadline_hit:
+            print(f"   ⏱️ Zaman bütçesi doldu: {frontier.summary()}")
+
+        # --incremental: listede değişmeden görülen kampanyaların önceki kaydı taşınır
+        for ad in detail_adapters: ad.items = carry_over(read_snapshot(ad.merged_file), ad.items, frontier)
+        with metrics.span("write"):
+            for ad in adapters: ad.write()
+        frontier.save_listing(listing_file)
+        frontier.save_archive(getattr(args, "seen_archive", None))
+        if dedup: dedup.save()
+        print(f"\n✅ İŞLEM TAMAMLANDI! {fetched} detay sayfası bir kez yüklendi, {len(adapters)} çıktıya dağıtıldı.")
+        if detail_adapters: print(f"   🤖 {format_bypass(metrics.counters)}")
+        if reducer and reducer.mode != "off": print(f"   ✂️ {format_reduction(metrics.counters)}")
+        if dedup: print(f"   🧬 {dedup.summary()}")
+        if detail_adapters: print(f"   🛡️ {guard.summary()}")
+        if changes: changes.write(detail_adapters[0].items, frontier)
+
+    except Exception as main_e:
+        print(f"❌ Kritik Hata: {main_e}")
+    finally:
+        if driver:
+            try: driver.quit()
+            except: pass
+        if stream: stream.close()
+        metrics.write()
+
+
+def parse_outputs(value):
+    names = [n.strip() for n in value.split(",") if n.strip()]
+    unknown = [n for n in names if n not in ADAPTERS]
+    if unknown or not names:
+        raise argparse.ArgumentTypeError(f"Bilinmeyen çıktı: {', '.join(unknown) or value} (seçenekler: {', '.join(ADAPTERS)})")
+    return names
+
+def run_cli(default_outputs, driver="uc", delay=(1.5, 1.5), banner=None):
+    started_at = time.monotonic()
+    parser = argparse.ArgumentParser(description="Maximum kampanyalarını tek geçişte tarar")
+    parser.add_argument("--limit", type=int, default=DEFAULT_LIMIT, help="Çıktı başına kampanya limiti")
+    parser.add_argument("--outputs", type=parse_outputs, default=list(default_outputs),
+                        help=f"Aynı geçişte yazılacak çıktılar, virgülle ({', '.join(ADAPTERS)})")
+    parser.add_argument("--driver", choices=["uc", "selenium"], default=driver, help="Tarayıcı türü")
+    add_common_arguments(parser)
+    add_reducer_arguments(parser)
+    args = parser.parse_args()
+
+    adapters = [ADAPTERS[name](limit=args.limit, shard=args.shard) for name in args.outputs]
+    stream, metrics = start_run(args, "maximum", adapters[0].output_file)
+    print(banner or f"🚀 Maximum Kart - Ortak Tarama ({', '.join(args.outputs)}, Limit: {args.limit})...")
+    crawl(adapters, args, driver_flavour=args.driver, delay=delay, started_at=started_at, stream=stream,
+          metrics=metrics)
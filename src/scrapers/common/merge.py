@@ -0,0 +1,152 @@
+"""`--shard i/N` çıktılarını tek dosyada birleştirir.
+
+Shard dosyaları (`<çıktı>.shard-i-of-N.json`) okunur; kayıtlar kanonik URL'e göre sıralanıp
+tekilleştirilir (sıra, hangi shard'ın önce bittiğinden bağımsızdır). Shard'lar birbirinin
+kayıtlarını görmediği için içerik kopyaları burada `common/fingerprint.py` ile aranır ve
+`--near-duplicates` ile işaretlenir/atılır. Shard'ların değişiklik akışları da birleştirilir.
+
+    python3 src/scrapers/scrape.py merge maximum_kampanyalar_raw.json --bank maximum
+    python3 src/scrapers/scrape.py merge out.json a.shard-1-of-2.json a.shard-2-of-2.json
+"""
+import os
+import re
+import glob
+import json
+import argparse
+from datetime import datetime
+
+from common.records import write_json
+from common.frontier import canonicalize_url
+from common.fingerprint import FingerprintIndex, fingerprint, DUPLICATE_MODES
+from common.changes import read_snapshot, changes_path, write_feed, format_summary, _text
+
+SHARD_RE = re.compile(r'\.shard-(\d+)-of-(\d+)\.json$')
+
+
+def shard_files(output_file):
+    """Çıktının yanındaki shard dosyaları, shard sırasıyla."""
+    stem = os.path.splitext(output_file)[0]
+    files = [f for f in glob.glob(f"{glob.escape(stem)}.shard-*-of-*.json") if SHARD_RE.search(f)]
+    return sorted(files, key=lambda f: tuple(int(n) for n in SHARD_RE.search(f).groups()[::-1]))
+
+
+def missing_shards(files):
+    """Dosya adlarından eksik shard'lar: [(i, N)]."""
+    found = {tuple(int(n) for n in SHARD_RE.search(f).groups()) for f in files if SHARD_RE.search(f)}
+    totals = {n for _, n in found}
+    return sorted((i, n) for n in totals for i in range(1, n + 1) if (i, n) not in found)
+
+
+def merge_items(groups, bank=None, mode="flag"):
+    """Shard kayıt listelerinden birleşik liste ve sayaçlar.
+
+    Aynı kanonik URL birden fazla dosyadaysa `created_at`'i en yeni olan tutulur; başlığı olan
+    kayıtlar shard'lar arası içerik kopyası için aranır, `drop` modunda kopyalar atılır.
+    """
+    by_key, url_duplicates = {}, 0
+    for items in groups:
+        for item in items:
+            if not isinstance(item, dict) or not item.get("url"): continue
+            key = canonicalize_url(item["url"], bank)
+            old = by_key.get(key)
+            if old is not None:
+                url_duplicates += 1
+                if (old.get("created_at") or "") >= (item.get("created_at") or ""): continue
+            by_key[key] = item
+
+    index, merged, found, dropped = FingerprintIndex(), [], 0, 0
+    for key in sorted(by_key):
+        item = by_key[key]
+        if not item.get("title"):
+            merged.append(item)
+            continue
+        fp = fingerprint(item["title"], _text(item))
+        match = index.lookup(key, fp)
+        index.add({"key": key, "url": item["url"], "bank": bank, **fp})
+        if match is not None:
+            entry, score, kind = match
+            found += 1
+            if mode == "drop":
+                dropped += 1
+                continue
+            report = dict(item.get("fingerprint") or {"exact": fp["exact"], "simhash": fp["simhash"]})
+            report.update(duplicate_of=entry["url"], similarity=round(score, 2), match=kind, in_run=True)
+            item = dict(item, fingerprint=report)
+        merged.append(item)
+    return merged, {"url_duplicates": url_duplicates, "content_duplicates": found, "dropped": dropped}
+
+
+def merge_feeds(feeds, kept_urls, bank=None):
+    """Shard değişiklik akışlarını toplar; birleştirmede atılan kayıtlar added/modified'dan çıkar.
+    Shard değiştiren slug taşımaları bir shard'da kaybolan, diğerinde yeni görünür."""
+    added = [i for f in feeds for i in f["added"] if i.get("url") in kept_urls]
+    modified = [m for f in feeds for m in f["modified"] if m["url"] in kept_urls]
+    removed = [r for f in feeds for r in f["removed"]]
+    key = lambda i: canonicalize_url(i["url"], bank)
+    return {
+        "bank": bank,
+        "generated_at": datetime.now().strftime("%Y-%m-%dT%H:%M:%S"),
+        "summary": {"added": len(added), "modified": len(modified), "removed": len(removed),
+                    "unchanged": sum(f["summary"]["unchanged"] for f in feeds),
+                    "unfetched": sum(f["summary"]["unfetched"] for f in feeds),
+                    "removals_checked": all(f["summary"]["removals_checked"] for f in feeds)},
+        "added": sorted(added, key=key),
+        "modified": sorted(modified, key=key),
+        "removed": sorted(removed, key=key),
+    }
+
+
+def _read_feed(path):
+    if not os.path.exists(path): return None
+    try:
+        with open(path, 'r', encoding='utf-8') as f: return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="scrape.py merge", description="Shard çıktılarını tek dosyada birleştirir")
+    parser.add_argument("output", help="Birleşik çıktı (örn. maximum_kampanyalar_raw.json)")
+    parser.add_argument("inputs", nargs="*", help="Shard dosyaları (varsayılan: <çıktı>.shard-*-of-*.json)")
+    parser.add_argument("--bank", default=None, help="Kanonik URL kuralları (maximum, paraf, vakifbank)")
+    parser.add_argument("--near-duplicates", choices=DUPLICATE_MODES, default="flag",
+                        help="Shard'lar arası kopya kampanyalar: işaretle (flag) veya yazma (drop)")
+    parser.add_argument("--indent", type=int, default=4, help="JSON girintisi (maximum_links.json için 2)")
+    parser.add_argument("--allow-missing", action="store_true", help="Eksik shard varken de birleştir")
+    args = parser.parse_args(argv)
+
+    files = args.inputs or shard_files(args.output)
+    if not files:
+        print(f"❌ Shard dosyası bulunamadı: {os.path.splitext(args.output)[0]}.shard-*-of-*.json")
+        return 1
+    missing = missing_shards(files)
+    if missing and not args.allow_missing:
+        print(f"❌ Eksik shard: {', '.join(f'{i}/{n}' for i, n in missing)} (--allow-missing ile yine de birleştir)")
+        return 1
+
+    groups = []
+    for path in files:
+        items = read_snapshot(path)
+        if items is None:
+            print(f"❌ Okunamadı (JSON liste bekleniyor): {path}")
+            return 1
+        groups.append(items)
+        print(f"   📥 {path}: {len(items)} kayıt")
+
+    merged, counts = merge_items(groups, args.bank, args.near_duplicates)
+    write_json(args.output, merged, indent=args.indent)
+    print(f"🧩 {len(files)} shard -> {len(merged)} kampanya: {args.output}")
+    print(f"   Tekrar URL: {counts['url_duplicates']}, shard'lar arası kopya: {counts['content_duplicates']} "
+          f"({counts['dropped']} atıldı)")
+    if missing: print(f"   ⚠️ Eksik shard: {', '.join(f'{i}/{n}' for i, n in missing)}")
+
+    feeds = [_read_feed(changes_path(path)) for path in files]
+    if feeds and all(feeds):
+        feed = merge_feeds(feeds, {i["url"] for i in merged}, args.bank)
+        if missing: feed["summary"]["removals_checked"] = False
+        path = changes_path(args.output)
+        write_feed(path, feed)
+        print(f"   🔁 {format_summary(feed)} -> {path}")
+    elif any(feeds):
+        print("   🔁 Bazı shard'larda değişiklik akışı yok, birleşik akış yazılmadı.")
+    return 0
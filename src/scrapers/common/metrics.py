@@ -0,0 +1,242 @@
+"""Aşama bazlı süre ölçümü ve çalışma başına makine tarafından okunabilir metrik dosyası.
+
+Her scraper aşamaları (`get`, `sleep`, `wait`, `page_source`, `parse`, `extract`, `write` ...)
+`metrics.span()` ile sarar. Çalışma sonunda `<çıktı>.metrics.json` dosyasına aşama
+histogramları, URL bazında süreler, tekrar denemeleri, atlama nedenleri ve Python / Chrome
+tepe RSS değerleri yazılır.
+"""
+import os
+import sys
+import json
+import time
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+
+# Histogram kova üst sınırları (ms); son kova sınırsız
+BUCKETS_MS = (10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000)
+RSS_SAMPLE_INTERVAL = 2.0  # sn; /proc taraması sayfa başına değil en fazla bu sıklıkta
+CHROME_MARKERS = ("chrome", "chromium", "chromedriver", "headless_shell")
+
+# Atlama nedenleri (Maximum'daki past/short/menu/expired'a ek olarak)
+SKIP_NO_TITLE = "no_title"
+
+
+# --- SÜREÇ AĞACI (/proc, yalnızca Linux) ---
+def children_map():
+    """{ppid: [pid, ...]}; /proc yoksa boş sözlük."""
+    children = {}
+    try: entries = os.listdir("/proc")
+    except OSError: return children
+    for entry in entries:
+        if not entry.isdigit(): continue
+        try:
+            with open(f"/proc/{entry}/stat", "rb") as f: stat = f.read().decode("utf-8", "replace")
+        except OSError:
+            continue
+        ppid = int(stat[stat.rindex(")") + 2:].split()[1])
+        children.setdefault(ppid, []).append(int(entry))
+    return children
+
+
+def proc_usage(pid):
+    """(rss_bayt, cpu_sn, komut_adı) veya süreç yoksa None."""
+    try:
+        with open(f"/proc/{pid}/stat", "rb") as f: stat = f.read().decode("utf-8", "replace")
+        with open(f"/proc/{pid}/statm", "rb") as f: rss_pages = int(f.read().split()[1])
+    except (OSError, IndexError, ValueError):
+        return None
+    name = stat[stat.index("(") + 1:stat.rindex(")")]
+    fields = stat[stat.rindex(")") + 2:].split()
+    return rss_pages * os.sysconf("SC_PAGE_SIZE"), (int(fields[11]) + int(fields[12])) / os.sysconf("SC_CLK_TCK"), name
+
+
+def descendants(pid, children=None):
+    children = children if children is not None else children_map()
+    stack, found = list(children.get(pid, [])), []
+    while stack:
+        child = stack.pop()
+        found.append(child)
+        stack.extend(children.get(child, []))
+    return found
+
+
+def _self_rss():
+    usage = proc_usage(os.getpid())
+    if usage: return usage[0]
+    import resource
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+# --- HİSTOGRAM ---
+class StageStats:
+    """Tek bir aşamanın süre dağılımı."""
+
+    def __init__(self):
+        self.durations = []
+        self.buckets = [0] * (len(BUCKETS_MS) + 1)
+
+    def add(self, seconds):
+        self.durations.append(seconds)
+        ms = seconds * 1000
+        for i, bound in enumerate(BUCKETS_MS):
+            if ms <= bound:
+                self.buckets[i] += 1
+                return
+        self.buckets[-1] += 1
+
+    def summary(self):
+        values = sorted(self.durations)
+        n = len(values)
+        pick = lambda q: round(values[min(n - 1, int(q * n))] * 1000, 1) if n else 0.0
+        labels = [f"le_{b}ms" for b in BUCKETS_MS] + ["inf"]
+        return {
+            "count": n, "total_s": round(sum(values), 3),
+            "mean_ms": round(sum(values) / n * 1000, 1) if n else 0.0,
+            "p50_ms": pick(0.50), "p95_ms": pick(0.95), "p99_ms": pick(0.99),
+            "max_ms": round(values[-1] * 1000, 1) if n else 0.0,
+            "histogram": dict(zip(labels, self.buckets)),
+        }
+
+
+# --- ÇALIŞMA METRİKLERİ ---
+class RunMetrics:
+    """Thread-safe aşama/URL/atlama/RSS toplayıcı; `path` None ise dosya yazılmaz."""
+
+    def __init__(self, scraper, path=None):
+        self.scraper = scraper
+        self.path = path
+        self.started_at = datetime.now()
+        self._t0 = time.monotonic()
+        self._lock = threading.Lock()
+        self.stages = {}
+        self.urls = {}
+        self.retries = {}
+        self.skips = {}
+        self.pages = {}
+        self.counters = {}
+        self.result = "ok"  # liste değişmediği için detay atlandıysa "no_change"
+        self.active = {}  # thread id -> şu anki aşama (profiler etiketleri için)
+        self.profiler = None  # common.profiler.Profiler; --profile ile bağlanır
+        self.autotune = None  # --workers auto: ayar eğrisi (common/autotune.py)
+        self.rss_peak = {"python": 0, "chrome": 0}
+        self._last_rss_sample = 0.0
+
+    def _url(self, url):
+        entry = self.urls.get(url)
+        if entry is None: entry = self.urls[url] = {"stages": {}, "retries": 0, "status": None}
+        return entry
+
+    @contextmanager
+    def span(self, stage, url=None):
+        tid = threading.get_ident()
+        previous = self.active.get(tid)
+        self.active[tid] = stage
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - started
+            if previous is None: self.active.pop(tid, None)
+            else: self.active[tid] = previous
+            with self._lock:
+                stats = self.stages.get(stage)
+                if stats is None: stats = self.stages[stage] = StageStats()
+                stats.add(elapsed)
+                if url:
+                    spent = self._url(url)["stages"]
+                    spent[stage] = spent.get(stage, 0.0) + elapsed
+
+    def sleep(self, seconds, url=None):
+        """Sabit beklemeleri ayrı bir aşama olarak sayar."""
+        with self.span("sleep", url): time.sleep(seconds)
+
+    def stage(self, thread_id=None):
+        return self.active.get(thread_id or threading.get_ident())
+
+    def retry(self, stage, url=None):
+        with self._lock:
+            self.retries[stage] = self.retries.get(stage, 0) + 1
+            if url: self._url(url)["retries"] += 1
+
+    def skip(self, reason, url=None, phase="detail"):
+        with self._lock:
+            by_reason = self.skips.setdefault(phase, {})
+            by_reason[reason] = by_reason.get(reason, 0) + 1
+            if url: self._url(url)["status"] = f"skipped:{reason}"
+
+    def page(self, url, status="ok"):
+        """Bir detay sayfasının sonucu; RSS en fazla RSS_SAMPLE_INTERVAL'de bir örneklenir."""
+        with self._lock:
+            self.pages[status] = self.pages.get(status, 0) + 1
+            entry = self._url(url)
+            if entry["status"] is None: entry["status"] = status
+        self.sample_rss()
+        if self.profiler: self.profiler.on_page()
+
+    def count(self, name, n=1):
+        with self._lock: self.counters[name] = self.counters.get(name, 0) + n
+
+    def sample_rss(self, force=False):
+        now = time.monotonic()
+        if not force and now - self._last_rss_sample < RSS_SAMPLE_INTERVAL: return
+        self._last_rss_sample = now
+        python_rss = _self_rss()
+        children = children_map()
+        chrome_rss = 0
+        for pid in descendants(os.getpid(), children):
+            usage = proc_usage(pid)
+            if usage and any(m in usage[2].lower() for m in CHROME_MARKERS): chrome_rss += usage[0]
+        with self._lock:
+            self.rss_peak["python"] = max(self.rss_peak["python"], python_rss)
+            self.rss_peak["chrome"] = max(self.rss_peak["chrome"], chrome_rss)
+
+    def to_dict(self):
+        self.sample_rss(force=True)
+        with self._lock:
+            wall = time.monotonic() - self._t0
+            stages = {name: s.summary() for name, s in sorted(self.stages.items())}
+            return {
+                "scraper": self.scraper,
+                "started_at": self.started_at.strftime("%Y-%m-%dT%H:%M:%S"),
+                "wall_s": round(wall, 2),
+                "result": self.result,
+                "pages": dict(self.pages),
+                "stages": stages,
+                "retries": dict(self.retries),
+                "skips": {phase: dict(r) for phase, r in self.skips.items()},
+                "counters": dict(self.counters),
+                "rss_peak_mib": {k: round(v / 2 ** 20, 1) for k, v in self.rss_peak.items()},
+                "urls": {url: {"stages": {k: round(v, 3) for k, v in e["stages"].items()},
+                               "retries": e["retries"], "status": e["status"]}
+                         for url, e in self.urls.items()},
+            }
+
+    def write(self):
+        profile = self.profiler.stop() if self.profiler else None
+        if not self.path: return None
+        data = self.to_dict()
+        if profile: data["profile"] = profile
+        if self.autotune: data["autotune"] = self.autotune
+        tmp = f"{self.path}.tmp"
+        with open(tmp, 'w', encoding='utf-8') as f: json.dump(data, f, ensure_ascii=False, indent=2)
+        os.replace(tmp, self.path)
+        top = sorted(data["stages"].items(), key=lambda kv: -kv[1]["total_s"])[:4]
+        slowest = ", ".join(f"{name} {stats['total_s']:.0f}sn" for name, stats in top)
+        print(f"   📈 Metrikler: {self.path} ({slowest})")
+        return data
+
+
+def add_metrics_arguments(parser):
+    parser.add_argument("--metrics-file", default=None,
+                        help="Aşama süreleri ve sayaçların yazılacağı JSON (varsayılan: <çıktı>.metrics.json, "
+                             "'-' kapatır)")
+    return parser
+
+
+def build_metrics(args, scraper, output_file):
+    path = getattr(args, "metrics_file", None)
+    if path == "-": path = None
+    elif not path: path = f"{os.path.splitext(output_file)[0]}.metrics.json"
+    return RunMetrics(scraper, path)
@@ -0,0 +1,84 @@
+"""Kampanyaları çıkarıldıkları anda stdout'a NDJSON (satır başına bir JSON) olarak akıtır.
+
+`--stdout-ndjson` açıkken stdout yalnızca kayıtlara ayrılır; tüm log satırları stderr'e gider.
+Böylece `scraper.py --stdout-ndjson | tsx process_raw_json.ts --stdin-ndjson` zinciri
+tarama sürerken AI işlemeye başlayabilir.
+"""
+import sys
+import queue
+import threading
+
+from common.records import dumps_line
+
+DEFAULT_BUFFER = 64
+_STOP = object()
+
+
+class NdjsonEmitter:
+    """Sınırlı tamponlu yazıcı; tampon doluysa emit() tüketici yetişene kadar bekler."""
+
+    def __init__(self, stream, maxsize=DEFAULT_BUFFER):
+        self.stream = stream
+        self.queue = queue.Queue(maxsize=max(1, maxsize))
+        self.emitted = 0
+        self.broken = False
+        self._thread = threading.Thread(target=self._run, name="ndjson-writer", daemon=True)
+        self._thread.start()
+
+    def emit(self, record):
+        if not self.broken:
+            self.queue.put(record)
+
+    def _run(self):
+        while True:
+            record = self.queue.get()
+            if record is _STOP: return
+            if self.broken: continue
+            try:
+                self.stream.write(dumps_line(record) + "\n")
+                self.stream.flush()
+                self.emitted += 1
+            except (BrokenPipeError, ValueError):
+                # Tüketici kapandı; tarama dosya çıktısıyla devam eder
+                self.broken = True
+                print("   ⚠️ NDJSON tüketicisi kapandı, akış durduruldu.", file=sys.stderr)
+
+    def close(self):
+        self.queue.put(_STOP)
+        self._thread.join()
+
+
+class Fanout:
+    """Aynı kaydı birden fazla yazıcıya (NDJSON akışı, veritabanı sink'i) iletir."""
+
+    def __init__(self, emitters):
+        self.emitters = emitters
+
+    def emit(self, record):
+        for emitter in self.emitters: emitter.emit(record)
+
+    def close(self):
+        for emitter in self.emitters: emitter.close()
+
+
+def fanout(*emitters):
+    """Açık yazıcılar: hiçbiri yoksa None, tek ise kendisi, değilse Fanout."""
+    active = [e for e in emitters if e is not None]
+    if len(active) < 2: return active[0] if active else None
+    return Fanout(active)
+
+
+def add_stream_arguments(parser):
+    parser.add_argument("--stdout-ndjson", action="store_true",
+                        help="Her kampanyayı çıkarıldığı anda stdout'a NDJSON olarak yaz (loglar stderr'e gider)")
+    parser.add_argument("--ndjson-buffer", type=int, default=DEFAULT_BUFFER,
+                        help="Tüketici yavaşsa bekletilecek en fazla kayıt sayısı")
+    return parser
+
+
+def open_stream(args):
+    """Akış modu açıksa stdout'u emitter'a ayırır, print'leri stderr'e yönlendirir."""
+    if not getattr(args, "stdout_ndjson", False): return None
+    stdout = sys.stdout
+    sys.stdout = sys.stderr
+    return NdjsonEmitter(stdout, getattr(args, "ndjson_buffer", DEFAULT_BUFFER))
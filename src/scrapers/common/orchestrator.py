@@ -0,0 +1,279 @@
+"""Birden fazla scraper'ı tek süreç ağacında ortak tarayıcı oturumu / bellek bütçesiyle çalıştırır.
+
+Her scraper kendi alt sürecinde çalışır; aynı host'a aynı anda en fazla `--per-host` iş gider ve
+aynı host'ta iki başlangıç arasında `--host-gap` beklenir. Farklı host'ların işleri iç içe
+yürür: bir bankanın nezaket beklemeleri başka bankanın işiyle dolar, toplam süre bankaların
+toplamına değil en yavaşına yaklaşır. İşler önceki metrik dosyasındaki süreye göre uzundan
+kısaya başlatılır; bellek tahmini de aynı dosyadaki Chrome + Python tepe RSS'inden gelir.
+
+`maximum:2` gibi bir iş `--shard 1/2`, `--shard 2/2` olarak bölünür ve bitince birleştirilir
+(`common/merge.py`). Her shard ayrı iş sayılır: aynı host'ta paralel yürümeleri için `--per-host`
+en az N olmalıdır, yoksa sırayla yürürler (başlangıçta uyarılır). `--` sonrasındaki argümanlar tüm
+scraper'lara geçer.
+
+`--browser-endpoints` (veya `BROWSER_ENDPOINTS`) verilirse tarayıcılar uzak düğümlerde açılır
+(`common/remote.py`): oturum bütçesi varsayılan olarak uzak kapasitedir ve yerel bellek sınırı
+oturumlara uygulanmaz.
+
+    python3 src/scrapers/scrape.py run
+    python3 src/scrapers/scrape.py run maximum:2 paraf vakifbank --sessions 6 --memory 4G --per-host 2 -- --deadline 25m
+"""
+import os
+import sys
+import json
+import time
+import argparse
+import threading
+import subprocess
+from urllib.parse import urlsplit
+
+from common.cli import SCRAPERS, SCRAPERS_DIR
+from common.sites import site_urls
+from common.frontier import shard_output_file
+from common.resources import parse_size, memory_limit_mb, available_memory_mb, cpu_limit
+from common.remote import add_remote_arguments, configure_remote
+from common.autotune import tuned_workers
+
+# scraper -> (site anahtarı, varsayılan kök adres, çıktı dosyası, en fazla tarayıcı oturumu)
+TARGETS = {
+    "maximum": ("maximum", "https://www.maximum.com.tr", "maximum_kampanyalar_raw.json", 1),
+    "maximum-hybrid": ("maximum", "https://www.maximum.com.tr", "maximum_kampanyalar_hibrit.json", 1),
+    "maximum-full": ("maximum", "https://www.maximum.com.tr", "maximum_campaigns_full.json", 1),
+    "maximum-links": ("maximum", "https://www.maximum.com.tr", "maximum_links.json", 1),
+    "paraf": ("paraf", "https://www.paraf.com.tr", "paraf_restored_v25.json", 4),
+    "halkbank": ("paraf", "https://www.paraf.com.tr", "paraf_kampanyalar_raw.json", 1),
+    "vakifbank": ("vakifbank", "https://www.vakifkart.com.tr", "vakifbank_kampanyalar_raw.json", 1),
+}
+# Oturum sayısı bütçeye göre küçültülebilen scraper'lar -> argüman
+ELASTIC = {"paraf": "--workers"}
+DEFAULT_JOBS = ("maximum", "paraf", "vakifbank")
+DEFAULT_SESSION_MB = 450    # önceki metrik yoksa tarayıcı oturumu başına tahmin
+DEFAULT_HOST_GAP = 10.0     # sn
+MEMORY_HEADROOM = 0.8       # makine/cgroup belleğinin bütçeye ayrılan payı
+POLL_INTERVAL = 0.5
+
+
+def _read_metrics(output_file):
+    path = f"{os.path.splitext(output_file)[0]}.metrics.json"
+    try:
+        with open(path, 'r', encoding='utf-8') as f: return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+# --- İŞ ---
+class Job:
+    """Tek scraper (veya shard) çalıştırması; süre ve bellek tahmini önceki metriklerden."""
+
+    def __init__(self, name, shard=None, extra=()):
+        self.name = name
+        self.site, base, self.merged_file, self.max_sessions = TARGETS[name]
+        self.host = urlsplit(site_urls(self.site, BASE_URL=base)).netloc
+        self.shard = shard
+        self.output_file = shard_output_file(self.merged_file, shard)
+        self.extra = list(extra)
+        if name in ELASTIC:
+            # `--workers auto` ile kaydedilmiş ayar varsa üst sınır odur
+            backend = self.extra[self.extra.index("--backend") + 1] if "--backend" in self.extra[:-1] else "selenium"
+            self.max_sessions = tuned_workers(name, backend) or self.max_sessions
+        previous = _read_metrics(self.output_file) or _read_metrics(self.merged_file) or {}
+        self.expected_s = previous.get("wall_s")
+        if previous and shard and not _read_metrics(self.output_file): self.expected_s /= shard[1]
+        peak = sum((previous.get("rss_peak_mib") or {}).values())
+        self.session_mb = peak / self.max_sessions if peak else DEFAULT_SESSION_MB
+        self.sessions = 0
+        self.proc = None
+        self.pump = None
+        self.started = self.finished = None
+        self.returncode = None
+
+    @property
+    def label(self):
+        return f"{self.name} {self.shard[0]}/{self.shard[1]}" if self.shard else self.name
+
+    @property
+    def wall_s(self):
+        return (self.finished or time.monotonic()) - self.started if self.started else 0.0
+
+    def command(self, sessions):
+        cmd = [sys.executable, "-u", os.path.join(SCRAPERS_DIR, SCRAPERS[self.name][0]), *self.extra]
+        if self.shard: cmd += ["--shard", f"{self.shard[0]}/{self.shard[1]}"]
+        if self.name in ELASTIC: cmd += [ELASTIC[self.name], str(sessions)]
+        return cmd
+
+
+def parse_job(value):
+    """'maximum' veya 'maximum:2' -> (ad, shard_sayısı)."""
+    name, _, shards = value.partition(":")
+    if name not in TARGETS:
+        raise argparse.ArgumentTypeError(f"Bilinmeyen scraper: {name} (seçenekler: {', '.join(TARGETS)})")
+    if shards and (not shards.isdigit() or int(shards) < 1):
+        raise argparse.ArgumentTypeError(f"Geçersiz shard sayısı: {value}")
+    return name, int(shards or 1)
+
+
+def build_jobs(specs, extra=()):
+    jobs = []
+    for name, shards in specs:
+        if shards == 1: jobs.append(Job(name, extra=extra))
+        else: jobs.extend(Job(name, (i, shards), extra) for i in range(1, shards + 1))
+    return jobs
+
+
+# --- ZAMANLAYICI ---
+class Orchestrator:
+    """Oturum/bellek bütçesi ve host başına sınırlar içinde işleri başlatır, çıktılarını etiketler."""
+
+    def __init__(self, jobs, sessions, memory_mb=None, per_host=1, host_gap=DEFAULT_HOST_GAP, remote=False):
+        # Süresi bilinmeyenler en uzun sayılır; en uzun iş en önce başlar
+        self.pending = sorted(jobs, key=lambda j: -(j.expected_s if j.expected_s is not None else float("inf")))
+        self.jobs = list(self.pending)
+        self.sessions = sessions
+        self.memory_mb = memory_mb
+        self.per_host = per_host
+        self.host_gap = host_gap
+        self.remote = remote  # tarayıcılar uzak düğümlerde: yerel bellek oturumu sınırlamaz
+        self.running = []
+        self.host_started = {}
+        self.print_lock = threading.Lock()
+
+    def _sessions_for(self, job, now):
+        """Şu an verilebilecek oturum sayısı; başlatılamıyorsa 0."""
+        if sum(j.host == job.host for j in self.running) >= self.per_host: return 0
+        if now - self.host_started.get(job.host, -self.host_gap) < self.host_gap: return 0
+        free = self.sessions - sum(j.sessions for j in self.running)
+        want = min(job.max_sessions, free)
+        if job.name in ELASTIC:
+            # Başka host'larda bekleyen işlere birer oturum bırakılır; host'lar iç içe yürür
+            waiting = {j.host for j in self.pending if j.host != job.host
+                       and sum(r.host == j.host for r in self.running) < self.per_host}
+            want = min(want, max(1, free - len(waiting)))
+        if self.memory_mb and not self.remote:
+            reserved = sum(j.sessions * j.session_mb for j in self.running)
+            want = min(want, int((self.memory_mb - reserved) // job.session_mb))
+        available = None if self.remote else available_memory_mb()
+        if available is not None: want = min(want, int(available // job.session_mb))
+        if want < 1 or (want < job.max_sessions and job.name not in ELASTIC): return 0
+        return want
+
+    def _pump(self, job):
+        for line in job.proc.stdout:
+            with self.print_lock: print(f"[{job.label}] {line}", end="", flush=True)
+
+    def start(self, job, sessions, now):
+        job.sessions, job.started = sessions, now
+        env = dict(os.environ, PYTHONUNBUFFERED="1")
+        job.proc = subprocess.Popen(job.command(sessions), stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                                    text=True, bufsize=1, env=env)
+        job.pump = threading.Thread(target=self._pump, args=(job,), daemon=True)
+        job.pump.start()
+        self.pending.remove(job)
+        self.running.append(job)
+        self.host_started[job.host] = now
+        with self.print_lock:
+            print(f"▶️ {job.label} başladı ({job.host}, {sessions} oturum, ~{sessions * job.session_mb:.0f} MiB)")
+
+    def reap(self):
+        for job in [j for j in self.running if j.proc.poll() is not None]:
+            job.pump.join()
+            job.finished, job.returncode = time.monotonic(), job.proc.returncode
+            self.running.remove(job)
+            icon = "✅" if job.returncode == 0 else "❌"
+            with self.print_lock: print(f"{icon} {job.label} bitti: {job.wall_s:.0f} sn (çıkış {job.returncode})")
+
+    def run(self):
+        try:
+            while self.pending or self.running:
+                now = time.monotonic()
+                started = False
+                for job in list(self.pending):
+                    sessions = self._sessions_for(job, now)
+                    if sessions: self.start(job, sessions, now); started = True
+                gap_wait = any(now - self.host_started.get(j.host, -self.host_gap) < self.host_gap for j in self.pending)
+                if self.pending and not self.running and not started and not gap_wait:
+                    # Bütçe tek işe bile yetmiyor; kilitlenmek yerine en küçük hâliyle çalıştır
+                    job = self.pending[0]
+                    print(f"⚠️ Bütçe {job.label} için yetersiz, 1 oturumla başlatılıyor.")
+                    self.start(job, 1, now)
+                self.reap()
+                if self.pending or self.running: time.sleep(POLL_INTERVAL)
+        except KeyboardInterrupt:
+            print("\n⛔ Durduruluyor...")
+            for job in self.running: job.proc.terminate()
+            for job in self.running: job.proc.wait()
+            self.reap()
+            raise
+        return self.jobs
+
+
+def merge_shards(jobs):
+    """Tüm shard'ları başarıyla biten işlerin çıktısını birleştirir."""
+    from common.merge import main as merge_main
+    groups = {}
+    for job in jobs:
+        if job.shard: groups.setdefault(job.name, []).append(job)
+    failed = []
+    for name, shard_jobs in groups.items():
+        if any(j.returncode != 0 for j in shard_jobs):
+            print(f"   ⚠️ {name}: başarısız shard var, birleştirilmedi.")
+            failed.append(name)
+            continue
+        argv = [shard_jobs[0].merged_file, *(j.output_file for j in shard_jobs), "--bank", shard_jobs[0].site]
+        if name == "maximum-links": argv += ["--indent", "2"]
+        if merge_main(argv) != 0: failed.append(name)
+    return failed
+
+
+def report(jobs, wall_s):
+    total = sum(j.wall_s for j in jobs)
+    print(f"\n📊 {len(jobs)} iş, toplam {wall_s:.0f} sn (sıralı çalışsaydı ~{total:.0f} sn, "
+          f"en yavaş {max((j.wall_s for j in jobs), default=0):.0f} sn)")
+    for job in jobs:
+        print(f"   {job.label:<18} {job.host:<24} {job.sessions} oturum  {job.wall_s:>6.0f} sn  çıkış {job.returncode}")
+    return {"wall_s": round(wall_s, 1), "sequential_s": round(total, 1),
+            "jobs": [{"job": j.label, "host": j.host, "sessions": j.sessions, "wall_s": round(j.wall_s, 1),
+                      "returncode": j.returncode} for j in jobs]}
+
+
+def main(argv=None):
+    argv = list(sys.argv[1:] if argv is None else argv)
+    extra = []
+    if "--" in argv: argv, extra = argv[:argv.index("--")], argv[argv.index("--") + 1:]
+    limit = memory_limit_mb()
+    parser = argparse.ArgumentParser(prog="scrape.py run",
+                                     description="Birden fazla scraper'ı ortak kaynak bütçesiyle çalıştırır")
+    parser.add_argument("jobs", nargs="*", type=parse_job,
+                        help=f"Scraper'lar, 'ad:N' N shard'a böler (varsayılan: {' '.join(DEFAULT_JOBS)})")
+    parser.add_argument("--sessions", type=int, default=None,
+                        help="Aynı anda açık tarayıcı oturumu üst sınırı (varsayılan: çekirdek sayısı veya uzak kapasite)")
+    parser.add_argument("--memory", type=parse_size, default=limit * MEMORY_HEADROOM if limit else None,
+                        help="Tarayıcı oturumlarına ayrılan bellek (örn. 4G; varsayılan: cgroup/makine belleğinin %%80'i)")
+    parser.add_argument("--per-host", type=int, default=1, help="Aynı host'a aynı anda giden en fazla iş")
+    parser.add_argument("--host-gap", type=float, default=DEFAULT_HOST_GAP,
+                        help="Aynı host'ta iki iş başlangıcı arası en az süre (sn)")
+    parser.add_argument("--report", default=None, help="Çalışma özetini JSON olarak yaz")
+    add_remote_arguments(parser)
+    args = parser.parse_args(argv)
+
+    pool = configure_remote(args)
+    if pool: pool.refresh(force=True)
+    remote = bool(pool and pool.capacity())
+    if remote:
+        print(f"🌐 Uzak tarayıcılar: {sum(ep.healthy for ep in pool.endpoints)}/{len(pool.endpoints)} uç nokta, "
+              f"{pool.capacity()} oturum kapasitesi")
+    if args.sessions is None: args.sessions = pool.capacity() if remote else max(2, int(cpu_limit()))
+    jobs = build_jobs(args.jobs or [parse_job(name) for name in DEFAULT_JOBS], extra)
+    for name, shards in args.jobs:
+        if shards > args.per_host:
+            print(f"⚠️ {name}: {shards} shard ama --per-host {args.per_host}; aynı anda en fazla {args.per_host} "
+                  f"shard yürür. Paralel için --per-host {shards} verin.")
+    memory = f"{args.memory:.0f} MiB" if args.memory else "sınırsız"
+    print(f"🎼 {len(jobs)} iş, {len({j.host for j in jobs})} host; bütçe {args.sessions} oturum, {memory}, "
+          f"host başına {args.per_host}")
+    started = time.monotonic()
+    Orchestrator(jobs, args.sessions, args.memory, args.per_host, args.host_gap, remote).run()
+    failed = merge_shards(jobs)
+    summary = report(jobs, time.monotonic() - started)
+    if args.report:
+        with open(args.report, 'w', encoding='utf-8') as f: json.dump(summary, f, ensure_ascii=False, indent=2)
+    return 1 if failed or any(j.returncode != 0 for j in jobs) else 0
@@ -0,0 +1,164 @@
+"""Bot doğrulama (challenge), hata ve boş sayfaların yüklemeden hemen sonra tanınması ve strateji seçimi.
+
+Sayfa yüklenir yüklenmez birkaç ucuz sinyale bakılır; ayrıştırma yapılmaz:
+
+1. Beklenen işaretlerden biri (örn. `CampaignDescription`) HTML'de varsa sayfa geçerlidir.
+2. HTTP durumu (yalnızca Playwright'ta bilinir): 403 -> challenge, 429 -> rate_limited,
+   404/410 -> not_found, 5xx -> error.
+3. `<title>` (yoksa ilk `<h1>`) ve HTML'deki challenge / WAF işaretleri (Cloudflare, Imperva, Akamai, PerimeterX).
+   Başlık ifadeleri tam kelime olarak eşleşir; "500 TL" gibi tutarlar hata sayılmaz.
+4. Boyut: `EMPTY_BYTES` altındaki belge boştur.
+
+Hiçbiri yoksa sayfa henüz çiziliyor olabilir (`pending`); scraper beklenen seçiciyi bekler. Son
+kontrolde işaret hâlâ yoksa tam boyutlu sayfa ayrıştırıcıya geçer (menü/kategori sayfalarını
+başlık filtresi atlar), yalnızca `EMPTY_BYTES` altındaki sayfa boş sayılır. Reddedilen sayfa için strateji:
+
+| Tür            | Strateji                                                             |
+|----------------|----------------------------------------------------------------------|
+| `challenge`    | yeni tarayıcı oturumu; art arda ikinciden itibaren host bekleme süresi |
+| `rate_limited` | host bekleme süresi (30 sn, art arda katlanır, en fazla 5 dk)        |
+| `error`, `empty` | URL kuyruk sonundaki tekrar geçişine ertelenir                      |
+| `not_found`    | atlanır                                                              |
+
+Challenge ve rate_limited sayfalar da ertelenir; tekrar geçişinde yine reddedilen URL hata sayılır.
+"""
+import re
+import time
+import threading
+from collections import namedtuple
+
+EMPTY_BYTES = 1500
+HEAD_BYTES = 64 * 1024      # işaretler belgenin başında aranır
+COOLDOWN_S = 30
+MAX_COOLDOWN_S = 300
+CHALLENGE_STREAK = 2        # art arda bu kadar challenge'dan sonra bekleme de eklenir
+
+# Başlık ifadeleri tam kelime olarak aranır (kampanya başlıklarında geçen "500 TL", "Robot süpürge"
+# gibi parçalar eşleşmez); durum kodları (404, 503 ...) yalnızca HTTP durumundan okunur.
+CHALLENGE_TITLES = ("just a moment", "attention required", "checking your browser", "access denied",
+                    "request rejected", "güvenlik kontrolü", "erişim engellendi")
+CHALLENGE_MARKERS = ("cf-chl-", "challenge-platform", "/cdn-cgi/challenge", "_incapsula_resource",
+                     "incapsula incident", "px-captcha", "_pxhd", "errors.edgesuite.net",
+                     "the requested url was rejected", "distil_r_captcha")
+RATE_TITLES = ("too many requests", "çok fazla istek")
+NOT_FOUND_TITLES = ("not found", "sayfa bulunamadı")
+ERROR_TITLES = ("service unavailable", "internal server error", "bad gateway", "gateway timeout", "hata oluştu")
+# Tek başına genel anlamlı sözcükler: yalnızca başlığın tamamıysa
+EXACT_TITLES = {"robot": "challenge", "bir dakika": "challenge", "bulunamadı": "not_found", "hata": "error",
+                "bakımdayız": "error", "bakım çalışması": "error"}
+TITLE_KINDS = tuple((kind, re.compile(r"(?<!\w)(?:" + "|".join(map(re.escape, titles)) + r")(?!\w)"))
+                    for kind, titles in (("challenge", CHALLENGE_TITLES), ("rate_limited", RATE_TITLES),
+                                         ("not_found", NOT_FOUND_TITLES), ("error", ERROR_TITLES)))
+TITLE_RE = re.compile(r'<title[^>]*>(.*?)</title>', re.IGNORECASE | re.DOTALL)
+H1_RE = re.compile(r'<h1[^>]*>(.*?)</h1>', re.IGNORECASE | re.DOTALL)
+
+REJECTED = ("challenge", "rate_limited", "error", "empty", "not_found")
+SKIP_NOT_FOUND = "not_found"
+
+
+class Verdict(namedtuple("Verdict", "kind reason")):
+    @property
+    def ok(self):
+        return self.kind == "ok"
+
+    @property
+    def pending(self):
+        return self.kind == "pending"
+
+
+class PageRejected(Exception):
+    def __init__(self, verdict):
+        super().__init__(f"{verdict.kind}: {verdict.reason}")
+        self.verdict = verdict
+
+
+def classify(html, title=None, status=None, expect=(), final=False):
+    """HTML (str), `<title>` ve HTTP durumundan Verdict; ayrıştırmadan, milisaniyeler içinde."""
+    html = html or ""
+    if any(marker in html for marker in expect): return Verdict("ok", "beklenen işaret")
+    if status:
+        if status == 429: return Verdict("rate_limited", f"HTTP {status}")
+        if status in (404, 410): return Verdict("not_found", f"HTTP {status}")
+        if status == 403: return Verdict("challenge", f"HTTP {status}")
+        if status >= 500: return Verdict("error", f"HTTP {status}")
+    head = html[:HEAD_BYTES]
+    if title is None:
+        m = TITLE_RE.search(head)
+        title = m.group(1) if m else ""
+    if not title.strip():
+        m = H1_RE.search(head)  # başlıksız hata sayfaları
+        title = m.group(1) if m else ""
+    title = " ".join(title.replace("İ", "i").lower().split())
+    lowered = head.lower()
+    exact = EXACT_TITLES.get(title.strip(" .!…"))
+    if exact: return Verdict(exact, f"başlık: {title}")
+    for kind, pattern in TITLE_KINDS:
+        m = pattern.search(title)
+        if m: return Verdict(kind, f"başlık: {m.group(0)}")
+    marker = next((m for m in CHALLENGE_MARKERS if m in lowered), None)
+    if marker: return Verdict("challenge", f"işaret: {marker}")
+    if len(html) < EMPTY_BYTES: return Verdict("empty", f"{len(html)} bayt")
+    if not expect: return Verdict("ok", "")
+    # Tam boyutlu ama işaretsiz sayfa (kategori/menü sayfası) ayrıştırıcının başlık filtresine kalır
+    if final: return Verdict("ok", "beklenen işaret yok")
+    return Verdict("pending", "")
+
+
+def check_driver(driver, url, metrics, guard, final=False):
+    """Selenium sürücüsündeki sayfayı sınıflandırır; reddedilirse PageRejected. (Verdict, html)."""
+    with metrics.span("classify", url):
+        html, title = driver.page_source, driver.title
+        return guard.check(html, title, final=final), html
+
+
+class PageGuard:
+    """Sınıflandırma, ertelemeler ve host bekleme süresi; işçi thread'leri arasında ortak."""
+
+    def __init__(self, metrics, frontier, expect=()):
+        self.metrics, self.frontier = metrics, frontier
+        self.expect = tuple(expect)
+        self.streak = 0
+        self.cooldown_until = 0.0
+        self._lock = threading.Lock()
+
+    def check(self, html, title=None, status=None, final=False):
+        verdict = classify(html, title, status, self.expect, final)
+        if verdict.kind in REJECTED: raise PageRejected(verdict)
+        if verdict.ok:
+            with self._lock: self.streak = 0
+        return verdict
+
+    def wait(self, url=None):
+        """Bekleme süresi varsa dolmasını bekler (tüm işçiler aynı host'a gider)."""
+        remaining = self.cooldown_until - time.monotonic()
+        if remaining > 0: self.metrics.sleep(remaining, url)
+
+    def handle(self, verdict, url, meta=None):
+        """Reddedilen sayfa için stratejiyi uygular; yeni tarayıcı oturumu gerekiyorsa True."""
+        kind = verdict.kind
+        self.metrics.count(f"page_{kind}")
+        with self._lock:
+            if kind in ("challenge", "rate_limited"): self.streak += 1
+            streak = self.streak
+            cooldown = 0
+            if kind == "rate_limited" or (kind == "challenge" and streak >= CHALLENGE_STREAK):
+                cooldown = min(MAX_COOLDOWN_S, COOLDOWN_S * 2 ** max(0, streak - CHALLENGE_STREAK))
+                self.cooldown_until = max(self.cooldown_until, time.monotonic() + cooldown)
+        if kind == "not_found":
+            self.metrics.skip(SKIP_NOT_FOUND, url); self.metrics.page(url, "skipped")
+            action = "atlandı"
+        elif self.frontier.defer(url, meta):
+            self.metrics.retry(kind, url)
+            action = "tekrar geçişine ertelendi"
+        else:
+            self.metrics.skip(kind, url); self.metrics.page(url, "error")
+            action = "tekrar geçişinde de reddedildi"
+        renew = kind == "challenge"
+        extra = (", yeni oturum" if renew else "") + (f", {cooldown} sn bekleme" if cooldown else "")
+        print(f"      🛡️ {kind} ({verdict.reason}): {action}{extra} -> {url}")
+        return renew
+
+    def summary(self):
+        counts = {k: self.metrics.counters.get(f"page_{k}", 0) for k in REJECTED}
+        found = ", ".join(f"{n} {k}" for k, n in counts.items() if n)
+        return f"Sayfa koruması: {found or 'reddedilen sayfa yok'}"
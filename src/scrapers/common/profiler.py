@@ -0,0 +1,193 @@
+"""Gece çalışmalarında açık bırakılabilecek örnekleyici profiler (`--profile`).
+
+Ayrı bir thread her `interval` saniyede tüm thread'lerin Python yığınlarını `sys._current_frames()`
+ile okur ve örneği o thread'in `RunMetrics` aşamasıyla (`[get]`, `[extract]` ...) etiketler.
+Sonuç flamegraph.pl / speedscope / inferno'nun okuduğu katlanmış (folded) biçimde
+`<çıktı>.profile.folded` dosyasına yazılır. Duvar saati örneklemesidir: tarayıcıyı bekleyen
+thread de örneklenir, böylece "nerede bekliyoruz" da görünür.
+
+Bellek için `tracemalloc` açılır ve her N detay sayfasında bir anlık görüntü başlangıçla
+karşılaştırılır; en çok büyüyen satırlar `<çıktı>.memory.json` dosyasına yazılır.
+"""
+import os
+import sys
+import json
+import time
+import threading
+import tracemalloc
+
+DEFAULT_INTERVAL_MS = 10
+DEFAULT_SNAPSHOT_EVERY = 25  # detay sayfası
+MAX_DEPTH = 64
+TRACE_FRAMES = 1  # satır bazında atama için yeterli; derin iz tracemalloc maliyetini katlar
+TOP_LINES = 15
+NO_STAGE = "-"
+
+_OWN_FILE = os.path.abspath(__file__)
+_MEMORY_FILTERS = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+    tracemalloc.Filter(False, _OWN_FILE),
+)
+
+
+def _frame_label(code):
+    return f"{os.path.basename(code.co_filename)}:{code.co_name}"
+
+
+def _folded_stack(frame):
+    labels = []
+    while frame is not None and len(labels) < MAX_DEPTH:
+        labels.append(_frame_label(frame.f_code))
+        frame = frame.f_back
+    labels.reverse()
+    return labels
+
+
+class Profiler(threading.Thread):
+    """Aşama etiketli yığın örnekleyici + periyodik tracemalloc karşılaştırması."""
+
+    def __init__(self, metrics, folded_path, memory_path, interval=DEFAULT_INTERVAL_MS / 1000,
+                 snapshot_every=DEFAULT_SNAPSHOT_EVERY, trace_frames=TRACE_FRAMES):
+        super().__init__(name="profiler", daemon=True)
+        self.metrics = metrics
+        self.folded_path, self.memory_path = folded_path, memory_path
+        self.interval = interval
+        self.snapshot_every = snapshot_every
+        self.trace_frames = trace_frames
+        self.stacks = {}        # "[aşama];dosya:fonksiyon;..." -> örnek sayısı
+        self.stage_samples = {}
+        self.samples = 0
+        self.sampling_s = 0.0   # örnekleyicinin kendi harcadığı süre (ek yük)
+        self.snapshots = []
+        self.pages = 0
+        self._baseline = None
+        self._snapshot_lock = threading.Lock()
+        self._halt = threading.Event()
+        self._t0 = None
+        self._stopped = False
+
+    # --- YIĞIN ÖRNEKLEME ---
+    def sample(self):
+        own = threading.get_ident()
+        frames = sys._current_frames()
+        active = self.metrics.active
+        for tid, frame in frames.items():
+            if tid == own: continue
+            stage = active.get(tid) or NO_STAGE
+            key = ";".join([f"[{stage}]"] + _folded_stack(frame))
+            self.stacks[key] = self.stacks.get(key, 0) + 1
+            self.stage_samples[stage] = self.stage_samples.get(stage, 0) + 1
+        self.samples += 1
+
+    def run(self):
+        while not self._halt.wait(self.interval):
+            started = time.perf_counter()
+            self.sample()
+            self.sampling_s += time.perf_counter() - started
+
+    # --- BELLEK ---
+    def on_page(self):
+        """RunMetrics.page() tarafından çağrılır; her `snapshot_every` sayfada bir anlık görüntü."""
+        self.pages += 1
+        if self.snapshot_every and self.pages % self.snapshot_every == 0: self.snapshot()
+
+    def snapshot(self, label=None):
+        if not tracemalloc.is_tracing() or self._baseline is None: return
+        # Aynı anda birden fazla işçi tetiklerse biri yeterli
+        if not self._snapshot_lock.acquire(blocking=False): return
+        try:
+            started = time.perf_counter()
+            snap = tracemalloc.take_snapshot().filter_traces(_MEMORY_FILTERS)
+            current, peak = tracemalloc.get_traced_memory()
+            top = []
+            for stat in snap.compare_to(self._baseline, "lineno")[:TOP_LINES]:
+                frame = stat.traceback[0]
+                top.append({
+                    "where": f"{frame.filename}:{frame.lineno}",
+                    "size_kib": round(stat.size / 1024, 1),
+                    "growth_kib": round(stat.size_diff / 1024, 1),
+                    "count_growth": stat.count_diff,
+                })
+            self.snapshots.append({
+                "label": label or f"page_{self.pages}",
+                "elapsed_s": round(time.monotonic() - self._t0, 1),
+                "pages": self.pages,
+                "traced_mib": round(current / 2 ** 20, 1),
+                "peak_mib": round(peak / 2 ** 20, 1),
+                "snapshot_ms": round((time.perf_counter() - started) * 1000, 1),
+                "top": top,
+            })
+        finally:
+            self._snapshot_lock.release()
+
+    # --- YAŞAM DÖNGÜSÜ ---
+    def start(self):
+        self._t0 = time.monotonic()
+        if self.memory_path:
+            if not tracemalloc.is_tracing(): tracemalloc.start(self.trace_frames)
+            self._baseline = tracemalloc.take_snapshot().filter_traces(_MEMORY_FILTERS)
+        super().start()
+        return self
+
+    def stop(self):
+        """Örneklemeyi durdurur, dosyaları yazar ve özet döner; birden fazla çağrılabilir."""
+        if self._stopped: return self.summary()
+        self._stopped = True
+        self._halt.set()
+        if self.is_alive(): self.join()
+        self.snapshot("final")
+        if tracemalloc.is_tracing(): tracemalloc.stop()
+        self.write()
+        return self.summary()
+
+    def summary(self):
+        wall = (time.monotonic() - self._t0) if self._t0 else 0.0
+        return {
+            "samples": self.samples,
+            "interval_ms": round(self.interval * 1000, 1),
+            "overhead_pct": round(100 * self.sampling_s / wall, 2) if wall else 0.0,
+            "stage_samples": dict(sorted(self.stage_samples.items(), key=lambda kv: -kv[1])),
+            "folded": self.folded_path,
+            "memory": self.memory_path,
+        }
+
+    def write(self):
+        tmp = f"{self.folded_path}.tmp"
+        with open(tmp, 'w', encoding='utf-8') as f:
+            for stack, count in sorted(self.stacks.items()): f.write(f"{stack} {count}\n")
+        os.replace(tmp, self.folded_path)
+        if self.memory_path:
+            tmp = f"{self.memory_path}.tmp"
+            with open(tmp, 'w', encoding='utf-8') as f:
+                json.dump({"scraper": self.metrics.scraper, "snapshot_every": self.snapshot_every,
+                           "snapshots": self.snapshots}, f, ensure_ascii=False, indent=2)
+            os.replace(tmp, self.memory_path)
+        s = self.summary()
+        print(f"   🔥 Profil: {self.folded_path} ({self.samples} örnek, ek yük %{s['overhead_pct']})"
+              + (f", bellek: {self.memory_path}" if self.memory_path else ""))
+
+
+def add_profile_arguments(parser):
+    parser.add_argument("--profile", action="store_true",
+                        help="Aşama etiketli yığın örnekleme (<çıktı>.profile.folded) ve tracemalloc "
+                             "karşılaştırmaları (<çıktı>.memory.json)")
+    parser.add_argument("--profile-interval-ms", type=float, default=DEFAULT_INTERVAL_MS,
+                        help="Yığın örnekleme aralığı (ms)")
+    parser.add_argument("--profile-snapshot-every", type=int, default=DEFAULT_SNAPSHOT_EVERY,
+                        help="Kaç detay sayfasında bir bellek anlık görüntüsü alınacağı (0: yalnızca sonda)")
+    parser.add_argument("--profile-no-memory", action="store_true", help="tracemalloc'u kapat, yalnızca yığın örnekle")
+    return parser
+
+
+def build_profiler(args, metrics, output_file):
+    """`--profile` verildiyse profiler'ı başlatıp `metrics`'e bağlar; `metrics.write()` durdurur."""
+    if not getattr(args, "profile", False): return None
+    stem = os.path.splitext(output_file)[0]
+    profiler = Profiler(metrics, f"{stem}.profile.folded",
+                        None if args.profile_no_memory else f"{stem}.memory.json",
+                        interval=max(args.profile_interval_ms, 1) / 1000,
+                        snapshot_every=max(args.profile_snapshot_every, 0))
+    metrics.profiler = profiler.start()
+    return profiler
@@ -0,0 +1,180 @@
+"""Tipli, slots tabanlı kampanya kayıtları ve hızlı JSON / JSON Lines kodlama.
+
+`Campaign` normalize edilmiş çıktıdır (maximum*, paraf.py; `maximum-import.ts` ve TS
+importer'larının okuduğu biçim), `FullCampaign` buna `raw_html` ekler, `RawCampaign` ise
+`process_raw_json.ts`'in AI ile işlediği ham detay kaydıdır (halkbank/paraf.py, vakifbank.py).
+Anahtar adları ve sırası eski sözlüklerle aynıdır.
+
+Sabit kümeden gelen alanlar (provider, kategori, tarih, katılım yöntemi ...) `sys.intern`
+ile paylaşılır. `orjson` kuruluysa kodlama onunla yapılır (girinti 2); değilse standart `json`.
+"""
+import os
+import sys
+import json
+from dataclasses import dataclass, fields, MISSING
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class RecordError(ValueError):
+    """Kayıt şemaya uymuyor (eksik/fazla alan veya yanlış tip)."""
+
+
+STR, OPT_STR, INT, STR_LIST = (str,), (str, type(None)), (int,), (list, tuple)
+OPT_INT = (int, type(None))
+OPT_DICT = (dict, type(None))
+
+
+# --- KAYITLAR ---
+@dataclass(slots=True)
+class Campaign:
+    id: int
+    title: str
+    provider: str
+    category: str
+    merchant: str | None
+    image: str | None
+    images: list
+    description: str
+    url: str
+    discount: str | None
+    earning: str | None
+    min_spend: int | None
+    max_discount: int | None
+    created_at: str
+    valid_from: str | None
+    valid_until: str | None
+    participation_method: str
+    conditions: list
+    eligible_customers: list
+    source_url: str
+    extraction: dict | None = None  # common/confidence.py raporu
+    fingerprint: dict | None = None  # common/fingerprint.py raporu
+
+    def __post_init__(self): _intern_fields(self)
+
+
+@dataclass(slots=True)
+class FullCampaign(Campaign):
+    raw_html: str = ""
+    raw_text: str | None = None  # common/reducer.py (--detail-text)
+
+
+@dataclass(slots=True)
+class RawCampaign:
+    url: str
+    title: str
+    description: str
+    detail_html: str
+    image: str | None
+    bank: str
+    card: str
+    extraction: dict | None = None
+    detail_text: str | None = None  # common/reducer.py (--detail-text)
+    fingerprint: dict | None = None
+
+    def __post_init__(self): _intern_fields(self)
+
+
+SCHEMAS = {
+    Campaign: {
+        "id": INT, "title": STR, "provider": STR, "category": STR, "merchant": OPT_STR, "image": OPT_STR,
+        "images": STR_LIST, "description": STR, "url": STR, "discount": OPT_STR, "earning": OPT_STR,
+        "min_spend": OPT_INT, "max_discount": OPT_INT, "created_at": STR, "valid_from": OPT_STR,
+        "valid_until": OPT_STR, "participation_method": STR, "conditions": STR_LIST,
+        "eligible_customers": STR_LIST, "source_url": STR, "extraction": OPT_DICT, "fingerprint": OPT_DICT,
+    },
+    RawCampaign: {
+        "url": STR, "title": STR, "description": STR, "detail_html": STR, "image": OPT_STR, "bank": STR, "card": STR,
+        "extraction": OPT_DICT, "detail_text": OPT_STR, "fingerprint": OPT_DICT,
+    },
+}
+SCHEMAS[FullCampaign] = dict(SCHEMAS[Campaign], raw_html=STR, raw_text=OPT_STR)
+
+# Çalışma boyunca tekrar eden değerler; her kayıtta ayrı kopya tutulmaz
+INTERNED = ("provider", "category", "discount", "earning", "created_at", "valid_from", "valid_until",
+            "participation_method", "source_url", "bank", "card")
+_FIELD_NAMES = {cls: tuple(f.name for f in fields(cls)) for cls in SCHEMAS}
+_REQUIRED = {cls: tuple(f.name for f in fields(cls) if f.default is MISSING) for cls in SCHEMAS}
+_INTERNED = {cls: tuple(n for n in names if n in INTERNED) for cls, names in _FIELD_NAMES.items()}
+
+
+def _intern_fields(record):
+    for name in _INTERNED[type(record)]:
+        value = getattr(record, name)
+        if type(value) is str: setattr(record, name, sys.intern(value))
+
+
+# --- ŞEMA ---
+def validate(record):
+    """Alan tiplerini kontrol eder; liste alanlarının elemanları str olmalıdır."""
+    schema = SCHEMAS.get(type(record))
+    if schema is None: raise RecordError(f"Bilinmeyen kayıt tipi: {type(record).__name__}")
+    for name, types in schema.items():
+        value = getattr(record, name)
+        if not isinstance(value, types) or (types is INT and isinstance(value, bool)):
+            raise RecordError(f"{type(record).__name__}.{name}: {type(value).__name__} ({value!r:.60})")
+        if types is STR_LIST and any(not isinstance(v, str) for v in value):
+            raise RecordError(f"{type(record).__name__}.{name}: str olmayan eleman")
+    return record
+
+
+def from_dict(cls, data):
+    """Sözlükten doğrulanmış kayıt; eksik veya tanımsız anahtar hata verir."""
+    names = _FIELD_NAMES[cls]
+    missing = [n for n in _REQUIRED[cls] if n not in data]
+    extra = [k for k in data if k not in SCHEMAS[cls]]
+    if missing or extra:
+        raise RecordError(f"{cls.__name__}: eksik {missing or '-'}, tanımsız {extra or '-'}")
+    return validate(cls(**{n: data[n] for n in names if n in data}))
+
+
+def to_dict(record):
+    if isinstance(record, dict): return record
+    return {name: getattr(record, name) for name in _FIELD_NAMES[type(record)]}
+
+
+# --- KODLAMA ---
+def dumps(items, indent=None):
+    """Kayıt (veya sözlük) listesini doğrulayıp JSON baytlarına kodlar."""
+    for record in items:
+        if not isinstance(record, dict): validate(record)
+    if orjson is not None:
+        return orjson.dumps(items, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps([to_dict(r) for r in items], ensure_ascii=False, indent=indent).encode('utf-8')
+
+
+def dumps_line(record):
+    """Tek kaydı NDJSON satırına (sonunda \\n olmadan) kodlar."""
+    if orjson is not None: return orjson.dumps(record).decode('utf-8')
+    return json.dumps(to_dict(record), ensure_ascii=False)
+
+
+def write_json(path, items, indent=4):
+    tmp = f"{path}.tmp"
+    with open(tmp, 'wb') as f: f.write(dumps(items, indent))
+    os.replace(tmp, path)
+
+
+def write_jsonl(path, items):
+    tmp = f"{path}.tmp"
+    with open(tmp, 'w', encoding='utf-8') as f:
+        for record in items: f.write(dumps_line(record) + "\n")
+    os.replace(tmp, path)
+
+
+def _load(payload):
+    return orjson.loads(payload) if orjson is not None else json.loads(payload)
+
+
+def read_json(path, cls):
+    with open(path, 'rb') as f: return [from_dict(cls, item) for item in _load(f.read())]
+
+
+def iter_jsonl(path, cls):
+    with open(path, 'rb') as f:
+        for line in f:
+            if line.strip(): yield from_dict(cls, _load(line))
@@ -0,0 +1,144 @@
+"""Detay HTML'ini AI'ya gidecek kısa, yapılı metne indirger.
+
+Başlıklar `#`, liste maddeleri `- ` ile, tablo satırları hücreleri ` | ` ile birleştirilmiş tek
+satır olarak kalır; script/style/nav/footer gibi etiketler ve markup atılır. Aynı sayfada
+tekrarlanan satırlar ve çalışma boyunca birçok sayfada aynen geçen rakamsız satırlar
+(menü, çerez uyarısı, "tüm kampanyalar" bağlantıları ...) çıkarılır.
+
+`--detail-text` metnin kayıtta HTML'in yanında mı (`alongside`) yoksa yerine mi (`instead`)
+tutulacağını seçer; varsayılan `off` çıktıyı değiştirmez.
+"""
+import re
+import threading
+
+from bs4 import BeautifulSoup, NavigableString
+
+DETAIL_TEXT_MODES = ("off", "alongside", "instead")
+BOILERPLATE_MIN_DOCS = 3  # rakamsız bir satır bu kadar sayfada görülünce sonrakilerden atılır
+CHARS_PER_TOKEN = 4       # kaba token tahmini
+
+SKIP_TAGS = {"script", "style", "noscript", "svg", "iframe", "form", "button", "select", "nav", "header",
+             "footer", "head", "template", "link", "meta", "img", "picture", "video"}
+BLOCK_TAGS = {"p", "div", "section", "article", "main", "aside", "ul", "ol", "dl", "dt", "dd", "table",
+              "thead", "tbody", "tfoot", "blockquote", "figure", "figcaption"}
+HEADINGS = {"h1", "h2", "h3", "h4", "h5", "h6"}
+BOILERPLATE_RE = re.compile(r'çerez|cookie|paylaş|tüm kampanyalar|kampanyalara dön|geri dön|ana sayfa|'
+                            r'hemen başvur|daha fazla göster|üye ol', re.IGNORECASE)
+
+
+# --- İNDİRGEME ---
+def _walk(node, parts):
+    for child in node.children:
+        name = child.name
+        if name is None:
+            # Comment, CData, Doctype de NavigableString alt sınıfıdır
+            if type(child) is NavigableString: parts.append(str(child))
+            continue
+        if name in SKIP_TAGS: continue
+        if name in HEADINGS: parts += ["\n", "#" * int(name[1]) + " " + _text(child), "\n"]
+        elif name == "li": parts += ["\n", "- " + _text(child), "\n"]
+        elif name == "tr":
+            cells = (_text(c) for c in child.find_all(("td", "th"), recursive=False))
+            parts += ["\n", " | ".join(c for c in cells if c), "\n"]
+        elif name == "br": parts.append("\n")
+        elif name in BLOCK_TAGS:
+            parts.append("\n"); _walk(child, parts); parts.append("\n")
+        else: _walk(child, parts)
+
+
+def _text(node):
+    parts = []
+    _walk(node, parts)
+    return " ".join("".join(parts).split())
+
+
+def html_lines(node):
+    """HTML (str veya bs4 düğümü) -> boş ve sayfa içi tekrarı olmayan satırlar."""
+    if isinstance(node, str):
+        soup = BeautifulSoup(node, 'html.parser')
+        node = soup.body or soup
+    parts = []
+    _walk(node, parts)
+    lines, seen = [], set()
+    for raw in "".join(parts).split("\n"):
+        line = " ".join(raw.split())
+        if not any(ch.isalnum() for ch in line) or line in seen: continue
+        seen.add(line)
+        lines.append(line)
+    return lines
+
+
+class Boilerplate:
+    """Çalışma boyunca `min_docs` sayfada aynen görülen rakamsız satırları eler (thread-safe)."""
+
+    def __init__(self, min_docs=BOILERPLATE_MIN_DOCS):
+        self.min_docs = min_docs
+        self.seen = {}
+        self.lock = threading.Lock()
+
+    def filter(self, lines):
+        kept = []
+        with self.lock:
+            for line in lines:
+                # Tutar/tarih içeren satırlar ve başlıklar hiçbir zaman atılmaz
+                if line.startswith("#") or any(ch.isdigit() for ch in line):
+                    kept.append(line); continue
+                if len(line) < 40 and BOILERPLATE_RE.search(line): continue
+                count = self.seen[line] = self.seen.get(line, 0) + 1
+                if count < self.min_docs: kept.append(line)
+        return kept
+
+
+def reduce_html(node, boilerplate=None):
+    lines = html_lines(node)
+    return "\n".join(boilerplate.filter(lines) if boilerplate else lines)
+
+
+def estimate_tokens(text):
+    return (len(text) + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN
+
+
+def count_reduction(metrics, html, text):
+    """`detail_{html,text}_{bytes,tokens}` sayaçları; rapor ve benchmark aynı ölçüyü kullanır."""
+    metrics.count("detail_html_bytes", len(html.encode('utf-8')))
+    metrics.count("detail_text_bytes", len(text.encode('utf-8')))
+    metrics.count("detail_html_tokens", estimate_tokens(html))
+    metrics.count("detail_text_tokens", estimate_tokens(text))
+
+
+# --- ÇALIŞMA ---
+class DetailText:
+    """Scraper başına indirgeyici: moda göre (html, text) döner ve boyutları metriklere sayar."""
+
+    def __init__(self, mode="off", metrics=None):
+        self.mode = mode
+        self.metrics = metrics
+        self.boilerplate = Boilerplate()
+
+    def apply(self, node, limit=None):
+        """`node` HTML'i (str veya bs4 düğümü); `limit` yalnızca saklanan HTML'i kırpar."""
+        html = node if isinstance(node, str) else str(node)
+        if limit: html = html[:limit]
+        if self.mode == "off": return html, None
+        text = reduce_html(node, self.boilerplate)
+        if self.metrics is not None: count_reduction(self.metrics, html, text)
+        return ("" if self.mode == "instead" else html), text
+
+
+def add_reducer_arguments(parser):
+    parser.add_argument("--detail-text", choices=DETAIL_TEXT_MODES, default="off",
+                        help="Detay HTML'inden indirgenmiş metin: HTML'in yanında (alongside), "
+                             "yerine (instead) veya hiç (off)")
+    return parser
+
+
+def build_reducer(args, metrics=None):
+    return DetailText(getattr(args, "detail_text", "off"), metrics)
+
+
+def format_reduction(counters):
+    html, text = counters.get("detail_html_bytes", 0), counters.get("detail_text_bytes", 0)
+    if not html: return "Metin indirgeme yok"
+    html_tok, text_tok = counters.get("detail_html_tokens", 0), counters.get("detail_text_tokens", 0)
+    return (f"HTML {html / 1024:.1f} KB -> metin {text / 1024:.1f} KB (%{100 * (1 - text / html):.0f} azalma), "
+            f"~{html_tok:,} -> ~{text_tok:,} token")
@@ -0,0 +1,260 @@
+"""Uzak tarayıcı uç noktaları: Selenium Grid / standalone (WebDriver) ve Chromium DevTools (CDP).
+
+`--browser-endpoints` veya `BROWSER_ENDPOINTS` virgülle ayrılmış uç noktalar alır:
+
+    http://grid-a:4444,http://grid-b:4444#8,cdp://10.0.0.5:9222,local
+
+- `http(s)://` Selenium Grid hub'ı veya standalone düğüm; `common/browser.selenium_chrome`
+  oturumu `webdriver.Remote` ile burada açar. Kapasite ve doluluk `/status` slotlarından okunur,
+  başka süreçlerin (orkestratör işleri, diğer makineler) açtığı oturumlar da görünür.
+- `cdp://host:port` veya `ws(s)://...` DevTools uç noktası; yalnızca Playwright arka ucu bağlanır
+  (`connect_over_cdp`) ve her oturum için uzak tarayıcıda yeni bir bağlam açar.
+- `local` yerel Chrome/Chromium; yalnızca uzak uç noktalar dolu veya erişilemezken kullanılır.
+- `#N` kapasiteyi elle verir (CDP için varsayılan 8, `local` için çekirdek sayısı).
+
+Oturum, sağlıklı uç noktalar arasında doluluğu (açık oturum / kapasite) en düşük olana açılır.
+Açılamayan uç nokta `DOWN_COOLDOWN` sn devre dışı kalır ve sıradakine geçilir; iş sırasında kopan
+oturumlar `common/backends.py` tarafından başka uç noktada yeniden açılır. Durum `STATUS_TTL` sn'de
+bir yenilenir. `undetected_chromedriver` kullanan yollar yereldir (yamalar yerel ikiliye uygulanır).
+
+    python3 src/scrapers/scrape.py endpoints http://localhost:4444 cdp://localhost:9222 --session
+"""
+import os
+import json
+import time
+import argparse
+import threading
+import urllib.request
+from urllib.parse import urlsplit
+
+from common.resources import cpu_limit
+
+ENDPOINTS_ENV = "BROWSER_ENDPOINTS"
+STATUS_TTL = 5              # sn, sağlık/doluluk yenileme aralığı
+STATUS_TIMEOUT = 3          # sn, sağlık isteği zaman aşımı
+DOWN_COOLDOWN = 30          # sn, hatalı uç noktanın devre dışı kaldığı süre
+CDP_CAPACITY = 8
+SELENIUM_KINDS = ("webdriver", "local")
+PLAYWRIGHT_KINDS = ("cdp", "local")
+# Oturumun koptuğunu gösteren hatalar (sınıf adıyla; selenium/urllib3 import edilmeden)
+LOST_ERRORS = {"InvalidSessionIdException", "NoSuchWindowException", "MaxRetryError", "ProtocolError",
+               "NewConnectionError", "RemoteDisconnected"}
+
+
+def _first_line(error):
+    return (str(error).splitlines() or [type(error).__name__])[0][:120]
+
+
+def _get_json(url):
+    with urllib.request.urlopen(url, timeout=STATUS_TIMEOUT) as resp: return json.load(resp)
+
+
+class Endpoint:
+    def __init__(self, spec):
+        url, _, capacity = spec.strip().partition("#")
+        self.url = url.rstrip("/")
+        scheme = urlsplit(self.url).scheme
+        self.kind = "local" if self.url == "local" else "cdp" if scheme in ("cdp", "ws", "wss") else "webdriver"
+        self.fixed = bool(capacity)
+        self.capacity = int(capacity) if capacity else {"local": max(1, int(cpu_limit())), "cdp": CDP_CAPACITY}.get(self.kind, 1)
+        self.active = 0             # bu süreçte açık oturum
+        self.opened = 0             # son yoklamadan beri açılan (uçtaki sayıya henüz yansımamış)
+        self.busy = 0               # uçtaki toplam oturum (diğer süreçler dahil), son yoklamadan
+        self.healthy = True
+        self.down_until = 0.0
+        self.checked_at = 0.0
+        self.latency_ms = None
+        self.error = None
+
+    @property
+    def http_url(self):
+        """CDP uç noktasının HTTP adresi (`/json/version` ve `connect_over_cdp` için)."""
+        parts = urlsplit(self.url)
+        if parts.scheme == "cdp": return f"http://{parts.netloc}"
+        if parts.scheme in ("ws", "wss"): return f"{'https' if parts.scheme == 'wss' else 'http'}://{parts.netloc}"
+        return self.url
+
+    @property
+    def cdp_url(self):
+        return self.http_url if urlsplit(self.url).scheme == "cdp" else self.url
+
+    def load(self):
+        return max(self.busy + self.opened, self.active) / max(1, self.capacity)
+
+    def check(self):
+        """Sağlık ve doluluğu uçtan okur."""
+        started = time.monotonic()
+        try:
+            if self.kind == "webdriver":
+                status = _get_json(f"{self.url}/status").get("value") or {}
+                slots = [s for n in status.get("nodes") or [] if n.get("availability", "UP") == "UP"
+                         for s in n.get("slots") or []]
+                if slots:
+                    if not self.fixed: self.capacity = len(slots)
+                    self.busy = sum(1 for s in slots if s.get("session"))
+                else:
+                    self.busy = self.active  # eski Grid/standalone: slot bilgisi yok
+                self.healthy = bool(status.get("ready")) or bool(slots)
+            elif self.kind == "cdp":
+                _get_json(f"{self.http_url}/json/version")
+                try: self.busy = sum(1 for t in _get_json(f"{self.http_url}/json/list") if t.get("type") == "page")
+                except (OSError, ValueError): self.busy = self.active
+                self.healthy = True
+            else:
+                self.busy, self.healthy = self.active, True
+            self.error = None
+        except (OSError, ValueError) as e:
+            self.healthy, self.error = False, str(e)
+            self.down_until = time.time() + DOWN_COOLDOWN
+        self.latency_ms = round((time.monotonic() - started) * 1000)
+        self.checked_at, self.opened = time.time(), 0
+        return self.healthy
+
+
+class EndpointPool:
+    """Uç noktalar arasında doluluğa göre oturum yerleşimi ve hata durumunda sıradakine geçiş."""
+
+    def __init__(self, spec):
+        self.spec = spec
+        self.endpoints = [Endpoint(s) for s in spec.split(",") if s.strip()]
+        self.lock = threading.Lock()
+
+    def refresh(self, force=False):
+        now = time.time()
+        for ep in self.endpoints:
+            if force or (ep.down_until <= now and now - ep.checked_at > STATUS_TTL): ep.check()
+
+    def capacity(self):
+        """Sağlıklı uzak uç noktaların toplam oturum kapasitesi."""
+        return sum(ep.capacity for ep in self.endpoints if ep.kind != "local" and ep.healthy)
+
+    def candidates(self, kinds):
+        """Sağlıklı uç noktalar, yerleşim sırasıyla: boş kapasitesi olan uzaklar, az dolu önce; local en son."""
+        self.refresh()
+        now = time.time()
+        up = [ep for ep in self.endpoints if ep.kind in kinds and ep.healthy and ep.down_until <= now]
+        order = {ep.url: i for i, ep in enumerate(self.endpoints)}
+        return sorted(up, key=lambda ep: (ep.load() >= 1, ep.kind == "local", ep.load(), order[ep.url]))
+
+    def open(self, kinds, create):
+        """`create(endpoint)` ile oturum açar; başarısız uç noktayı devre dışı bırakıp sıradakini dener."""
+        tried = set()
+        while True:
+            with self.lock:
+                ep = next((e for e in self.candidates(kinds) if e.url not in tried), None)
+                if ep is None:
+                    raise RuntimeError(f"Kullanılabilir tarayıcı uç noktası yok ({', '.join(kinds)}): {self.spec}")
+                ep.active += 1
+                ep.opened += 1
+            tried.add(ep.url)
+            try:
+                return ep, create(ep)
+            except Exception as e:
+                self.release(ep)
+                self.mark_down(ep, e)
+                print(f"   ⚠️ Tarayıcı uç noktası kullanılamıyor ({ep.url}): {_first_line(e)}")
+
+    def release(self, ep):
+        with self.lock:
+            ep.active = max(0, ep.active - 1)
+            ep.opened = max(0, ep.opened - 1)
+
+    def mark_down(self, ep, error=None):
+        if ep.kind == "local": return  # yerel yedek devre dışı bırakılmaz
+        with self.lock:
+            ep.healthy, ep.error = False, str(error) if error else ep.error
+            ep.down_until = time.time() + DOWN_COOLDOWN
+
+    def webdriver(self, options, local):
+        """Yerleşim sırasındaki ilk uygun uçta Selenium sürücüsü; `quit()` oturumu havuza geri verir."""
+        def create(ep):
+            if ep.kind == "local": return local(options)
+            from selenium import webdriver
+            return webdriver.Remote(command_executor=ep.url, options=options)
+
+        ep, driver = self.open(SELENIUM_KINDS, create)
+        quit, released = driver.quit, []
+
+        def release():
+            if released: return
+            released.append(True)
+            try: quit()
+            finally: self.release(ep)
+
+        driver.quit, driver.endpoint = release, ep
+        return driver
+
+
+_pool, _pool_lock = None, threading.Lock()
+
+
+def endpoint_pool():
+    """`BROWSER_ENDPOINTS` tanımlıysa süreç içi ortak havuz, değilse None (yerel tarayıcı)."""
+    global _pool
+    spec = os.environ.get(ENDPOINTS_ENV, "").strip()
+    if not spec: return None
+    with _pool_lock:
+        if _pool is None or _pool.spec != spec: _pool = EndpointPool(spec)
+        return _pool
+
+
+def session_lost(error):
+    """Hata, tarayıcı oturumunun/bağlantısının koptuğunu mu gösteriyor?"""
+    return type(error).__name__ in LOST_ERRORS or isinstance(error, ConnectionError)
+
+
+def add_remote_arguments(parser):
+    parser.add_argument("--browser-endpoints", default=None,
+                        help=f"Uzak tarayıcılar, virgülle (http://grid:4444, cdp://host:9222, local; "
+                             f"varsayılan ${ENDPOINTS_ENV})")
+    return parser
+
+
+def configure_remote(args):
+    """`--browser-endpoints` verildiyse ortama yazar; alt süreçler ve tembel açılan sürücüler görür."""
+    spec = getattr(args, "browser_endpoints", None)
+    if spec: os.environ[ENDPOINTS_ENV] = spec
+    return endpoint_pool()
+
+
+# --- KOMUT ---
+def _smoke(ep):
+    """Uçta deneme oturumu açıp kapatır; süre (ms)."""
+    from common.browser import chrome_options
+    from selenium import webdriver
+    options = chrome_options()
+    options.add_argument("--headless=new")
+    started = time.monotonic()
+    driver = webdriver.Remote(command_executor=ep.url, options=options)
+    try: driver.get("about:blank")
+    finally: driver.quit()
+    return round((time.monotonic() - started) * 1000)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="scrape.py endpoints", description="Tarayıcı uç noktalarının sağlığı ve doluluğu")
+    parser.add_argument("endpoints", nargs="*", help=f"Uç noktalar (varsayılan ${ENDPOINTS_ENV})")
+    parser.add_argument("--session", action="store_true", help="WebDriver uçlarında deneme oturumu açıp kapat")
+    args = parser.parse_args(argv)
+
+    spec = ",".join(args.endpoints) or os.environ.get(ENDPOINTS_ENV, "")
+    if not spec.strip():
+        print(f"❌ Uç nokta yok: argüman olarak verin veya {ENDPOINTS_ENV} tanımlayın.")
+        return 2
+    pool = EndpointPool(spec)
+    pool.refresh(force=True)
+    healthy = 0
+    for ep in pool.endpoints:
+        state = "✅" if ep.healthy else "❌"
+        line = f"{state} {ep.url:<40} {ep.kind:<9} {ep.busy}/{ep.capacity} oturum"
+        if ep.kind != "local": line += f", {ep.latency_ms} ms"
+        if ep.error: line += f" ({ep.error[:80]})"
+        if args.session and ep.healthy and ep.kind == "webdriver":
+            try: line += f", deneme oturumu {_smoke(ep)} ms"
+            except Exception as e:
+                ep.healthy = False
+                line += f", deneme oturumu başarısız: {_first_line(e)}"
+        healthy += ep.healthy
+        print(line)
+    print(f"\n{healthy}/{len(pool.endpoints)} uç nokta sağlıklı, uzak kapasite {pool.capacity()} oturum")
+    return 0 if healthy else 1
@@ -0,0 +1,63 @@
+"""Makine kaynak sınırları: cgroup (v2/v1) ve /proc/meminfo; Linux dışında None döner."""
+import os
+import re
+
+_UNLIMITED = 1 << 60
+
+
+def _read(path):
+    try:
+        with open(path, 'r', encoding='ascii') as f: return f.read().strip()
+    except OSError:
+        return None
+
+
+def _meminfo(field):
+    text = _read("/proc/meminfo") or ""
+    m = re.search(rf'^{field}:\s+(\d+) kB', text, re.MULTILINE)
+    return int(m.group(1)) / 1024 if m else None
+
+
+def parse_size(value):
+    """'3G', '2500M', '512m' veya çıplak sayı (MiB) -> MiB."""
+    m = re.fullmatch(r'\s*(\d+(?:\.\d+)?)\s*([kmgKMG]?)i?[bB]?\s*', str(value))
+    if not m: raise ValueError(f"Geçersiz boyut: {value}")
+    return float(m.group(1)) * {"k": 1 / 1024, "m": 1, "g": 1024, "": 1}[m.group(2).lower()]
+
+
+def cgroup_memory_mb():
+    """Konteyner bellek sınırı (MiB) veya sınırsızsa None."""
+    for path in ("/sys/fs/cgroup/memory.max", "/sys/fs/cgroup/memory/memory.limit_in_bytes"):
+        value = _read(path)
+        if value and value.isdigit() and int(value) < _UNLIMITED: return int(value) / 2 ** 20
+    return None
+
+
+def memory_limit_mb():
+    """Kullanılabilecek toplam bellek: cgroup sınırı ile fiziksel belleğin küçüğü."""
+    limits = [v for v in (cgroup_memory_mb(), _meminfo("MemTotal")) if v]
+    return min(limits) if limits else None
+
+
+def available_memory_mb():
+    """Şu an boş bellek (MemAvailable; cgroup'ta sınır - kullanım)."""
+    free = _meminfo("MemAvailable")
+    limit = cgroup_memory_mb()
+    if limit:
+        used = _read("/sys/fs/cgroup/memory.current") or _read("/sys/fs/cgroup/memory/memory.usage_in_bytes")
+        if used and used.isdigit():
+            free = min(free or limit, limit - int(used) / 2 ** 20)
+    return free
+
+
+def cpu_limit():
+    """Kullanılabilecek çekirdek sayısı: cgroup kotası, CPU affinity ve os.cpu_count'un küçüğü."""
+    limits = [len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else os.cpu_count() or 1]
+    quota = _read("/sys/fs/cgroup/cpu.max")
+    if quota and not quota.startswith("max"):
+        q, period = quota.split()[:2]
+        limits.append(int(q) / int(period))
+    else:
+        q, period = _read("/sys/fs/cgroup/cpu/cpu.cfs_quota_us"), _read("/sys/fs/cgroup/cpu/cpu.cfs_period_us")
+        if q and period and q.lstrip("-").isdigit() and int(q) > 0: limits.append(int(q) / int(period))
+    return max(1.0, min(limits))
@@ -0,0 +1,20 @@
+"""Banka site adresleri; yerel test sunucusuna yönlendirmek için ortam değişkenleriyle değiştirilebilir.
+
+    SCRAPER_<BANKA>_BASE_URL   -> tüm varsayılan adreslerin kökünü değiştirir
+    SCRAPER_<BANKA>_<AD>       -> tek bir adresi (örn. SCRAPER_VAKIFBANK_LIST_URL_TEMPLATE) değiştirir
+"""
+import os
+
+
+def site_urls(bank, **defaults):
+    """Varsayılan adresleri verilen sırayla, ortamdaki geçersiz kılmalar uygulanmış olarak döner."""
+    prefix = f"SCRAPER_{bank.upper()}_"
+    default_base = defaults.get("BASE_URL")
+    base = os.environ.get(prefix + "BASE_URL", "").rstrip("/")
+    urls = []
+    for name, default in defaults.items():
+        value = default
+        if base and default_base and default.startswith(default_base):
+            value = base + default[len(default_base):]
+        urls.append(os.environ.get(prefix + name) or value)
+    return urls[0] if len(urls) == 1 else tuple(urls)
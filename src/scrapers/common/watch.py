@@ -0,0 +1,212 @@
+"""Sürekli izleme: banka başına uyarlanır aralıkla artımlı tarama.
+
+Her yoklamada scraper `--incremental --stdout-ndjson` ile çalıştırılır: liste sayfası okunur,
+yalnızca yeni veya liste kartı değişen kampanyaların detayı açılır, diğerlerinin kaydı önceki
+çıktıdan taşınır. Çekilen kayıtlar geldikleri anda `--emit` hedefine (varsayılan stdout) NDJSON
+olarak aktarılır; loglar stderr'e gider. Değişiklik sayısı scraper'ın `<çıktı>.changes.json`
+özetinden okunur.
+
+Yoklama aralığı bankanın geçmiş değişiklik hızından öğrenilir: son `RATE_WINDOW_DAYS` günün
+yoklamalarında saat başına değişiklik (önsel: 6 saatte 1) tahmin edilir ve aralık yoklama başına
+beklenen değişiklik `TARGET_CHANGES` olacak şekilde `--min-interval` / `--max-interval` arasında
+seçilir. Durum `--state` dosyasında saklanır; daemon yeniden başladığında kaldığı yerden sürer.
+
+    python3 src/scrapers/scrape.py watch maximum paraf vakifbank | npx tsx src/scripts/process_raw_json.ts --stdin-ndjson
+    python3 src/scrapers/scrape.py watch vakifbank --once
+"""
+import os
+import sys
+import json
+import time
+import signal
+import argparse
+import threading
+import subprocess
+from datetime import datetime
+
+from common.cli import SCRAPERS, SCRAPERS_DIR
+from common.frontier import parse_duration
+from common.changes import changes_path
+from common.orchestrator import TARGETS
+
+DEFAULT_BANKS = ("maximum", "paraf", "vakifbank")
+DEFAULT_STATE = "watch_state.json"
+RATE_WINDOW_DAYS = 7
+TARGET_CHANGES = 0.5                # yoklama başına beklenen değişiklik
+PRIOR_CHANGES, PRIOR_HOURS = 1, 6   # geçmiş yokken varsayılan hız: 6 saatte 1 değişiklik
+MAX_POLLS = 500                     # banka başına saklanan yoklama sayısı
+
+
+def log(message):
+    print(message, file=sys.stderr, flush=True)
+
+
+# --- ARALIK ---
+def change_rate(polls, now=None):
+    """Saat başına değişiklik tahmini: pencere içindeki yoklamaların kapsadığı süre ve değişiklikler.
+    İlk yoklama (önceki yoklama yok, tam tarama) bir süreyi kapsamadığı için sayılmaz."""
+    now = now or time.time()
+    recent = [p for p in polls if now - p["at"] <= RATE_WINDOW_DAYS * 86400 and p["covered_h"] > 0]
+    hours = sum(p["covered_h"] for p in recent)
+    changes = sum(p["changes"] for p in recent)
+    return (changes + PRIOR_CHANGES) / (hours + PRIOR_HOURS)
+
+
+def next_interval(polls, min_s, max_s, now=None):
+    """Yoklama başına TARGET_CHANGES değişiklik bekleyecek aralık (sn), sınırlar içinde."""
+    return max(min_s, min(max_s, TARGET_CHANGES / change_rate(polls, now) * 3600))
+
+
+def load_state(path):
+    if not os.path.exists(path): return {}
+    try:
+        with open(path, 'r', encoding='utf-8') as f: state = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return state if isinstance(state, dict) else {}
+
+
+def save_state(path, state):
+    tmp = f"{path}.tmp"
+    with open(tmp, 'w', encoding='utf-8') as f: json.dump(state, f, ensure_ascii=False, indent=2)
+    os.replace(tmp, path)
+
+
+# --- YOKLAMA ---
+def poll(bank, extra, sink):
+    """Scraper'ı artımlı çalıştırır, NDJSON kayıtlarını `sink`'e aktarır; (çıkış kodu, kayıt, özet)."""
+    script = os.path.join(SCRAPERS_DIR, SCRAPERS[bank][0])
+    # Akış dosyası yalnızca bu yoklamada yazıldıysa okunur (ilk çalışmada yazılmaz)
+    feed_path = changes_path(TARGETS[bank][2])
+    feed_before = _mtime(feed_path)
+    cmd = [sys.executable, "-u", script, "--incremental", "--stdout-ndjson", *extra]
+    proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, bufsize=1,
+                            env=dict(os.environ, PYTHONUNBUFFERED="1"))
+
+    def relay_logs():
+        for line in proc.stderr: log(f"[{bank}] {line.rstrip()}")
+
+    logs = threading.Thread(target=relay_logs, daemon=True)
+    logs.start()
+    emitted = 0
+    try:
+        for line in proc.stdout:
+            if not line.strip(): continue
+            sink.write(line if line.endswith("\n") else line + "\n")
+            sink.flush()
+            emitted += 1
+        proc.wait()
+    except BaseException:
+        proc.terminate()
+        proc.wait()
+        raise
+    finally:
+        logs.join(timeout=5)
+
+    summary = None
+    if _mtime(feed_path) > feed_before:
+        try:
+            with open(feed_path, 'r', encoding='utf-8') as f: summary = json.load(f).get("summary")
+        except (OSError, ValueError):
+            summary = None
+    return proc.returncode, emitted, summary
+
+
+def _mtime(path):
+    try: return os.path.getmtime(path)
+    except OSError: return 0.0
+
+
+class Watcher:
+    """Bankaları sıradaki yoklama zamanına göre tek tek yoklar; aralığı değişiklik geçmişinden öğrenir."""
+
+    def __init__(self, banks, state_path, min_s, max_s, extra=(), sink=None):
+        self.banks = list(banks)
+        self.state_path = state_path
+        self.state = load_state(state_path)
+        self.min_s, self.max_s = min_s, max_s
+        self.extra = list(extra)
+        self.sink = sink or sys.stdout
+        self.stopping = False
+        self._announced = None
+        for bank in self.banks:
+            self.state.setdefault(bank, {"polls": [], "next_at": 0})
+
+    def due(self):
+        """Sıradaki banka ve zamanı."""
+        bank = min(self.banks, key=lambda b: self.state[b]["next_at"])
+        return bank, self.state[bank]["next_at"]
+
+    def run_once(self, bank):
+        entry = self.state[bank]
+        started = time.time()
+        code, emitted, summary = poll(bank, self.extra, self.sink)
+        if summary is not None:
+            changes = summary["added"] + summary["modified"] + summary["removed"]
+        else:
+            changes = emitted  # ilk çalışma: akış yok, çekilen her kayıt yenidir
+        if code == 0:
+            last = entry["polls"][-1]["at"] if entry["polls"] else None
+            covered_h = (started - last) / 3600 if last else 0.0
+            entry["polls"] = (entry["polls"] + [{"at": started, "covered_h": round(covered_h, 3), "changes": changes}])[-MAX_POLLS:]
+            interval = next_interval(entry["polls"], self.min_s, self.max_s)
+        else:
+            interval = self.min_s  # hata: en kısa aralıkla yeniden dene
+        entry["interval_s"] = round(interval)
+        entry["next_at"] = time.time() + interval
+        entry["last"] = {"at": datetime.now().strftime("%Y-%m-%dT%H:%M:%S"), "exit": code, "emitted": emitted,
+                         "changes": changes, "wall_s": round(time.time() - started, 1)}
+        save_state(self.state_path, self.state)
+        icon = "✅" if code == 0 else "❌"
+        log(f"{icon} {bank}: {changes} değişiklik, {emitted} kayıt aktarıldı; "
+            f"hız {change_rate(entry['polls']):.2f}/saat, sonraki yoklama {interval / 60:.0f} dk sonra")
+        return code
+
+    def run(self, once=False):
+        if once:
+            return max((self.run_once(bank) for bank in self.banks), default=0)
+        while not self.stopping:
+            bank, at = self.due()
+            wait = at - time.time()
+            if wait > 0:
+                if self._announced != (bank, at): log(f"💤 Sıradaki: {bank}, {wait / 60:.1f} dk sonra")
+                self._announced = (bank, at)
+                time.sleep(min(wait, 60))
+                continue
+            self.run_once(bank)
+        return 0
+
+
+def _bank(value):
+    if value not in TARGETS:
+        raise argparse.ArgumentTypeError(f"Bilinmeyen scraper: {value} (seçenekler: {', '.join(TARGETS)})")
+    return value
+
+
+def main(argv=None):
+    argv = list(sys.argv[1:] if argv is None else argv)
+    extra = []
+    if "--" in argv: argv, extra = argv[:argv.index("--")], argv[argv.index("--") + 1:]
+    parser = argparse.ArgumentParser(prog="scrape.py watch", description="Uyarlanır aralıklı artımlı tarama daemon'u")
+    parser.add_argument("banks", nargs="*", type=_bank,
+                        help=f"Yoklanacak scraper'lar (varsayılan: {' '.join(DEFAULT_BANKS)})")
+    parser.add_argument("--min-interval", type=parse_duration, default=parse_duration("5m"),
+                        help="En kısa yoklama aralığı (örn. 5m)")
+    parser.add_argument("--max-interval", type=parse_duration, default=parse_duration("6h"),
+                        help="En uzun yoklama aralığı (örn. 6h)")
+    parser.add_argument("--state", default=DEFAULT_STATE, help="Yoklama geçmişi ve zamanlama dosyası")
+    parser.add_argument("--emit", default="-", help="Kayıtların ekleneceği NDJSON dosyası ('-' = stdout)")
+    parser.add_argument("--once", action="store_true", help="Her bankayı bir kez yokla ve çık")
+    args = parser.parse_args(argv)
+
+    sink = sys.stdout if args.emit == "-" else open(args.emit, 'a', encoding='utf-8')
+    watcher = Watcher(args.banks or DEFAULT_BANKS, args.state, args.min_interval, args.max_interval, extra, sink)
+    signal.signal(signal.SIGTERM, lambda *_: setattr(watcher, "stopping", True))
+    log(f"👀 İzleniyor: {', '.join(watcher.banks)} (aralık {args.min_interval / 60:.0f} dk - {args.max_interval / 3600:.1f} saat)")
+    try:
+        return watcher.run(once=args.once)
+    except KeyboardInterrupt:
+        log("\n⛔ İzleme durduruldu.")
+        return 0
+    finally:
+        if sink is not sys.stdout: sink.close()
@@ -1,32 +1,37 @@
 
 import time
-import json
 import random
 import os
 import sys
 import ssl
-import undetected_chromedriver as uc
 
 # MacOS SSL Fix
 ssl._create_default_https_context = ssl._create_unverified_context
 
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
 from bs4 import BeautifulSoup
 
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from common.frontier import build_frontier, shard_output_file, listing_path, carry_over
+from common.sites import site_urls
+from common.cli import scraper_parser, start_run
+from common.records import RawCampaign, write_json
+from common.paraf import temizle_metin
+from common.confidence import assess_raw, record, format_bypass
+from common.reducer import add_reducer_arguments, build_reducer, format_reduction
+from common.fingerprint import build_deduper, SKIP_DUPLICATE
+from common.changes import open_changes, read_snapshot, skip_unchanged
+from common.browser import import_uc
+from common.pageguard import PageGuard, PageRejected, check_driver
+
 # --- CONFIGURATION ---
-BASE_URL = "https://www.paraf.com.tr"
-START_URL = "https://www.paraf.com.tr/tr/kampanyalar.html"
+BASE_URL, START_URL = site_urls("paraf", BASE_URL="https://www.paraf.com.tr",
+                                START_URL="https://www.paraf.com.tr/tr/kampanyalar.html")
 OUTPUT_FILE = "paraf_kampanyalar_raw.json"
-# Parse limit from args
 CAMPAIGN_LIMIT = 1000
-if len(sys.argv) > 1 and "--limit" in sys.argv:
-    try:
-        idx = sys.argv.index("--limit")
-        CAMPAIGN_LIMIT = int(sys.argv[idx + 1])
-    except: pass
-print(f"   🎯 Limit: {CAMPAIGN_LIMIT}")
+DETAIL_MARKERS = ("master-banner", "cmp-text")  # geçerli detay sayfasının işaretleri
+# Ara kayıt: her kayıtta tüm dosyayı yeniden yazmak O(n²) G/Ç; N kayıtta veya süre dolunca yazılır
+SAVE_EVERY = 25
+SAVE_INTERVAL_S = 60
 
 def get_random_user_agent():
     user_agents = [
@@ -37,6 +42,7 @@ def get_random_user_agent():
     return random.choice(user_agents)
 
 def setup_driver():
+    uc = import_uc()
     options = uc.ChromeOptions()
     options.add_argument(f"user-agent={get_random_user_agent()}")
     options.add_argument("--no-sandbox")
@@ -47,21 +53,23 @@ def setup_driver():
     driver = uc.Chrome(options=options)
     return driver
 
-def scroll_and_click_more(driver):
+def scroll_and_click_more(driver, metrics, limit=CAMPAIGN_LIMIT):
+    from selenium.webdriver.common.by import By
+
     print("   🔄 Scroll ve 'Daha Fazla' butonu kontrol ediliyor...")
     
     # Initial load wait
-    time.sleep(5) 
+    metrics.sleep(5)
     
     click_count = 0
     max_clicks = 30
-    if CAMPAIGN_LIMIT < 20: max_clicks = 1  # Optimize for testing
+    if limit < 20: max_clicks = 1  # Optimize for testing
     
     while click_count < max_clicks:
         try:
             # Scroll to bottom to trigger events
             driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(2)
+            metrics.sleep(2)
             
             # Find visible "Daha Fazla" buttons
             buttons = driver.find_elements(By.CSS_SELECTOR, ".button--more-campaign a, a.btn-more, button")
@@ -71,7 +79,8 @@ def scroll_and_click_more(driver):
                 if btn.is_displayed() and "DAHA FAZLA" in btn.text.strip().upper():
                     print(f"   👇 'Daha Fazla'ya tıklanıyor ({click_count+1})...")
                     driver.execute_script("arguments[0].click();", btn)
-                    time.sleep(3) # Wait for content
+                    metrics.count("load_more_clicks")
+                    metrics.sleep(3) # Wait for content
                     clicked = True
                     click_count += 1
                     break
@@ -84,13 +93,13 @@ def scroll_and_click_more(driver):
             print(f"   ⚠️ Scroll Hatası: {e}")
             break
 
-def scrape_list_page(driver):
+def scrape_list_page(driver, frontier, metrics, limit=CAMPAIGN_LIMIT):
     print(f"   🌐 Liste taranıyor: {START_URL}")
-    driver.get(START_URL)
-    scroll_and_click_more(driver)
+    with metrics.span("listing_get", START_URL): driver.get(START_URL)
+    scroll_and_click_more(driver, metrics, limit)
     
-    soup = BeautifulSoup(driver.page_source, 'html.parser')
-    links = []
+    with metrics.span("page_source"): html = driver.page_source
+    with metrics.span("parse"): soup = BeautifulSoup(html, 'html.parser')
     
     # Paraf Reference Selector: .cmp-list--campaigns .cmp-teaser__title a
     items = soup.select('.cmp-list--campaigns .cmp-teaser__title a')
@@ -106,35 +115,47 @@ def scrape_list_page(driver):
         href = item.get('href')
         if href and "/kampanyalar/" in href and not href.endswith("kampanyalar.html"):
             full_url = href if href.startswith("http") else BASE_URL + href
-            if full_url not in links:
-                links.append(full_url)
+            frontier.add(full_url, meta={"title": temizle_metin(item.get_text())})
                 
-    return links[:CAMPAIGN_LIMIT]
+    return frontier
+
+def robust_get(driver, url, metrics, guard, max_retries=3):
+    """Sayfayı yükler ve HTML'i döner; challenge/hata/boş sayfada PageRejected, bağlantı kurulamazsa None."""
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.support.ui import WebDriverWait
+    from selenium.webdriver.support import expected_conditions as EC
 
-def robust_get(driver, url, max_retries=3):
     for attempt in range(max_retries):
         try:
-            driver.get(url)
-            # Wait for meaningful content
-            WebDriverWait(driver, 20).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, "h1"))
-            )
-            return True
+            with metrics.span("get", url): driver.get(url)
+            break
         except Exception as e:
             print(f"      ⚠️ Bağlantı hatası ({attempt+1}/{max_retries}): {str(e)[:50]}...")
+            metrics.retry("get", url)
             try:
                 driver.delete_all_cookies()
             except: pass
-            time.sleep(random.uniform(10, 20))
-    return False
+            metrics.sleep(random.uniform(10, 20), url)
+    else:
+        return None
+    # Challenge/hata sayfası yükten hemen sonra tanınır; h1 yalnızca sayfa henüz çiziliyorsa beklenir
+    verdict, html = check_driver(driver, url, metrics, guard)
+    if verdict.ok: return html
+    with metrics.span("wait", url):
+        try: WebDriverWait(driver, 20).until(EC.presence_of_element_located((By.CSS_SELECTOR, "h1")))
+        except Exception: metrics.count("wait_timeouts")
+    return check_driver(driver, url, metrics, guard, final=True)[1]
 
-def scrape_detail(driver, url):
-    if not robust_get(driver, url):
+def scrape_detail(driver, url, metrics, guard, reducer=None, dedup=None):
+    html = robust_get(driver, url, metrics, guard)
+    if html is None:
         print("      ❌ Sayfa yüklenemedi, atlanıyor.")
         return None
 
-    soup = BeautifulSoup(driver.page_source, 'html.parser')
-    
+    with metrics.span("parse", url): soup = BeautifulSoup(html, 'html.parser')
+    with metrics.span("extract", url): return parse_detail(soup, url, reducer, dedup)
+
+def parse_detail(soup, url, reducer=None, dedup=None):
     # 1. Title
     title_el = soup.select_one('.master-banner__content h1') or soup.select_one('h1')
     title = title_el.text.strip() if title_el else "Başlıksız Kampanya"
@@ -179,57 +200,111 @@ def scrape_detail(driver, url):
     content_div = soup.select_one('.text--use-ulol .cmp-text') or soup.select_one('.cmp-text')
     
     description = ""
-    detail_html = ""
     
     if content_div:
         # P tags for short description
         ps = content_div.find_all('p')
         description = " ".join([p.text.strip() for p in ps[:2]]) # First 2 paragraphs as summary
-        detail_html = str(content_div) # Keep full HTML for AI
     else:
         # Fallback to body text if no container found
         description = title
-        detail_html = str(soup.body)
-
-    return {
-        "url": url,
-        "title": title,
-        "description": description,
-        "detail_html": detail_html, # Critical for AI
-        "image": image,
-        "bank": "Halkbank",
-        "card": "Paraf"
-    }
+    # Keep full HTML for AI; --detail-text adds reduced text alongside or instead of it
+    detail_node = content_div or soup.body or soup
+    detail_html, detail_text = reducer.apply(detail_node) if reducer else (str(detail_node), None)
+    # Paraf v25 kurallarıyla ön çıkarım; güven yüksekse AI atlanabilir
+    text = temizle_metin((content_div or soup.body or soup).get_text(" "))
+
+    return RawCampaign(
+        url=url,
+        title=title,
+        description=description,
+        detail_html=detail_html, # Critical for AI
+        image=image,
+        bank="Halkbank",
+        card="Paraf",
+        extraction=assess_raw("paraf", text, title),
+        detail_text=detail_text,
+        fingerprint=dedup.check(url, title, text, "paraf") if dedup else None,
+    )
 
 def main():
+    started_at = time.monotonic()
+    parser = scraper_parser()
+    parser.add_argument("--limit", type=int, default=CAMPAIGN_LIMIT, help="İşlenecek en fazla kampanya")
+    add_reducer_arguments(parser)
+    args = parser.parse_args()
+    output_file = shard_output_file(OUTPUT_FILE, args.shard)
+    stream, metrics = start_run(args, "halkbank_paraf", output_file)
+    reducer = build_reducer(args, metrics)
+    dedup = build_deduper(args, metrics)
+    changes = open_changes(args, "paraf", output_file)
     print("🚀 Paraf Python Scraper Başlatılıyor (Hybrid Mode)...")
-    driver = setup_driver()
+    print(f"   🎯 Limit: {args.limit}")
+    with metrics.span("driver_start"): driver = setup_driver()
+    frontier = build_frontier(args, "paraf", OUTPUT_FILE, started_at, listing_path(output_file))
+    guard = PageGuard(metrics, frontier, expect=DETAIL_MARKERS)
+    previous = read_snapshot(OUTPUT_FILE)
+    results, saved, last_save = [], 0, time.monotonic()
     
     try:
-        links = scrape_list_page(driver)
-        print(f"   🎯 Toplam {len(links)} kampanya işlenecek.")
+        scrape_list_page(driver, frontier, metrics, args.limit)
+        if skip_unchanged(args, frontier, metrics, changes): return
+        total = min(len(frontier), args.limit)
+        print(f"   🎯 Toplam {total} kampanya işlenecek. Frontier: {frontier.summary()}")
         
-        results = []
-        for i, link in enumerate(links):
-            print(f"   [{i+1}/{len(links)}] İşleniyor: {link}")
-            data = scrape_detail(driver, link)
-            if data:
+        for i, link in enumerate(frontier):
+            if i >= args.limit: break
+            print(f"   [{i+1}/{total}] İşleniyor: {link}")
+            fetch_started = time.monotonic()
+            guard.wait(link)
+            try: data = scrape_detail(driver, link, metrics, guard, reducer, dedup)
+            except PageRejected as e:
+                if guard.handle(e.verdict, link):
+                    driver.quit()
+                    with metrics.span("driver_start"): driver = setup_driver()
+                frontier.record_fetch(time.monotonic() - fetch_started)
+                continue
+            dropped = data is not None and dedup.is_dropped(data.fingerprint)
+            if dropped:
+                metrics.skip(SKIP_DUPLICATE, link)
+                print(f"   = Kopya atlandı -> {data.fingerprint['duplicate_of']}")
+            metrics.page(link, "skipped" if dropped else "ok" if data else "error")
+            if data and not dropped:
                 results.append(data)
-                # Save continually
-                with open(OUTPUT_FILE, 'w', encoding='utf-8') as f:
-                    json.dump(results, f, ensure_ascii=False, indent=4)
-            time.sleep(random.uniform(2, 5)) # Polite delay
+                record(metrics, data.extraction)
+                if stream: stream.emit(data)
+                if len(results) - saved >= SAVE_EVERY or time.monotonic() - last_save >= SAVE_INTERVAL_S:
+                    with metrics.span("write"): write_json(output_file, carry_over(previous, results, frontier))
+                    saved, last_save = len(results), time.monotonic()
+            metrics.sleep(random.uniform(2, 5), link) # Polite delay
+            frontier.record_fetch(time.monotonic() - fetch_started)
+        
+        if frontier.deadline_hit:
+            print(f"   ⏱️ Zaman bütçesi doldu: {frontier.summary()}")
+        frontier.save_archive(args.seen_archive)
+        dedup.save()
             
         # Final Save
-        with open(OUTPUT_FILE, 'w', encoding='utf-8') as f:
-            json.dump(results, f, ensure_ascii=False, indent=4)
+        results = carry_over(previous, results, frontier)
+        with metrics.span("write"): write_json(output_file, results)
+        frontier.save_listing(listing_path(output_file))
             
-        print(f"\n✅ İşlem Tamamlandı! {len(results)} kampanya kaydedildi: {OUTPUT_FILE}")
+        print(f"\n✅ İşlem Tamamlandı! {len(results)} kampanya kaydedildi: {output_file}")
+        print(f"   🤖 {format_bypass(metrics.counters)}")
+        if reducer.mode != "off": print(f"   ✂️ {format_reduction(metrics.counters)}")
+        print(f"   🧬 {dedup.summary()}")
+        print(f"   🛡️ {guard.summary()}")
+        # limit < 20 iken liste tek "Daha Fazla" tıklamasıyla kısaltılır
+        changes.write(results, frontier, complete=args.limit >= 20)
         
     except Exception as e:
         print(f"\n❌ Kritik Hata: {e}")
+        # Son ara kayıttan sonra toplananlar kaybolmasın
+        if len(results) > saved: write_json(output_file, carry_over(previous, results, frontier))
     finally:
         driver.quit()
+        if stream: stream.close()
+        metrics.write()
 
 if __name__ == "__main__":
     main()
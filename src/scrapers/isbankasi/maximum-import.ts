@@ -9,6 +9,7 @@ import { lookupIDs } from '../../utils/idMapper';
 import { assignBadge } from '../../services/badgeAssigner';
 import { markGenericBrand } from '../../utils/genericDetector';
 import { downloadImageDirectly } from '../../services/imageService';
+import { loadChangeFeed, deltaRecords, deactivateRemoved } from '../../utils/changeFeed';
 
 dotenv.config();
 
@@ -24,6 +25,33 @@ const CARD_CONFIG = {
 
 const sleep = (ms: number) => new Promise(resolve => setTimeout(resolve, ms));
 
+// --trust-extraction: campaigns the Python scraper scored as `skip` (see common/confidence.py)
+// are imported from their deterministic fields without a Gemini call.
+const TRUST_EXTRACTION = process.argv.includes('--trust-extraction');
+// --changes: import only new/modified campaigns from maximum_campaigns_full.changes.json
+// (see common/changes.py) and deactivate removed ones.
+const CHANGES_ONLY = process.argv.includes('--changes');
+
+function fieldsFromPython(pythonData: any) {
+    return {
+        title: pythonData.title,
+        description: pythonData.description,
+        category: pythonData.category,
+        merchant: pythonData.merchant,
+        brand: pythonData.merchant ? [pythonData.merchant] : undefined,
+        min_spend: pythonData.min_spend,
+        earning: pythonData.earning,
+        discount: pythonData.discount,
+        max_discount: pythonData.max_discount,
+        valid_from: pythonData.valid_from,
+        valid_until: pythonData.valid_until,
+        eligible_customers: pythonData.eligible_customers,
+        participation_method: pythonData.participation_method,
+        conditions: pythonData.conditions,
+        ai_enhanced: false
+    };
+}
+
 async function importMaximumCampaigns() {
     const normalizedBank = await normalizeBankName(CARD_CONFIG.bankName);
     const normalizedCard = await normalizeCardName(normalizedBank, CARD_CONFIG.cardName);
@@ -39,16 +67,33 @@ async function importMaximumCampaigns() {
         return;
     }
 
-    const campaigns: any[] = JSON.parse(fs.readFileSync(jsonPath, 'utf8'));
+    let campaigns: any[] = JSON.parse(fs.readFileSync(jsonPath, 'utf8'));
     console.log(`📋 Loaded ${campaigns.length} campaigns from Python\n`);
 
-    // Optimize
-    const urls = campaigns.map(c => c.url);
-    const { urlsToProcess } = await optimizeCampaigns(urls, normalizedCard);
+    let urlsToProcess: string[];
+    if (CHANGES_ONLY) {
+        const feed = loadChangeFeed(jsonPath);
+        if (!feed) return;
+        await deactivateRemoved(feed, normalizedCard);
+        // Modified campaigns bypass the optimizer: they are already complete in the DB but changed on the site
+        const added = await optimizeCampaigns(feed.added.map(c => c.url), normalizedCard);
+        urlsToProcess = [...added.urlsToProcess, ...feed.modified.map(m => m.url)];
+        campaigns = deltaRecords(feed);
+    } else {
+        // Optimize
+        const urls = campaigns.map(c => c.url);
+        ({ urlsToProcess } = await optimizeCampaigns(urls, normalizedCard));
+    }
     console.log(`   🚀 Processing ${urlsToProcess.length} campaigns\n`);
 
     // Create URL map
     const campaignMap = new Map(campaigns.map(c => [c.url, c]));
+    const scored = campaigns.filter(c => c.extraction);
+    if (scored.length > 0) {
+        const wouldSkip = scored.filter(c => c.extraction.ai === 'skip').length;
+        console.log(`   🤖 ${wouldSkip}/${scored.length} (${Math.round(100 * wouldSkip / scored.length)}%) could bypass AI` +
+            (TRUST_EXTRACTION ? ' (--trust-extraction on)' : '') + '\n');
+    }
 
     // Process each
     for (const url of urlsToProcess) {
@@ -56,14 +101,15 @@ async function importMaximumCampaigns() {
         if (!pythonData) continue;
 
         console.log(`   🔍 ${pythonData.title.substring(0, 40)}...`);
+        const skipAi = TRUST_EXTRACTION && pythonData.extraction?.ai === 'skip';
 
         try {
             // AI Processing
             let campaignData: any = {};
             try {
-                console.log(`      🧠 AI processing...`);
-                campaignData = await parseWithGemini(
-                    pythonData.raw_html || pythonData.description,
+                console.log(skipAi ? `      ⚡ AI skipped (confidence ${pythonData.extraction.confidence})` : `      🧠 AI processing...`);
+                campaignData = skipAi ? fieldsFromPython(pythonData) : await parseWithGemini(
+                    pythonData.raw_text || pythonData.raw_html || pythonData.description,
                     url,
                     normalizedBank,
                     normalizedCard
@@ -155,7 +201,7 @@ async function importMaximumCampaigns() {
             console.error(`      ❌ Error: ${error.message}`);
         }
 
-        await sleep(1500);
+        if (!skipAi) await sleep(1500);
     }
 
     console.log(`\n✅ Maximum import completed!`);
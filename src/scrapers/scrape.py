@@ -0,0 +1,11 @@
+"""Python scraper'larının ortak giriş noktası; yalnızca seçilen scraper yüklenir.
+
+    python3 src/scrapers/scrape.py --list
+    python3 src/scrapers/scrape.py vakifbank --deadline 20m --stdout-ndjson
+"""
+import sys
+
+from common.cli import main
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,29 @@
+-- Yerel sink testleri için en küçük `campaigns` tablosu (sink.compose.yml).
+-- Sütun adları ve tekil indeks Supabase'deki tabloyla aynıdır (migrations/add_missing_columns.sql).
+CREATE TABLE IF NOT EXISTS campaigns (
+    id BIGSERIAL PRIMARY KEY,
+    title TEXT,
+    slug TEXT,
+    url TEXT,
+    reference_url TEXT,
+    image TEXT,
+    description TEXT,
+    bank TEXT,
+    card_name TEXT,
+    category TEXT,
+    merchant TEXT,
+    min_spend NUMERIC DEFAULT 0,
+    earning TEXT,
+    discount TEXT,
+    max_discount NUMERIC,
+    valid_from TEXT,
+    valid_until TEXT,
+    eligible_customers TEXT[],
+    participation_method TEXT,
+    conditions TEXT[],
+    is_active BOOLEAN DEFAULT true,
+    publish_status TEXT NOT NULL DEFAULT 'processing',
+    created_at TIMESTAMPTZ DEFAULT NOW()
+);
+
+CREATE UNIQUE INDEX IF NOT EXISTS campaigns_reference_url_key ON campaigns(reference_url);
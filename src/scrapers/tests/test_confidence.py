@@ -0,0 +1,24 @@
+"""confidence: doğrulanmamış ailelerde AI atlanmaz; ham kayıt alanları importer'ın beklediği kümedir."""
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from common.confidence import assess_raw
+from common.extract import extract_document
+
+TITLE = "Market'te 1.000 TL'ye 100 TL İndirim"
+TEXT = ("1-31 Aralık 2026 tarihleri arasında 1.000 TL ve üzeri harcamaya 100 TL indirim, "
+        "en fazla 100 TL. World kartlarla geçerlidir. MARKET yazıp 4402'ye SMS gönderin.")
+
+
+def test_vakifbank_is_never_skipped():
+    for report in (assess_raw("vakifbank", TEXT, TITLE),
+                   extract_document({"title": TITLE, "text": TEXT, "bank": "Vakıfbank"}, confidence=True)["extraction"]):
+        assert report["ai"] == "full"
+        assert "unvalidated_family" in report["conflicts"]
+
+
+def test_maximum_fields_include_eligible_customers():
+    report = assess_raw("maximum", TEXT, TITLE)
+    assert "eligible_customers" in report["fields"]
+    assert "unvalidated_family" not in report["conflicts"]
@@ -0,0 +1,23 @@
+"""maximum: liste kartı filtresi kısa ama gerçek kampanya başlıklarını elemez."""
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from common.maximum import SKIP_MENU, card_skip_reason, title_skip_reason
+
+
+@pytest.mark.parametrize("title", ["Market'te 50 TL", "Akaryakıta 9 taksit", "THY'de 500 TL"])
+def test_short_card_titles_are_kept(title):
+    assert card_skip_reason({"title": title}) is None
+
+
+@pytest.mark.parametrize("title", ["Elektronik", "Dekorasyon", "Kampanyalar"])
+def test_menu_labels_are_skipped_on_cards(title):
+    assert card_skip_reason({"title": title}) == SKIP_MENU
+
+
+def test_short_title_rule_still_applies_to_detail_h1():
+    assert title_skip_reason("Market'te 50 TL") == SKIP_MENU
+    assert title_skip_reason("Market'te 50 TL", check_menu=False) is None
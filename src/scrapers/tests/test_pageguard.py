@@ -0,0 +1,73 @@
+"""pageguard.classify: hata / challenge sayfaları ile gerçek kampanya başlıklarının ayrımı."""
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from common.pageguard import classify
+
+BODY = "<html><body>" + "x" * 4000 + "</body></html>"  # EMPTY_BYTES üstü, beklenen işaret yok
+
+CAMPAIGN_TITLES = [
+    "Market alışverişine 500 TL bonus",
+    "Robot süpürgede 6 taksit",
+    "404 TL indirim fırsatı",
+    "Akaryakıtta 503 TL'ye varan MaxiPuan",
+    "Elektronikte 1.500 TL chip-para",
+    "Bir dakika bile kaybetme: 250 TL indirim",
+    "Hata yapmayın, taksitli alışverişe 200 TL",
+    "Bulunamadı sanmayın, 100 TL puan sizi bekliyor",
+]
+
+
+@pytest.mark.parametrize("title", CAMPAIGN_TITLES)
+def test_campaign_titles_are_not_rejected(title):
+    assert classify(BODY, title=title, expect=(".detail",)).kind == "pending"
+
+
+@pytest.mark.parametrize("title", CAMPAIGN_TITLES)
+def test_campaign_titles_with_marker_are_ok(title):
+    assert classify(BODY + '<div class="detail"></div>', title=title, expect=(".detail", 'class="detail"')).ok
+
+
+@pytest.mark.parametrize("title, kind", [
+    ("Just a moment...", "challenge"),
+    ("Attention Required! | Cloudflare", "challenge"),
+    ("ERİŞİM ENGELLENDİ", "challenge"),
+    ("Robot", "challenge"),
+    ("429 Too Many Requests", "rate_limited"),
+    ("404 Not Found", "not_found"),
+    ("Sayfa bulunamadı", "not_found"),
+    ("503 Service Unavailable", "error"),
+    ("502 Bad Gateway", "error"),
+    ("Bir hata oluştu", "error"),
+    ("Bakımdayız!", "error"),
+])
+def test_error_titles(title, kind):
+    assert classify(BODY, title=title).kind == kind
+
+
+def test_status_code_only_from_http_status():
+    title = "Market alışverişine 500 TL bonus"
+    assert classify(BODY, title=title, status=200, expect=(".detail",)).kind == "pending"
+    assert classify(BODY, title=title, status=503).kind == "error"
+    assert classify(BODY, title=title, status=404).kind == "not_found"
+
+
+def test_h1_fallback_for_untitled_error_pages():
+    assert classify("<html><body><h1>503 Service Unavailable</h1></body></html>" + BODY).kind == "error"
+    assert classify("<html><body><h1>Sayfa bulunamadı</h1></body></html>" + BODY).kind == "not_found"
+    assert classify("<html><body><h1>500 TL'ye 50 TL indirim</h1></body></html>" + BODY).ok
+
+
+def test_final_check_passes_full_size_pages_without_markers_to_the_parser():
+    # Kategori/menü sayfaları ayrıştırıcının başlık filtresine kalır, tekrar geçişine ertelenmez
+    assert classify(BODY, title="Elektronik", expect=(".detail",), final=True).ok
+    assert classify("<html></html>", title="Elektronik", expect=(".detail",), final=True).kind == "empty"
+
+
+def test_maximum_backup_selectors_are_markers():
+    from common.maximum_crawl import DETAIL_MARKERS
+    for html in ('<div class="detail-text">', '<div class="content-body">'):
+        assert classify(BODY + html, expect=DETAIL_MARKERS).ok
@@ -0,0 +1,81 @@
+"""sink: var olan kampanyada yalnızca scraper'ın sahip olduğu sütunlar güncellenir."""
+import os
+import sys
+import json
+import types
+import threading
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from common.sink import INSERT_ONLY, PostgresTarget, PostgrestTarget, campaign_row
+
+RECORD = {"title": "Market'te 500 TL bonus", "url": "https://example.com/k/1", "bank": "Paraf",
+          "image": "https://example.com/k/1.jpg", "description": "Ham açıklama",
+          "extraction": {"ai": "skip", "fields": {"category": "Market", "min_spend": 1000}}}
+
+
+class FakeConnectionPool:
+    """psycopg_pool.ConnectionPool yerine: çalıştırılan deyimleri kaydeder."""
+    instances = []
+
+    def __init__(self, dsn, min_size=1, max_size=1, open=True):
+        self.dsn, self.max_size, self.executed, self.closed = dsn, max_size, [], False
+        FakeConnectionPool.instances.append(self)
+
+    @contextmanager
+    def connection(self):
+        yield types.SimpleNamespace(execute=lambda sql, params: self.executed.append((sql, params)))
+
+    def close(self):
+        self.closed = True
+
+
+def test_postgres_update_skips_insert_only_columns(monkeypatch):
+    monkeypatch.setitem(sys.modules, "psycopg_pool", types.SimpleNamespace(ConnectionPool=FakeConnectionPool))
+    target = PostgresTarget("postgres://localhost/test", "campaigns", "reference_url", size=2)
+    assert target.v3 and target.pool.max_size == 2
+    row = campaign_row(RECORD)
+    columns = list(row)
+    target.upsert(columns, [row, dict(row, url="https://example.com/k/2", reference_url="https://example.com/k/2")])
+    target.close()
+    (sql, params), = target.pool.executed
+    assert target.pool.closed and len(params) == 2 * len(columns)
+    insert, update = sql.split(" DO UPDATE SET ")
+    assert all(f'"{c}"' in insert for c in columns)
+    assert update.split(", ") == ['"url" = EXCLUDED."url"', '"bank" = EXCLUDED."bank"']
+    assert not any(f'"{c}"' in update for c in INSERT_ONLY)
+
+
+def test_postgrest_inserts_then_updates_without_insert_only_columns():
+    requests = []
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_POST(self):
+            body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+            requests.append((self.headers["Prefer"], self.path, body))
+            self.send_response(201)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        target = PostgrestTarget(f"http://127.0.0.1:{server.server_address[1]}", "campaigns", "reference_url")
+        row = campaign_row(RECORD)
+        target.upsert(list(row), [row])
+        target.close()
+    finally:
+        server.shutdown()
+    (insert_prefer, _, inserted), (update_prefer, update_path, updated) = requests
+    assert insert_prefer.startswith("resolution=ignore-duplicates")
+    assert inserted[0]["slug"] == "markette-500-tl-bonus" and inserted[0]["is_active"] is True
+    assert inserted[0]["title"] == RECORD["title"] and inserted[0]["category"] == "Market"
+    assert update_prefer.startswith("resolution=merge-duplicates")
+    assert set(updated[0]) == {"url", "reference_url", "bank"}
+    assert "slug" not in update_path and "title" not in update_path
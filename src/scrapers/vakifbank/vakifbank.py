@@ -1,28 +1,33 @@
 
-import argparse
-import json
 import time
-import random
 import os
+import sys
 import ssl
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
 from bs4 import BeautifulSoup
 from urllib.parse import urljoin
 
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from common.frontier import build_frontier, shard_output_file, listing_path, carry_over
+from common.sites import site_urls
+from common.cli import scraper_parser, start_run
+from common.records import RawCampaign, write_json
+from common.maximum import temizle_metin
+from common.confidence import assess_raw, record, format_bypass
+from common.reducer import add_reducer_arguments, build_reducer, format_reduction
+from common.fingerprint import build_deduper, SKIP_DUPLICATE
+from common.changes import open_changes, read_snapshot, skip_unchanged
+from common.browser import selenium_chrome, chrome_options
+
 ssl._create_default_https_context = ssl._create_unverified_context
 
-BASE_URL = "https://www.vakifkart.com.tr"
-LIST_URL_TEMPLATE = "https://www.vakifkart.com.tr/kampanyalar/sayfa/{}"
+BASE_URL, START_URL, LIST_URL_TEMPLATE = site_urls(
+    "vakifbank", BASE_URL="https://www.vakifkart.com.tr",
+    START_URL="https://www.vakifkart.com.tr/kampanyalar",
+    LIST_URL_TEMPLATE="https://www.vakifkart.com.tr/kampanyalar/sayfa/{}")
 OUTPUT_FILE = "vakifbank_kampanyalar_raw.json"
 
 def get_driver():
-    options = Options()
+    options = chrome_options()
     options.add_argument("--headless=new")
     options.add_argument("--window-size=1920,1080")
     options.add_argument("--disable-popup-blocking")
@@ -31,43 +36,47 @@ def get_driver():
     prefs = {"profile.managed_default_content_settings.images": 2} 
     options.add_experimental_option("prefs", prefs)
 
-    service = Service(ChromeDriverManager().install())
-    driver = webdriver.Chrome(service=service, options=options)
-    return driver
+    return selenium_chrome(options)
 
-def robust_get(driver, url, retries=3):
+def robust_get(driver, url, metrics, retries=3, stage="get"):
     for i in range(retries):
         try:
-            driver.get(url)
+            with metrics.span(stage, url): driver.get(url)
             return True
         except Exception as e:
             print(f"⚠️ Load error (Attempt {i+1}/{retries}): {e}")
-            time.sleep(3)
+            metrics.retry(stage, url)
+            metrics.sleep(3, url)
     return False
 
-def scrape_list_page(driver, limit=None):
+def scrape_list_page(driver, frontier, metrics, limit=None):
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.support.ui import WebDriverWait
+    from selenium.webdriver.support import expected_conditions as EC
+
     print("📋 Collecting campaign links...")
-    links = []
     page = 1
     
     while True:
         if page == 1:
-            url = "https://www.vakifkart.com.tr/kampanyalar"
+            url = START_URL
         else:
             url = LIST_URL_TEMPLATE.format(page)
             
         print(f"   Getting page {page}: {url}")
         
-        if not robust_get(driver, url):
+        if not robust_get(driver, url, metrics, stage="listing_get"):
             break
             
         try:
             # Wait for list
-            WebDriverWait(driver, 10).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, "div.mainKampanyalarDesktop"))
-            )
+            with metrics.span("wait", url):
+                WebDriverWait(driver, 10).until(
+                    EC.presence_of_element_located((By.CSS_SELECTOR, "div.mainKampanyalarDesktop"))
+                )
             
-            items = driver.find_elements(By.CSS_SELECTOR, "div.mainKampanyalarDesktop:not(.eczk) .list a.item")
+            with metrics.span("extract", url):
+                items = driver.find_elements(By.CSS_SELECTOR, "div.mainKampanyalarDesktop:not(.eczk) .list a.item")
             if not items:
                 print("   No more items found.")
                 break
@@ -75,99 +84,145 @@ def scrape_list_page(driver, limit=None):
             new_links = 0
             for item in items:
                 href = item.get_attribute('href')
-                if href and href not in links:
-                    links.append(href)
+                if href and frontier.add(href, meta={"title": temizle_metin(item.text)}):
                     new_links += 1
             
-            print(f"   -> Found {new_links} new campaigns. Total: {len(links)}")
+            print(f"   -> Found {new_links} new campaigns. Total: {len(frontier)}")
             
             if new_links == 0:
                 break
 
-            if limit and len(links) >= limit:
+            if limit and len(frontier) >= limit:
                 print(f"   🛑 Limit reached ({limit}). Stopping.")
-                links = links[:limit]
                 break
                 
             page += 1
-            time.sleep(1)
+            metrics.sleep(1)
             
         except Exception as e:
             print(f"   ⚠️ Error page {page}: {e}")
             break
             
-    return links
+    return frontier
 
-def scrape_detail(driver, url):
-    if not robust_get(driver, url):
+def scrape_detail(driver, url, metrics, reducer=None, dedup=None):
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.support.ui import WebDriverWait
+    from selenium.webdriver.support import expected_conditions as EC
+
+    if not robust_get(driver, url, metrics):
         return None
         
     try:
         # Title wait
-        try:
-            WebDriverWait(driver, 5).until(EC.presence_of_element_located((By.CSS_SELECTOR, "h1")))
-        except: pass
+        with metrics.span("wait", url):
+            try:
+                WebDriverWait(driver, 5).until(EC.presence_of_element_located((By.CSS_SELECTOR, "h1")))
+            except: metrics.count("wait_timeouts")
 
-        soup = BeautifulSoup(driver.page_source, 'html.parser')
-        
-        # 1. Title
-        title_el = soup.select_one('.kampanyaDetay .title h1') or soup.find('h1')
-        title = title_el.get_text(strip=True) if title_el else "Başlık Yok"
-        
-        # 2. Content
-        content_div = soup.select_one('.kampanyaDetay .contentSide')
-        detail_html = str(content_div) if content_div else ""
-        
-        # 3. Description
-        description = title
-        if content_div:
-            desc_el = content_div.select_one('p') or content_div.select_one('li')
-            if desc_el: description = desc_el.get_text(strip=True)
-
-        # 4. Image
-        img_el = soup.select_one('.kampanyaDetay .coverSide img')
-        image = urljoin(BASE_URL, img_el['src']) if img_el else None
-        
-        return {
-            "url": url,
-            "title": title,
-            "description": description,
-            "detail_html": detail_html,
-            "image": image,
-            "bank": "Vakıfbank",
-            "card": "Vakıfbank World"
-        }
-        
+        with metrics.span("page_source", url): html = driver.page_source
+        with metrics.span("parse", url): soup = BeautifulSoup(html, 'html.parser')
+        with metrics.span("extract", url): return parse_detail(soup, url, reducer, dedup)
     except Exception as e:
         print(f"   ❌ Error detail: {e}")
         return None
 
+def parse_detail(soup, url, reducer=None, dedup=None):
+    # 1. Title
+    title_el = soup.select_one('.kampanyaDetay .title h1') or soup.find('h1')
+    title = title_el.get_text(strip=True) if title_el else "Başlık Yok"
+    
+    # 2. Content
+    content_div = soup.select_one('.kampanyaDetay .contentSide')
+    detail_html, detail_text = "", None
+    if content_div:
+        detail_html, detail_text = reducer.apply(content_div) if reducer else (str(content_div), None)
+    
+    # 3. Description
+    description = title
+    if content_div:
+        desc_el = content_div.select_one('p') or content_div.select_one('li')
+        if desc_el: description = desc_el.get_text(strip=True)
+
+    # 4. Image
+    img_el = soup.select_one('.kampanyaDetay .coverSide img')
+    image = urljoin(BASE_URL, img_el['src']) if img_el else None
+    text = temizle_metin(content_div.get_text(" ")) if content_div else ""
+    
+    return RawCampaign(
+        url=url,
+        title=title,
+        description=description,
+        detail_html=detail_html,
+        image=image,
+        bank="Vakıfbank",
+        card="Vakıfbank World",
+        extraction=assess_raw("vakifbank", text, title),
+        detail_text=detail_text,
+        fingerprint=dedup.check(url, title, text, "vakifbank") if dedup else None,
+    )
+
 def main():
-    parser = argparse.ArgumentParser()
+    parser = scraper_parser()
     parser.add_argument("--limit", type=int, help="Limit")
+    add_reducer_arguments(parser)
     args = parser.parse_args()
+    started_at = time.monotonic()
+    output_file = shard_output_file(OUTPUT_FILE, args.shard)
+    stream, metrics = start_run(args, "vakifbank", output_file)
+    reducer = build_reducer(args, metrics)
+    dedup = build_deduper(args, metrics)
+    changes = open_changes(args, "vakifbank", output_file)
     
-    driver = get_driver()
+    with metrics.span("driver_start"): driver = get_driver()
     all_data = []
+    frontier = build_frontier(args, "vakifbank", OUTPUT_FILE, started_at, listing_path(output_file))
     
     try:
-        links = scrape_list_page(driver, limit=args.limit)
+        scrape_list_page(driver, frontier, metrics, limit=args.limit)
+        if skip_unchanged(args, frontier, metrics, changes):
+            metrics.write()
+            return
+        total = min(len(frontier), args.limit or len(frontier))
         
-        print(f"\n⚡ Scraping {len(links)} details...")
-        for i, link in enumerate(links):
-            print(f"   [{i+1}/{len(links)}] {link}")
-            d = scrape_detail(driver, link)
-            if d:
+        print(f"\n⚡ Scraping {total} details... ({frontier.summary()})")
+        for i, link in enumerate(frontier):
+            if args.limit and i >= args.limit: break
+            print(f"   [{i+1}/{total}] {link}")
+            fetch_started = time.monotonic()
+            d = scrape_detail(driver, link, metrics, reducer, dedup)
+            dropped = d is not None and dedup.is_dropped(d.fingerprint)
+            if dropped:
+                metrics.skip(SKIP_DUPLICATE, link)
+                print(f"      = Duplicate skipped -> {d.fingerprint['duplicate_of']}")
+            metrics.page(link, "skipped" if dropped else "ok" if d else "error")
+            if d and not dropped:
                 all_data.append(d)
-                print(f"      ✅ {d['title'][:30]}...")
-            time.sleep(0.5)
+                record(metrics, d.extraction)
+                if stream: stream.emit(d)
+                print(f"      ✅ {d.title[:30]}...")
+            metrics.sleep(0.5, link)
+            frontier.record_fetch(time.monotonic() - fetch_started)
             
     finally:
         driver.quit()
+        if stream: stream.close()
+    
+    if frontier.deadline_hit:
+        print(f"   ⏱️ Deadline reached: {frontier.summary()}")
+    frontier.save_archive(args.seen_archive)
+    dedup.save()
         
-    with open(OUTPUT_FILE, 'w', encoding='utf-8') as f:
-        json.dump(all_data, f, ensure_ascii=False, indent=4)
-    print(f"\nSaved {len(all_data)} to {OUTPUT_FILE}")
+    all_data = carry_over(read_snapshot(OUTPUT_FILE), all_data, frontier)
+    with metrics.span("write"):
+        write_json(output_file, all_data)
+    frontier.save_listing(listing_path(output_file))
+    print(f"\nSaved {len(all_data)} to {output_file}")
+    print(f"   🤖 {format_bypass(metrics.counters)}")
+    if reducer.mode != "off": print(f"   ✂️ {format_reduction(metrics.counters)}")
+    print(f"   🧬 {dedup.summary()}")
+    changes.write(all_data, frontier, complete=not args.limit)
+    metrics.write()
 
 if __name__ == "__main__":
     main()
@@ -1,6 +1,7 @@
 
 import * as fs from 'fs';
 import * as path from 'path';
+import * as readline from 'readline';
 import * as dotenv from 'dotenv';
 import { createClient } from '@supabase/supabase-js';
 import { parseWithGemini } from '../services/geminiParser';
@@ -9,6 +10,8 @@ import { syncEarningAndDiscount } from '../utils/dataFixer';
 import { assignBadge } from '../services/badgeAssigner';
 import { markGenericBrand } from '../utils/genericDetector';
 import { optimizeCampaigns } from '../utils/campaignOptimizer';
+import { generateSectorSlug } from '../utils/slugify';
+import { loadChangeFeed, deltaRecords, deactivateRemoved } from '../utils/changeFeed';
 
 dotenv.config();
 
@@ -19,13 +22,216 @@ const supabase = createClient(
 
 const sleep = (ms: number) => new Promise(resolve => setTimeout(resolve, ms));
 
+// Rule-based extraction report attached by the Python scrapers (src/scrapers/common/confidence.py)
+type Extraction = { confidence: number; ai: 'skip' | 'short' | 'full'; fields?: Record<string, any>;[key: string]: any };
+type RawItem = { url: string; title: string; detail_html?: string; detail_text?: string; description?: string; image?: string; extraction?: Extraction;[key: string]: any };
+
+const SHORT_TEXT_CHARS = 4000;
+// Stream mode checks campaigns against the DB in batches: one optimizeCampaigns round trip per
+// STREAM_BATCH records, or for whatever arrived within STREAM_BATCH_MS of the first pending one.
+const STREAM_BATCH = 25;
+const STREAM_BATCH_MS = 3000;
+const aiStats = { skip: 0, short: 0, full: 0 };
+
+const htmlToText = (html: string) => html.replace(/<[^>]+>/g, ' ').replace(/\s+/g, ' ').trim();
+
+/**
+ * With --trust-extraction, records the scraper marked as `skip` are built from the
+ * deterministic fields without Gemini; `short` records send plain text (no markup, capped)
+ * plus the deterministic fields as metadata. Everything else takes the full AI path.
+ */
+async function parseItem(item: RawItem, bankName: string, cardName: string, trustExtraction: boolean) {
+    const { url, title, detail_html } = item;
+    const extraction = trustExtraction ? item.extraction : undefined;
+
+    if (extraction?.ai === 'skip' && extraction.fields) {
+        aiStats.skip++;
+        console.log(`   ⚡ AI skipped (confidence ${extraction.confidence})`);
+        const fields = extraction.fields;
+        return {
+            ...fields,
+            title,
+            description: item.description || title,
+            eligible_customers: fields.eligible_customers || [cardName],
+            sector_slug: generateSectorSlug(fields.category),
+            ai_enhanced: false
+        };
+    }
+
+    if (extraction?.ai === 'short' && extraction.fields) {
+        aiStats.short++;
+        const text = (item.detail_text || htmlToText(detail_html || item.description || '')).substring(0, SHORT_TEXT_CHARS);
+        return parseWithGemini(`${title}\n${text}`, url, bankName, cardName, { title, ...extraction.fields });
+    }
+
+    aiStats.full++;
+    // Combine title + description/html for best context (reduced text from --detail-text is preferred)
+    return parseWithGemini(`${title}\n${item.detail_text || detail_html || item.description || ''}`, url, bankName, cardName);
+}
+
+async function processItem(item: RawItem, label: string, bankName: string, cardName: string, trustExtraction = false) {
+    const { url, title, image } = item;
+    console.log(`\n[${label}] Processing: ${title}`);
+
+    try {
+        // AI Parsing (or deterministic fields when the scraper is confident enough)
+        const aiResult = await parseItem(item, bankName, cardName, trustExtraction);
+
+        // Merge AI result with existing basic info (priority to AI, but keep raw URL/Image if AI missed it)
+        const campaignData = {
+            ...aiResult,
+            url: url, // Ensure URL is correct
+            reference_url: url,
+            image: aiResult.image || image, // Use AI image if found (rare), else scraper image
+            is_active: true,
+            publish_status: 'processing'
+        };
+
+        // Post-Processing
+        campaignData.bank = bankName;
+        campaignData.card_name = cardName;
+
+        syncEarningAndDiscount(campaignData);
+
+        if (campaignData.min_spend === undefined || campaignData.min_spend === null) {
+            campaignData.min_spend = 0;
+        }
+
+        // ID Lookup
+        const ids = await lookupIDs(
+            campaignData.bank,
+            campaignData.card_name,
+            Array.isArray(campaignData.brand) ? campaignData.brand.join(',') : campaignData.brand,
+            campaignData.sector_slug
+        );
+        Object.assign(campaignData, ids);
+
+        // Badge
+        const badge = assignBadge(campaignData);
+        campaignData.badge_text = badge.text;
+        campaignData.badge_color = badge.color;
+
+        // Generic Brand Check
+        markGenericBrand(campaignData);
+
+        // Upsert
+        const { error } = await supabase
+            .from('campaigns')
+            .upsert(campaignData, { onConflict: 'reference_url' });
+
+        if (error) {
+            console.error(`   ❌ DB Error: ${error.message}`);
+        } else {
+            console.log(`   ✅ Saved: ${campaignData.title}`);
+            if (campaignData.ai_enhanced) {
+                console.log(`      ✨ AI Enhanced (Tokens: ${campaignData.ai_tokens || '?'})`);
+            }
+        }
+
+        // Rate Limit for Gemini (though service handles it, being safe here)
+        if (aiResult.ai_enhanced !== false) await sleep(1000);
+
+    } catch (err: any) {
+        console.error(`   ❌ Error processing item: ${err.message}`);
+    }
+}
+
+function logBypassShare(items: RawItem[]) {
+    const decided = items.filter(i => i.extraction);
+    if (decided.length === 0) return;
+    const wouldSkip = decided.filter(i => i.extraction!.ai === 'skip').length;
+    console.log(`🤖 Scraper confidence: ${wouldSkip}/${decided.length} (${Math.round(100 * wouldSkip / decided.length)}%) could bypass AI` +
+        ` | this run: skipped ${aiStats.skip}, shortened ${aiStats.short}, full ${aiStats.full}`);
+}
+
+/**
+ * Streaming mode: `scraper.py --stdout-ndjson | process_raw_json.ts --stdin-ndjson`
+ * Each campaign is processed as soon as the scraper emits it, so scraping and AI parsing overlap.
+ */
+async function processStdinNdjson(limit: number, trustExtraction: boolean) {
+    const rl = readline.createInterface({ input: process.stdin, crlfDelay: Infinity });
+    let bankName = '';
+    let cardName = '';
+    let received = 0;
+    let processed = 0;
+    const seen: RawItem[] = [];
+    let pending: RawItem[] = [];
+    let pendingSince = 0;
+
+    const flush = async () => {
+        if (pending.length === 0) return;
+        const batch = pending;
+        pending = [];
+        const { urlsToProcess } = await optimizeCampaigns(batch.map(item => item.url), cardName);
+        const wanted = new Set(urlsToProcess);
+        for (const item of batch) {
+            if (processed >= limit) break;
+            if (!wanted.has(item.url)) {
+                console.log(`   ⏭️ Up-to-date: ${item.title}`);
+                continue;
+            }
+            processed++;
+            await processItem(item, `${processed} / stream`, bankName, cardName, trustExtraction);
+        }
+    };
+
+    console.log(`📡 Reading NDJSON stream from stdin...`);
+
+    for await (const line of rl) {
+        const trimmed = line.trim();
+        if (!trimmed) continue;
+        // Stray scraper logs on stdout are passed through instead of breaking the stream
+        if (!trimmed.startsWith('{')) {
+            console.log(`   [scraper] ${trimmed}`);
+            continue;
+        }
+
+        let item: RawItem;
+        try {
+            item = JSON.parse(trimmed);
+        } catch {
+            console.warn(`   ⚠️ Invalid NDJSON line skipped: ${trimmed.substring(0, 80)}`);
+            continue;
+        }
+        received++;
+        seen.push({ url: item.url, title: item.title, extraction: item.extraction });
+        if (!item.url || processed >= limit) continue;
+
+        if (!bankName) {
+            bankName = item.bank || item.provider || 'Unknown Bank';
+            cardName = item.card || item.card_name || 'Unknown Card';
+            console.log(`💳 Bank: ${bankName}, Card: ${cardName}`);
+        }
+
+        if (pending.length === 0) pendingSince = Date.now();
+        pending.push(item);
+        if (pending.length >= STREAM_BATCH || Date.now() - pendingSince >= STREAM_BATCH_MS) await flush();
+    }
+    await flush();
+
+    console.log(`\n🏁 Stream import completed. Received ${received}, processed ${processed}.`);
+    logBypassShare(seen);
+}
+
 async function main() {
     const args = process.argv.slice(2);
+    const streamMode = args.includes('--stdin-ndjson');
+    const trustExtraction = args.includes('--trust-extraction');
+    const changesOnly = args.includes('--changes');
     const fileArg = args.find(arg => arg.endsWith('.json') || !arg.startsWith('--'));
     const limitArg = args.find(arg => arg.startsWith('--limit='));
 
+    // Limits
+    let limit = limitArg ? parseInt(limitArg.split('=')[1]) : 9999;
+
+    if (streamMode) {
+        await processStdinNdjson(limit, trustExtraction);
+        return;
+    }
+
     if (!fileArg) {
-        console.error("❌ Usage: npx tsx src/scripts/process_raw_json.ts <file.json> [--limit=N]");
+        console.error("❌ Usage: npx tsx src/scripts/process_raw_json.ts <file.json> [--limit=N] [--trust-extraction] [--changes]");
+        console.error("   or:   <scraper> --stdout-ndjson | npx tsx src/scripts/process_raw_json.ts --stdin-ndjson [--limit=N] [--trust-extraction]");
         process.exit(1);
     }
 
@@ -43,22 +249,28 @@ async function main() {
         return;
     }
 
-    // Assumptions: rawData items have { url, bank, card, title, detail_html (or description/html) }
+    // Assumptions: rawData items have { url, bank, card, title, detail_html/detail_text (or description/html) }
     const sample = rawData[0];
     const bankName = sample.bank || sample.provider || 'Unknown Bank';
     const cardName = sample.card || sample.card_name || 'Unknown Card';
 
     console.log(`💳 Bank: ${bankName}, Card: ${cardName}`);
 
-    // 1. Optimize: Filter out existing/complete campaigns
-    const allUrls = rawData.map((d: any) => d.url).filter(u => !!u);
-    const { urlsToProcess } = await optimizeCampaigns(allUrls, cardName);
-
-    // Limits
-    let limit = limitArg ? parseInt(limitArg.split('=')[1]) : 9999;
-
-    // Filter rawData to keep only those in urlsToProcess
-    const toProcess = rawData.filter((d: any) => urlsToProcess.includes(d.url)).slice(0, limit);
+    let toProcess: RawItem[];
+    if (changesOnly) {
+        // --changes: only new/modified campaigns from <file>.changes.json; removed ones are deactivated
+        const feed = loadChangeFeed(filePath);
+        if (!feed) process.exit(1);
+        await deactivateRemoved(feed, cardName);
+        toProcess = deltaRecords(feed).slice(0, limit);
+    } else {
+        // 1. Optimize: Filter out existing/complete campaigns
+        const allUrls = rawData.map((d: any) => d.url).filter(u => !!u);
+        const { urlsToProcess } = await optimizeCampaigns(allUrls, cardName);
+
+        // Filter rawData to keep only those in urlsToProcess
+        toProcess = rawData.filter((d: any) => urlsToProcess.includes(d.url)).slice(0, limit);
+    }
 
     if (toProcess.length === 0) {
         console.log("✅ All campaigns are already up-to-date. No action needed.");
@@ -68,76 +280,11 @@ async function main() {
     console.log(`🚀 Starting AI processing for ${toProcess.length} campaigns...`);
 
     for (const [index, item] of toProcess.entries()) {
-        const { url, title, detail_html, image } = item;
-        console.log(`\n[${index + 1}/${toProcess.length}] Processing: ${title}`);
-
-        try {
-            // AI Parsing
-            // Combine title + description/html for best context
-            const contentToParse = `${title}\n${detail_html || item.description || ''}`;
-
-            const aiResult = await parseWithGemini(contentToParse, url, bankName, cardName);
-
-            // Merge AI result with existing basic info (priority to AI, but keep raw URL/Image if AI missed it)
-            const campaignData = {
-                ...aiResult,
-                url: url, // Ensure URL is correct
-                reference_url: url,
-                image: aiResult.image || image, // Use AI image if found (rare), else scraper image
-                is_active: true,
-                publish_status: 'processing'
-            };
-
-            // Post-Processing
-            campaignData.bank = bankName;
-            campaignData.card_name = cardName;
-
-            syncEarningAndDiscount(campaignData);
-
-            if (campaignData.min_spend === undefined || campaignData.min_spend === null) {
-                campaignData.min_spend = 0;
-            }
-
-            // ID Lookup
-            const ids = await lookupIDs(
-                campaignData.bank,
-                campaignData.card_name,
-                Array.isArray(campaignData.brand) ? campaignData.brand.join(',') : campaignData.brand,
-                campaignData.sector_slug
-            );
-            Object.assign(campaignData, ids);
-
-            // Badge
-            const badge = assignBadge(campaignData);
-            campaignData.badge_text = badge.text;
-            campaignData.badge_color = badge.color;
-
-            // Generic Brand Check
-            markGenericBrand(campaignData);
-
-            // Upsert
-            const { error } = await supabase
-                .from('campaigns')
-                .upsert(campaignData, { onConflict: 'reference_url' });
-
-            if (error) {
-                console.error(`   ❌ DB Error: ${error.message}`);
-            } else {
-                console.log(`   ✅ Saved: ${campaignData.title}`);
-                if (campaignData.ai_enhanced) {
-                    console.log(`      ✨ AI Enhanced (Tokens: ${campaignData.ai_tokens || '?'})`);
-                }
-            }
-
-            // Rate Limit for Gemini (though service handles it, being safe here)
-            await sleep(1000);
-
-        } catch (err: any) {
-            console.error(`   ❌ Error processing item: ${err.message}`);
-        }
+        await processItem(item, `${index + 1}/${toProcess.length}`, bankName, cardName, trustExtraction);
     }
 
     console.log("\n🏁 Import completed.");
+    logBypassShare(rawData);
 }
 
 main().catch(console.error);
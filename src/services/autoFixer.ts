@@ -9,18 +9,20 @@ import { syncEarningAndDiscount } from '../utils/dataFixer';
 import { parseWithGemini, parseSurgical } from './geminiParser';
 import { assignBadge } from './badgeAssigner';
 import { CampaignValidation } from './qualityChecker';
+import { extractForCampaigns, ExtractionResult } from '../utils/extractionService';
 
 export interface FixResult {
     campaignId: number;
     success: boolean;
-    method: 'badge_reassign' | 'ai_reparse' | 'ai_correction' | 'skip';
+    method: 'badge_reassign' | 'rule_fill' | 'ai_reparse' | 'ai_correction' | 'skip';
     message: string;
     newScore?: number;
 }
 
 export async function autoFixCampaign(
     campaign: any,
-    validation: CampaignValidation
+    validation: CampaignValidation,
+    rule?: ExtractionResult
 ): Promise<FixResult> {
 
     // Determine fix strategy based on issues
@@ -36,6 +38,12 @@ export async function autoFixCampaign(
         return await fixBadge(campaign);
     }
 
+    // Strategy 1b: Rule-Based Fill (extraction service, no API call) when it covers every missing field
+    if (rule) {
+        const result = await fillFromRules(campaign, validation, rule);
+        if (result) return result;
+    }
+
     // AI strategies check (allow by default unless specifically disabled)
     const AI_DISABLED = process.env.DISABLE_AI_AUTOFIX === 'true';
     if (AI_DISABLED) {
@@ -104,6 +112,47 @@ async function fixBadge(campaign: any): Promise<FixResult> {
     }
 }
 
+const isEmpty = (value: any) => value === null || value === undefined ||
+    (typeof value === 'string' && value.trim() === '') || (Array.isArray(value) && value.length === 0);
+
+/** Fills missing fields from confident rule-based extraction; null when it cannot fill all of them. */
+async function fillFromRules(campaign: any, validation: CampaignValidation, rule: ExtractionResult): Promise<FixResult | null> {
+    if (!rule.fields || !rule.extraction || rule.extraction.ai === 'full') return null;
+    // badge_text is reassigned below from the filled fields
+    const missing = validation.issues.filter(i => i.issue.includes('Missing') && i.field !== 'badge_text').map(i => i.field);
+    const fill: Record<string, any> = {};
+    for (const field of missing) {
+        if (isEmpty(campaign[field]) && !isEmpty(rule.fields[field])) fill[field] = rule.fields[field];
+    }
+    if (missing.length === 0 || Object.keys(fill).length < missing.length) return null;
+
+    try {
+        console.log(`   Strategy: Rule-Based Fill (confidence ${rule.extraction.confidence}): ${Object.keys(fill).join(', ')}`);
+        if (fill.category) fill.sector_slug = generateSectorSlug(fill.category);
+        const badge = assignBadge({ ...campaign, ...fill });
+        const updatedData = { ...fill, badge_text: badge.text, badge_color: badge.color };
+        syncEarningAndDiscount(updatedData);
+
+        const { error } = await supabase
+            .from('campaigns')
+            .update(updatedData)
+            .eq('id', campaign.id);
+
+        if (error) throw error;
+
+        console.log(`   ✅ Filled from rules without AI`);
+        return {
+            campaignId: campaign.id,
+            success: true,
+            method: 'rule_fill',
+            message: `Filled from rule-based extraction: ${Object.keys(fill).join(', ')}`
+        };
+    } catch (error: any) {
+        console.error(`   ❌ Rule-based fill failed: ${error.message}`);
+        return null;
+    }
+}
+
 async function aiReparse(campaign: any): Promise<FixResult> {
     try {
         console.log('   Strategy: AI Re-Parse (Full)');
@@ -256,15 +305,22 @@ export async function batchFixCampaigns(
 
     console.log(`\n🔧 Batch fixing ${needsFix.length} campaigns...`);
 
+    // Rule-based fields for the whole batch in one call; empty when the extraction service is down
+    const rules = await extractForCampaigns(
+        needsFix.map(v => campaigns.find(c => c.id === v.campaignId)).filter(Boolean)
+    );
+
     for (const validation of needsFix) {
         const campaign = campaigns.find(c => c.id === validation.campaignId);
         if (!campaign) continue;
 
-        const result = await autoFixCampaign(campaign, validation);
+        const result = await autoFixCampaign(campaign, validation, rules.get(String(campaign.id)));
         results.push(result);
 
-        // Rate limiting
-        await new Promise(resolve => setTimeout(resolve, delayMs));
+        // Rate limiting (API strategies only)
+        if (result.method === 'ai_reparse' || result.method === 'ai_correction') {
+            await new Promise(resolve => setTimeout(resolve, delayMs));
+        }
     }
 
     return results;
@@ -0,0 +1,61 @@
+import * as fs from 'fs';
+import { supabase } from './supabase';
+
+/**
+ * Run-to-run change feed written by the Python scrapers (src/scrapers/common/changes.py)
+ * next to their output: `<output>.changes.json`.
+ */
+export type ChangeFeed = {
+    bank: string | null;
+    generated_at: string;
+    summary: { added: number; modified: number; removed: number; unchanged: number; unfetched: number; removals_checked: boolean };
+    added: any[];
+    modified: { url: string; previous_url?: string; changes: Record<string, any>; record: any }[];
+    removed: { url: string; title: string | null; valid_until: string | null; reason: 'expired' | 'disappeared' }[];
+};
+
+export function changeFeedPath(outputPath: string): string {
+    return outputPath.replace(/\.json$/, '') + '.changes.json';
+}
+
+export function loadChangeFeed(outputPath: string): ChangeFeed | null {
+    const feedPath = changeFeedPath(outputPath);
+    if (!fs.existsSync(feedPath)) {
+        console.warn(`⚠️ Change feed not found: ${feedPath}`);
+        return null;
+    }
+    const feed: ChangeFeed = JSON.parse(fs.readFileSync(feedPath, 'utf-8'));
+    const s = feed.summary;
+    console.log(`🔁 Change feed: +${s.added} new, ~${s.modified} modified, -${s.removed} removed, ${s.unchanged} unchanged`);
+    return feed;
+}
+
+/** Records to (re)process: new campaigns first, then modified ones. */
+export function deltaRecords(feed: ChangeFeed): any[] {
+    return [...feed.added, ...feed.modified.map(m => m.record)];
+}
+
+/**
+ * Deactivates removed campaigns without fetching their pages; moved campaigns
+ * (slug change) are deactivated under their previous URL.
+ */
+export async function deactivateRemoved(feed: ChangeFeed, cardName: string): Promise<number> {
+    const urls = [
+        ...feed.removed.map(r => r.url),
+        ...feed.modified.filter(m => m.previous_url).map(m => m.previous_url!)
+    ];
+    if (urls.length === 0) return 0;
+
+    const { error } = await supabase
+        .from('campaigns')
+        .update({ is_active: false })
+        .eq('card_name', cardName)
+        .in('reference_url', urls);
+
+    if (error) {
+        console.error(`   ❌ Deactivate Error: ${error.message}`);
+        return 0;
+    }
+    console.log(`   🗑️ Deactivated ${urls.length} removed campaigns`);
+    return urls.length;
+}
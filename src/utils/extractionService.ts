@@ -0,0 +1,131 @@
+import * as http from 'http';
+
+/**
+ * Client for the persistent Python extraction service (src/scrapers/common/extract_service.py):
+ *
+ *   python3 src/scrapers/scrape.py serve                      # http://127.0.0.1:8765
+ *   python3 src/scrapers/scrape.py serve --socket /tmp/x.sock # EXTRACTION_SERVICE=unix:/tmp/x.sock
+ *
+ * Requests go over one keep-alive agent and are split into batches of `batchSize` documents,
+ * so thousands of campaigns cost a handful of round trips and no Python start-up.
+ * Used by reprocessCampaigns.ts and the quality pipeline (services/autoFixer.ts) via
+ * `extractForCampaigns`, which falls back to an empty result when the service is down.
+ */
+const SERVICE = process.env.EXTRACTION_SERVICE || 'http://127.0.0.1:8765';
+const DEFAULT_BATCH = 500;
+const TIMEOUT_MS = 60_000;
+
+export type ExtractionFamily = 'maximum' | 'vakifbank' | 'paraf';
+
+/** `family` or `bank` selects the extractors; text is read from text / conditions / detail_text / description. */
+export type ExtractionDoc = {
+    id?: string;
+    url?: string;
+    title: string;
+    text?: string;
+    conditions?: string[];
+    detail_text?: string;
+    description?: string;
+    date_text?: string;
+    bank?: string;
+    family?: ExtractionFamily;
+};
+
+export type ExtractionResult = {
+    id: string | null;
+    family?: ExtractionFamily;
+    fields?: Record<string, any>;
+    extraction?: { confidence: number; ai: 'skip' | 'short' | 'full';[key: string]: any };
+    error?: string;
+};
+
+const agent = new http.Agent({ keepAlive: true, maxSockets: 4 });
+
+function target(path: string): http.RequestOptions {
+    if (SERVICE.startsWith('unix:')) return { socketPath: SERVICE.slice('unix:'.length), path, agent };
+    const url = new URL(SERVICE);
+    return { host: url.hostname, port: url.port || 80, path, agent };
+}
+
+function request(method: 'GET' | 'POST', path: string, body?: any, timeoutMs = TIMEOUT_MS): Promise<any> {
+    const payload = body === undefined ? undefined : Buffer.from(JSON.stringify(body));
+    return new Promise((resolve, reject) => {
+        const req = http.request({
+            ...target(path),
+            method,
+            headers: payload ? { 'Content-Type': 'application/json', 'Content-Length': payload.length } : {}
+        }, res => {
+            const chunks: Buffer[] = [];
+            res.on('data', chunk => chunks.push(chunk));
+            res.on('end', () => {
+                const text = Buffer.concat(chunks).toString('utf-8');
+                if ((res.statusCode || 500) >= 300) return reject(new Error(`Extraction service HTTP ${res.statusCode}: ${text.slice(0, 200)}`));
+                try { resolve(JSON.parse(text)); } catch (err) { reject(err); }
+            });
+        });
+        req.setTimeout(timeoutMs, () => req.destroy(new Error(`Extraction service timeout (${SERVICE})`)));
+        req.on('error', reject);
+        if (payload) req.write(payload);
+        req.end();
+    });
+}
+
+/** True when the service answers /health; callers fall back to their own logic otherwise. */
+export async function extractionServiceAvailable(): Promise<boolean> {
+    try {
+        return (await request('GET', '/health', undefined, 2000)).ok === true;
+    } catch {
+        return false;
+    }
+}
+
+/** Extracts fields for `docs` in batches; results keep the input order. */
+export async function extractFields(
+    docs: ExtractionDoc[],
+    options: { family?: ExtractionFamily; confidence?: boolean; batchSize?: number } = {}
+): Promise<ExtractionResult[]> {
+    const batchSize = options.batchSize || DEFAULT_BATCH;
+    const results: ExtractionResult[] = [];
+    for (let i = 0; i < docs.length; i += batchSize) {
+        const response = await request('POST', '/extract', {
+            docs: docs.slice(i, i + batchSize),
+            family: options.family,
+            confidence: options.confidence || false
+        });
+        results.push(...response.results);
+    }
+    return results;
+}
+
+/** Document for a `campaigns` row: title plus stored conditions / description; the bank selects the family. */
+export function campaignDoc(campaign: any): ExtractionDoc {
+    const conditions = Array.isArray(campaign.conditions) ? campaign.conditions.filter((c: any) => typeof c === 'string') : undefined;
+    return {
+        id: String(campaign.id),
+        url: campaign.url || campaign.reference_url,
+        title: campaign.title || '',
+        conditions: conditions && conditions.length ? conditions : undefined,
+        description: campaign.description || undefined,
+        bank: campaign.bank || undefined
+    };
+}
+
+/**
+ * Rule-based fields and confidence for stored campaigns, keyed by campaign id. Returns an empty map
+ * when the service is not running or the request fails, so callers keep their own (AI) path.
+ * Campaigns without text or from banks without an extractor family are left out.
+ */
+export async function extractForCampaigns(campaigns: any[]): Promise<Map<string, ExtractionResult>> {
+    const results = new Map<string, ExtractionResult>();
+    const docs = campaigns.map(campaignDoc).filter(doc => doc.conditions || doc.description);
+    if (docs.length === 0 || !(await extractionServiceAvailable())) return results;
+    try {
+        for (const result of await extractFields(docs, { confidence: true })) {
+            if (result.id && result.fields && !result.error) results.set(result.id, result);
+        }
+        console.log(`🧩 Extraction service: rule-based fields for ${results.size}/${campaigns.length} campaigns`);
+    } catch (err: any) {
+        console.warn(`⚠️ Extraction service failed, continuing without it: ${err.message}`);
+    }
+    return results;
+}